@@ -1,33 +1,47 @@
 #!/usr/bin/env python3
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, session
+from flask import Flask, Response, abort, g as flask_g, render_template, request, jsonify, send_file, redirect, session
 from werkzeug.utils import secure_filename
 import json
+import logging
+import math
+from abc import ABCMeta, abstractmethod
 import os
-import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
 import ast
+import atexit
+import functools
 import base64
 import uuid
 import threading
 import time
 import chardet
 import unicodedata
-from datetime import datetime, timedelta
+from datetime import date, datetime
 from typing import Dict, List, Optional, Any, Tuple
 import csv
 import io
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields as dataclass_fields
 from pathlib import Path
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
 from rdflib import Graph, Literal, Namespace, URIRef, BNode
-from rdflib.namespace import RDF, XSD, SH, OWL, RDFS, DCTERMS
+from rdflib.collection import Collection
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF, XSD, SH, OWL, RDFS, DCTERMS, QB
+
+PAV = Namespace("http://purl.org/pav/")
+SCHEMA = Namespace("https://schema.org/")
 
 # Import export and import modules
 try:
     from .exports import generate_full_ttl, export_ttl_content
     from .imports import (
-        import_ttl_file, parse_ttl_to_nodes, process_csv_ttl_import, csv_to_ttl,
+        import_ttl_file, load_turtle_graph, parse_ttl_to_nodes, process_csv_ttl_import, csv_to_ttl,
         import_excel_file, get_excel_sheet_names,
         import_geojson_file, import_geojson_structure, infer_geojson_datatype,
         import_xsd_file
@@ -35,12 +49,92 @@ try:
 except ImportError:
     from exports import generate_full_ttl, export_ttl_content
     from imports import (
-        import_ttl_file, parse_ttl_to_nodes, process_csv_ttl_import, csv_to_ttl,
+        import_ttl_file, load_turtle_graph, parse_ttl_to_nodes, process_csv_ttl_import, csv_to_ttl,
         import_excel_file, get_excel_sheet_names,
         import_geojson_file, import_geojson_structure, infer_geojson_datatype,
         import_xsd_file
     )
 
+# Use orjson for project (de)serialization when available, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional binary project format (/api/project/save?format=msgpack)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Optional Oxigraph store for export graphs, opt-in via TTL_EXPORT_STORE=oxigraph
+# (only enabled once a sample export matches the default store, see below)
+try:
+    import oxrdflib
+except ImportError:
+    oxrdflib = None
+_EXPORT_GRAPH_STORE = "default"
+
+# Buffer size for project file reads/writes
+_PROJECT_IO_BUFFER = 1 << 20
+
+
+def _json_default(obj):
+    """Encode sets as lists and model objects through their to_dict()"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj, indent=False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+
+def _json_loads(data):
+    """Deserialize JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Language preference when a single text is taken from a multilingual dict
+_PRIMARY_LANGS = ('de', 'en', 'fr', 'it')
+_LANG_FALLBACK = _PRIMARY_LANGS + ('rm',)
+# Languages written to SHACL output
+_SUPPORTED_LANGS = frozenset(_PRIMARY_LANGS)
+# Languages kept when reading multilingual I14Y texts
+_ALL_LANGS = frozenset(_LANG_FALLBACK)
+
+
+def _pick_lang(value, default='', langs=_LANG_FALLBACK):
+    """Return the first non-empty text of a multilingual dict in language preference order"""
+    if not isinstance(value, dict):
+        return default
+    return next((value[lang] for lang in langs if value.get(lang)), default)
+
+
+# Random bytes for node IDs are drawn from a shared os.urandom() buffer
+# instead of one urandom call per ID
+_UUID_POOL_SIZE = 4096
+_uuid_pool = bytearray()
+_uuid_pool_lock = threading.Lock()
+
+
+def fast_uuid() -> str:
+    """Return a random (version 4) UUID string, like str(uuid.uuid4())"""
+    global _uuid_pool
+    with _uuid_pool_lock:
+        if len(_uuid_pool) < 16:
+            _uuid_pool = bytearray(os.urandom(_UUID_POOL_SIZE))
+        raw = bytes(_uuid_pool[-16:])
+        del _uuid_pool[-16:]
+    return str(uuid.UUID(bytes=raw, version=4))
+
 # Import XSD importer using relative imports if possible
 try:
     from .xsd_importer import xsd_to_ttl
@@ -52,60 +146,81 @@ class SessionManager:
     
     def __init__(self, session_timeout_hours=2, cleanup_interval_minutes=30):
         self.sessions = {}  # session_id -> FlaskSHACLGraphEditor
-        self.session_timestamps = {}  # session_id -> last_activity_time
-        self.session_timeout = timedelta(hours=session_timeout_hours)
+        # session_id -> time.monotonic() of the last activity, least recently active first
+        self.session_timestamps = {}
+        self.session_timeout = session_timeout_hours * 3600  # Convert to seconds
         self.cleanup_interval = cleanup_interval_minutes * 60  # Convert to seconds
         self.lock = threading.RLock()
+        self._stop = threading.Event()
         self.cleanup_thread = None
         self.start_cleanup_thread()
+        atexit.register(self.close)
     
     def start_cleanup_thread(self):
         """Start the automatic cleanup thread"""
         if self.cleanup_thread is None or not self.cleanup_thread.is_alive():
+            self._stop.clear()
             self.cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
             self.cleanup_thread.start()
     
+    def close(self):
+        """Stop the cleanup thread and wait for it to finish"""
+        self._stop.set()
+        if self.cleanup_thread is not None:
+            self.cleanup_thread.join(timeout=5)
+    
     def _cleanup_loop(self):
         """Background thread that periodically cleans up expired sessions"""
-        while True:
+        while not self._stop.wait(self.cleanup_interval):
             try:
-                time.sleep(self.cleanup_interval)
                 self.cleanup_expired_sessions()
             except Exception as e:
                 pass
     
     def cleanup_expired_sessions(self):
         """Remove sessions that haven't been active for too long"""
-        now = datetime.now()
+        if not self.session_timestamps:
+            return
+        
+        cutoff = time.monotonic() - self.session_timeout
         expired_sessions = []
         
         with self.lock:
+            # Timestamps are kept in activity order, so only the expired
+            # sessions at the front need to be looked at
             for session_id, last_activity in self.session_timestamps.items():
-                if now - last_activity > self.session_timeout:
-                    expired_sessions.append(session_id)
+                if last_activity >= cutoff:
+                    break
+                expired_sessions.append(session_id)
             
             for session_id in expired_sessions:
                 if session_id in self.sessions:
-                    print(f"Cleaning up expired session: {session_id}")
+                    app.logger.debug("Cleaning up expired session: %s", session_id)
                     del self.sessions[session_id]
                     del self.session_timestamps[session_id]
         
         if expired_sessions:
-            print(f"Cleaned up {len(expired_sessions)} expired sessions")
+            app.logger.debug("Cleaned up %s expired sessions", len(expired_sessions))
     
-    def get_editor_for_session(self, session_id):
-        """Get or create an editor for the given session"""
+    def get_editor_for_session(self, session_id, factory=None):
+        """Get the editor for the given session, creating it with factory() if it has none yet"""
         with self.lock:
-            # Update activity timestamp
-            self.session_timestamps[session_id] = datetime.now()
-            
-            # Get or create editor for this session
-            if session_id not in self.sessions:
-                print(f"Creating new editor for session: {session_id}")
-                # Create FlaskSHACLGraphEditor instance - class will be defined later
-                self.sessions[session_id] = None  # Will be set when class is available
-            
-            return self.sessions[session_id]
+            # Update activity timestamp (re-inserted to move the session to the end)
+            self.session_timestamps.pop(session_id, None)
+            self.session_timestamps[session_id] = time.monotonic()
+            editor = self.sessions.get(session_id)
+        
+        if editor is None and factory is not None:
+            # Built outside the lock so other sessions are not held up; if a
+            # concurrent request for the same session got there first, use its editor
+            new_editor = factory()
+            with self.lock:
+                editor = self.sessions.setdefault(session_id, new_editor)
+                self.session_timestamps.setdefault(session_id, time.monotonic())
+            if editor is new_editor:
+                app.logger.debug("Created new editor for session: %s", session_id)
+        
+        return editor
 
 def sort_enumeration_values(values: List[str]) -> List[str]:
     """Sort enumeration values numerically if all are numbers, otherwise alphabetically.
@@ -130,11 +245,294 @@ def sort_enumeration_values(values: List[str]) -> List[str]:
         return sorted(values)
 
 
+class TTLCache:
+    """
+    Thread-safe, process-wide cache for I14Y lookups keyed by concept/dataset ID
+    
+    Used as a decorator on I14YAPIClient methods taking a single ID argument.
+    Found results are kept for ttl seconds; None (not found or failed) results
+    only for miss_ttl seconds, or not at all if miss_ttl is None.
+    
+    Concurrent misses for the same key are coalesced: the first caller fetches
+    and the others wait for its result instead of repeating the request.
+    """
+    
+    def __init__(self, ttl, maxsize=4096, miss_ttl=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.miss_ttl = miss_ttl
+        self._entries = {}  # key -> (expiry time, value), oldest first
+        self._inflight = {}  # key -> Future of the fetch currently running
+        self._lock = threading.RLock()
+    
+    def __call__(self, method):
+        @functools.wraps(method)
+        def wrapper(client, key):
+            now = time.monotonic()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+                pending = self._inflight.get(key)
+                if pending is None:
+                    future = self._inflight[key] = Future()
+            
+            if pending is not None:
+                return pending.result()
+            
+            try:
+                value = method(client, key)
+            except BaseException as e:
+                with self._lock:
+                    del self._inflight[key]
+                future.set_exception(e)
+                raise
+            
+            ttl = self.ttl if value is not None else self.miss_ttl
+            with self._lock:
+                if ttl:
+                    self._entries.pop(key, None)
+                    if len(self._entries) >= self.maxsize:
+                        self._evict(now)
+                    self._entries[key] = (now + ttl, value)
+                del self._inflight[key]
+            future.set_result(value)
+            return value
+        
+        wrapper.cache = self
+        return wrapper
+    
+    def _evict(self, now):
+        """Drop expired entries, then the oldest ones if the cache is still full"""
+        for key in [key for key, (expiry, _) in self._entries.items() if expiry <= now]:
+            del self._entries[key]
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+
+# I14Y lookups are shared by all sessions; codelist misses are remembered
+# briefly so concepts without a codelist do not hit the API on every use
+_concept_cache = TTLCache(ttl=900)
+_codelist_cache = TTLCache(ttl=900, miss_ttl=60)
+_dataset_cache = TTLCache(ttl=900)
+_public_dataset_cache = TTLCache(ttl=900)
+
+
+# Keys under which codelist exports wrap their entries, in order of preference
+_CODELIST_ENTRY_KEYS = ('entries', 'items', 'data', 'codelistEntries')
+# Fields identifying an unwrapped export as a single codelist entry
+_CODELIST_ENTRY_FIELDS = ('code', 'value', 'identifier')
+
+
+def _default_to_utf8(response, *args, **kwargs):
+    """Decode I14Y responses without a declared charset as UTF-8
+    
+    Otherwise response.text falls back to guessing the encoding from the
+    body, which is slow on large payloads; the I14Y APIs always send UTF-8.
+    """
+    if 'charset=' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = 'utf-8'
+    return response
+
+
+class I14YUnavailableError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to an I14Y host that keeps failing"""
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker for the I14Y APIs
+    
+    After fail_max consecutive connection failures or 5xx responses from a
+    host, requests to it fail immediately with I14YUnavailableError for
+    reset_timeout seconds instead of each waiting for its own timeout.
+    Then a single trial request is let through while the others keep failing
+    fast; its success closes the circuit, a failure reopens it.
+    """
+    
+    def __init__(self, fail_max=5, reset_timeout=30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = {}  # host -> consecutive failure count
+        self._open_until = {}  # host -> time.monotonic() until which requests are refused
+        self._trials = set()  # hosts with a trial request in flight
+        self._lock = threading.Lock()
+    
+    def check(self, host):
+        """Raise I14YUnavailableError if the circuit for host is open
+        
+        Once reset_timeout has passed the first caller is let through as the
+        trial request and must report back via record_success, record_failure
+        or release.
+        """
+        if host not in self._open_until:
+            return
+        with self._lock:
+            open_until = self._open_until.get(host)
+            if open_until is None:
+                return
+            if open_until > time.monotonic() or host in self._trials:
+                raise I14YUnavailableError(f"{host} is unavailable, not retrying for now")
+            self._trials.add(host)
+    
+    def record_success(self, host):
+        if self._failures.get(host) or host in self._open_until:
+            with self._lock:
+                self._failures.pop(host, None)
+                self._open_until.pop(host, None)
+                self._trials.discard(host)
+    
+    def record_failure(self, host):
+        with self._lock:
+            failures = self._failures[host] = self._failures.get(host, 0) + 1
+            self._trials.discard(host)
+            if failures >= self.fail_max:
+                if host not in self._open_until:
+                    app.logger.warning("%s failed %s times in a row, pausing requests for %ss",
+                                       host, failures, self.reset_timeout)
+                self._open_until[host] = time.monotonic() + self.reset_timeout
+    
+    def release(self, host):
+        """End a trial request that neither succeeded nor failed at the HTTP level"""
+        if host in self._trials:
+            with self._lock:
+                self._trials.discard(host)
+
+
+class I14YSession(requests.Session):
+    """requests.Session that short-circuits calls to failing hosts"""
+    
+    def __init__(self, breaker):
+        super().__init__()
+        self.breaker = breaker
+    
+    def request(self, method, url, *args, **kwargs):
+        host = urlsplit(url).netloc
+        self.breaker.check(host)
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            self.breaker.record_failure(host)
+            raise
+        except BaseException:
+            self.breaker.release(host)
+            raise
+        if response.status_code >= 500:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        return response
+
+
+def _create_http_session() -> requests.Session:
+    """HTTP session with pooled keep-alive connections for the I14Y APIs
+    
+    Idempotent requests are retried on gateway errors; any request at most
+    once when the connection could not be established. Read timeouts are not
+    retried, so an unresponsive host costs one timeout per call. Hosts that
+    keep failing are skipped for a while (see CircuitBreaker).
+    """
+    http = I14YSession(CircuitBreaker())
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, connect=1, read=0, status=3, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504], raise_on_status=False),
+    )
+    http.mount('https://', adapter)
+    http.hooks['response'].append(_default_to_utf8)
+    return http
+
+
+# Shared by all I14YAPIClient instances so connections are reused across sessions
+_i14y_http = _create_http_session()
+# Worker threads for independent I14Y lookups (see get_many_concept_details)
+_i14y_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='i14y')
+
+# Details and codelists of the top search results are fetched into the caches
+# in the background (I14Y_PREFETCH=0 disables this); at most
+# _PREFETCH_MAX_PENDING lookups are queued so searches cannot flood the API
+_I14Y_PREFETCH = os.environ.get('I14Y_PREFETCH', '1') != '0'
+_PREFETCH_TOP_N = 10
+_PREFETCH_MAX_PENDING = 40
+_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='i14y-prefetch')
+_prefetch_slots = threading.BoundedSemaphore(_PREFETCH_MAX_PENDING)
+
+
+
+def _keyword_re(*words):
+    """Regex matching any of the words as a substring (same as `word in text`)"""
+    return re.compile('|'.join(map(re.escape, words)))
+
+
+# Datatype hints looked for in concept titles and descriptions (in de/en/fr/it)
+_DATE_HINT_RE = _keyword_re('date', 'datum', 'birth', 'geburt', 'naissance', 'nascita')
+_TIME_HINT_RE = _keyword_re('time', 'zeit', 'heure', 'ora')
+_NUMBER_HINT_RE = _keyword_re('number', 'nummer', 'numéro', 'numero', 'age', 'alter', 'âge', 'età', 'count', 'anzahl')
+_BOOLEAN_HINT_RE = _keyword_re('yes', 'no', 'ja', 'nein', 'oui', 'non', 'sì', 'boolean')
+_URI_HINT_RE = _keyword_re('url', 'uri', 'link', 'website', 'webpage')
+# Hints used for concept titles in SHACLNode._determine_datatype
+_YEAR_HINT_RE = _keyword_re('year', 'jahr', 'année', 'anno')
+_CONCEPT_NUMBER_HINT_RE = _keyword_re('number', 'nummer', 'numéro', 'numero', 'age', 'alter', 'âge', 'età')
+_CONCEPT_BOOLEAN_HINT_RE = _keyword_re('over', 'älter', 'plus', 'superiore', 'boolean')
+
+
+# I14Y only uses a handful of datatype and conceptValueType names, so the
+# substring checks below are cached per (lowercased) name
+@functools.lru_cache(maxsize=256)
+def _datatype_from_type_name(datatype: str) -> Optional[str]:
+    """Map the (lowercased) datatype field of an I14Y concept to an XSD datatype"""
+    if 'string' in datatype or 'text' in datatype:
+        return 'xsd:string'
+    elif 'int' in datatype or 'number' in datatype:
+        return 'xsd:decimal'
+    elif 'date' in datatype:
+        return 'xsd:date'
+    elif 'boolean' in datatype or 'bool' in datatype:
+        return 'xsd:boolean'
+    elif 'decimal' in datatype or 'float' in datatype:
+        return 'xsd:decimal'
+    elif 'uri' in datatype or 'url' in datatype:
+        return 'xsd:anyURI'
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _datatype_from_value_type(concept_type: str) -> Optional[str]:
+    """Map the (lowercased) conceptValueType of an I14Y concept to an XSD datatype"""
+    if 'date' in concept_type:
+        return 'xsd:dateTime' if 'time' in concept_type else 'xsd:date'
+    elif 'number' in concept_type or 'integer' in concept_type or 'numeric' in concept_type:
+        return 'xsd:decimal'
+    elif 'boolean' in concept_type or 'bool' in concept_type:
+        return 'xsd:boolean'
+    elif 'string' in concept_type or 'text' in concept_type:
+        return 'xsd:string'
+    elif 'uri' in concept_type or 'url' in concept_type:
+        return 'xsd:anyURI'
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
+def _datatype_from_text(text: str) -> Optional[str]:
+    """Guess an XSD datatype from the (lowercased) title and description of a concept"""
+    if _DATE_HINT_RE.search(text):
+        return 'xsd:dateTime' if _TIME_HINT_RE.search(text) else 'xsd:date'
+    if _NUMBER_HINT_RE.search(text):
+        return 'xsd:decimal'
+    if _BOOLEAN_HINT_RE.search(text):
+        return 'xsd:boolean'
+    if _URI_HINT_RE.search(text):
+        return 'xsd:anyURI'
+    return None
+
+
 class I14YAPIClient:
     """Client for interacting with I14Y API"""
     
     def __init__(self):
         self.base_url = "https://core.i14y.c.bfs.admin.ch/api"
+        self.session = _i14y_http
         
     def search_concepts(self, query='', page=1, page_size=20):
         """Search for concepts using the I14Y API
@@ -147,7 +545,7 @@ class I14YAPIClient:
         Returns:
             List of concept dictionaries
         """
-        print(f"I14Y client searching for concepts with query: '{query}'")
+        app.logger.debug("I14Y client searching for concepts with query: '%s'", query)
         
         # Ensure page and page_size are integers with defaults
         if page is None:
@@ -170,144 +568,181 @@ class I14YAPIClient:
         if query.strip():
             params['query'] = query.strip()
         
-        print(f"Making request to {url} with params: {params}")
+        app.logger.debug("Making request to %s with params: %s", url, params)
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            print(f"API response status code: {response.status_code}")
+            response = self.session.get(url, params=params, timeout=10)
+            app.logger.debug("API response status code: %s", response.status_code)
             
             response.raise_for_status()
             
-            data = response.json()
-            print(f"API response type: {type(data)}")
-            print(f"API response content: {str(data)[:500]}...")
+            data = _json_loads(response.content)
+            app.logger.debug("API response type: %s", type(data))
+            app.logger.debug("API response content: %.500s...", data)
             
             # The new endpoint returns a list directly, not wrapped in a 'data' field
             if isinstance(data, list):
-                print(f"Raw data contains {len(data)} items")
+                app.logger.debug("Raw data contains %s items", len(data))
                 # Apply manual pagination since the endpoint doesn't support it
                 start = (page - 1) * page_size
                 end = start + page_size
                 result = data[start:end]
-                print(f"Returning {len(result)} results after pagination")
+                app.logger.debug("Returning %s results after pagination", len(result))
+                if _I14Y_PREFETCH:
+                    self._prefetch_concepts(result[:_PREFETCH_TOP_N])
                 return result
                 
-            print("Data is not a list, returning empty list")
+            app.logger.debug("Data is not a list, returning empty list")
             return []
             
         except requests.exceptions.RequestException as e:
-            print(f"API request failed: {e}")
+            app.logger.warning("API request failed: %s", e)
             return []
         except ValueError as e:
-            print(f"JSON decode failed: {e}")
+            app.logger.warning("JSON decode failed: %s", e)
             return []
     
+    @_concept_cache
     def get_concept_details(self, concept_id: str) -> Optional[Dict]:
         """Get detailed information about a specific concept"""
         # Use the public API endpoint instead of the input API
         url = f"https://api.i14y.admin.ch/api/public/v1/concepts/{concept_id}"
-        print(f"Fetching concept details from: {url}")
+        app.logger.debug("Fetching concept details from: %s", url)
         
         try:
-            response = requests.get(url, timeout=10)
-            print(f"API response status code: {response.status_code}")
+            response = self.session.get(url, timeout=10)
+            app.logger.debug("API response status code: %s", response.status_code)
             
             if response.status_code == 200:
-                data = response.json()
-                print(f"Received valid concept data with keys: {data.keys() if isinstance(data, dict) else 'not a dict'}")
+                data = _json_loads(response.content)
+                app.logger.debug("Received valid concept data with keys: %s", data.keys() if isinstance(data, dict) else 'not a dict')
                 
                 # Handle the case where the API returns data wrapped in a 'data' key
                 if isinstance(data, dict) and 'data' in data:
-                    print("Extracting concept from 'data' field")
+                    app.logger.debug("Extracting concept from 'data' field")
                     concept_data = data['data']
-                    print(f"Extracted concept data with keys: {concept_data.keys() if isinstance(concept_data, dict) else 'not a dict'}")
+                    app.logger.debug("Extracted concept data with keys: %s", concept_data.keys() if isinstance(concept_data, dict) else 'not a dict')
                     
                     # Log the title-related fields for debugging
                     title_fields = ['title', 'name', 'label', 'identifier', 'identifiers']
                     for field in title_fields:
                         if field in concept_data:
-                            print(f"Found {field}: {concept_data[field]}")
+                            app.logger.debug("Found %s: %s", field, concept_data[field])
                     
                     return concept_data
                 else:
                     # Return data directly if it's not wrapped
-                    print(f"Data not wrapped, using direct response with keys: {data.keys() if isinstance(data, dict) else 'not a dict'}")
+                    app.logger.debug("Data not wrapped, using direct response with keys: %s", data.keys() if isinstance(data, dict) else 'not a dict')
                     
                     # Log the title-related fields for debugging
                     title_fields = ['title', 'name', 'label', 'identifier', 'identifiers']
                     for field in title_fields:
                         if field in data:
-                            print(f"Found {field}: {data[field]}")
+                            app.logger.debug("Found %s: %s", field, data[field])
                     
                     return data
             elif response.status_code == 404:
-                print(f"Concept not found: {concept_id}")
+                app.logger.debug("Concept not found: %s", concept_id)
                 return None
             else:
-                print(f"API returned unexpected status code: {response.status_code}")
+                app.logger.warning("API returned unexpected status code: %s", response.status_code)
                 try:
-                    error_data = response.json()
+                    error_data = _json_loads(response.content)
                 except:
-                    print(f"Could not parse error response: {response.text[:200]}")
+                    app.logger.warning("Could not parse error response: %.200s", response.text)
                 return None
         except Exception as e:
             return None
     
+    def _prefetch_concepts(self, items: List[Dict]):
+        """Warm the concept and codelist caches for search results in the background"""
+        for item in items:
+            concept_id = item.get('id') if isinstance(item, dict) else None
+            if not concept_id:
+                continue
+            for fetch in (self.get_concept_details, self.get_codelist_entries):
+                if not _prefetch_slots.acquire(blocking=False):
+                    return
+                future = _prefetch_executor.submit(fetch, concept_id)
+                future.add_done_callback(lambda _: _prefetch_slots.release())
+    
+    def get_many_concept_details(self, concept_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch the details of several concepts concurrently
+        
+        Args:
+            concept_ids: IDs of the concepts to fetch
+            
+        Returns:
+            Dictionary mapping each concept ID to its details (None if not found)
+        """
+        futures = {
+            _i14y_executor.submit(self.get_concept_details, concept_id): concept_id
+            for concept_id in dict.fromkeys(concept_ids)
+        }
+        results = {}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception:
+                results[futures[future]] = None
+        return results
+    
     def get_codelist_entries(self, concept_id: str) -> Optional[List[Dict]]:
-        """Get codelist entries for a concept if it has a codelist"""
+        """Get codelist entries for a concept if it has a codelist
+        
+        Lookups that fail (connection errors, timeouts, error statuses, invalid
+        JSON) return None without being cached, so a transient failure does not
+        hide the codelist from every session.
+        """
         try:
-            # Use the public API endpoint for codelist entries
-            url = f"https://api.i14y.admin.ch/api/public/v1/concepts/{concept_id}/codelist-entries/exports/json"
-            print(f"Fetching codelist from: {url}")
-            response = requests.get(url, timeout=10)
-            print(f"Codelist response status: {response.status_code}")
-            print(f"Content-Type: {response.headers.get('content-type', 'unknown')}")
-            
-            if response.status_code == 200:
-                # The API returns a file download, so we need to parse the content as JSON
-                try:
-                    # Try to parse the response content as JSON
-                    data = response.json()
-                    print(f"Successfully parsed JSON data")
-                    print(f"Data structure: {list(data.keys()) if isinstance(data, dict) else 'Not a dict'}")
-                    
-                    # Handle different possible response structures
-                    entries = None
-                    if isinstance(data, dict):
-                        entries = data.get('entries') or data.get('items') or data.get('data') or data.get('codelistEntries')
-                        # If no nested structure, check if the root object contains entries directly
-                        if not entries and 'code' in str(data) or 'value' in str(data):
-                            # Check if data itself contains entry-like structures
-                            if all(isinstance(v, (dict, str, int)) for v in data.values()):
-                                entries = [data] if any(k in data for k in ['code', 'value', 'identifier']) else None
-                    elif isinstance(data, list):
-                        entries = data
-                    
-                    if entries:
-                        print(f"Found {len(entries)} codelist entries")
-                        if len(entries) > 0:
-                            print(f"First entry: {entries[0]}")
-                    else:
-                        print("No entries found in codelist response")
-                        print(f"Full response: {str(data)[:500]}")
-                    
-                    return entries
-                except ValueError as e:
-                    print(f"Failed to parse JSON: {e}")
-                    # Try to parse as text and see if it's a different format
-                    content = response.text[:500]
-                    print(f"Response content preview: {content}")
-                    return None
-            else:
-                print(f"Codelist API returned status code: {response.status_code}")
-                if response.status_code == 404:
-                    print("No codelist available for this concept")
-                else:
-                    return None
-                return None
+            return self._fetch_codelist_entries(concept_id)
         except Exception as e:
+            app.logger.warning("Failed to fetch codelist for concept %s: %s", concept_id, e)
             return None
     
+    @_codelist_cache
+    def _fetch_codelist_entries(self, concept_id: str) -> Optional[List[Dict]]:
+        """Fetch the codelist entries for a concept; None if it has no codelist
+        
+        Raises on anything but a 200 or 404 response so failures are not cached.
+        """
+        # Use the public API endpoint for codelist entries
+        url = f"https://api.i14y.admin.ch/api/public/v1/concepts/{concept_id}/codelist-entries/exports/json"
+        app.logger.debug("Fetching codelist from: %s", url)
+        response = self.session.get(url, timeout=10)
+        app.logger.debug("Codelist response status: %s", response.status_code)
+        app.logger.debug("Content-Type: %s", response.headers.get('content-type', 'unknown'))
+        
+        if response.status_code == 404:
+            app.logger.debug("No codelist available for this concept")
+            return None
+        response.raise_for_status()
+        
+        # The API returns a file download, so we need to parse the content as JSON
+        data = _json_loads(response.content)
+        app.logger.debug("Successfully parsed JSON data")
+        app.logger.debug("Data structure: %s", list(data.keys()) if isinstance(data, dict) else 'Not a dict')
+        
+        # Handle different possible response structures
+        entries = None
+        if isinstance(data, dict):
+            entries = next((data[k] for k in _CODELIST_ENTRY_KEYS if data.get(k)), None)
+            # If no nested structure, the root object may be a single flat entry
+            if (not entries and any(k in data for k in _CODELIST_ENTRY_FIELDS)
+                    and all(isinstance(v, (dict, str, int)) for v in data.values())):
+                entries = [data]
+        elif isinstance(data, list):
+            entries = data
+        
+        if entries:
+            app.logger.debug("Found %s codelist entries", len(entries))
+            app.logger.debug("First entry: %s", entries[0])
+        else:
+            app.logger.debug("No entries found in codelist response")
+            app.logger.debug("Full response: %.500s", data)
+        
+        return entries
+    
     def search_datasets(self, query='', page=1, page_size=20):
         """Search for datasets using the I14Y API
         
@@ -319,7 +754,7 @@ class I14YAPIClient:
         Returns:
             List of dataset dictionaries
         """
-        print(f"I14Y client searching for datasets with query: '{query}'")
+        app.logger.debug("I14Y client searching for datasets with query: '%s'", query)
         
         # Ensure page and page_size are integers with defaults
         if page is None:
@@ -342,38 +777,39 @@ class I14YAPIClient:
         if query.strip():
             params['query'] = query.strip()
         
-        print(f"Making request to {url} with params: {params}")
+        app.logger.debug("Making request to %s with params: %s", url, params)
         
         try:
-            response = requests.get(url, params=params, timeout=10)
-            print(f"API response status code: {response.status_code}")
+            response = self.session.get(url, params=params, timeout=10)
+            app.logger.debug("API response status code: %s", response.status_code)
             
             response.raise_for_status()
             
-            data = response.json()
-            print(f"API response type: {type(data)}")
-            print(f"API response content: {str(data)[:500]}...")
+            data = _json_loads(response.content)
+            app.logger.debug("API response type: %s", type(data))
+            app.logger.debug("API response content: %.500s...", data)
             
             # The new endpoint returns a list directly, not wrapped in a 'data' field
             if isinstance(data, list):
-                print(f"Raw data contains {len(data)} items")
+                app.logger.debug("Raw data contains %s items", len(data))
                 # Apply manual pagination since the endpoint doesn't support it
                 start = (page - 1) * page_size
                 end = start + page_size
                 result = data[start:end]
-                print(f"Returning {len(result)} results after pagination")
+                app.logger.debug("Returning %s results after pagination", len(result))
                 return result
                 
-            print("Data is not a list, returning empty list")
+            app.logger.debug("Data is not a list, returning empty list")
             return []
             
         except requests.exceptions.RequestException as e:
-            print(f"API request failed: {e}")
+            app.logger.warning("API request failed: %s", e)
             return []
         except ValueError as e:
-            print(f"JSON decode failed: {e}")
+            app.logger.warning("JSON decode failed: %s", e)
             return []
     
+    @_dataset_cache
     def get_dataset_details(self, dataset_id: str) -> Optional[Dict]:
         """Get detailed information about a specific dataset
         
@@ -384,46 +820,47 @@ class I14YAPIClient:
             Dataset details or None if not found
         """
         url = f"{self.base_url}/datasets/{dataset_id}"
-        print(f"Fetching dataset details from: {url}")
+        app.logger.debug("Fetching dataset details from: %s", url)
 
         try:
-            response = requests.get(url, timeout=10)
-            print(f"API response status code: {response.status_code}")
+            response = self.session.get(url, timeout=10)
+            app.logger.debug("API response status code: %s", response.status_code)
 
             if response.status_code == 200:
-                data = response.json()
-                print(f"Received valid dataset data with keys: {data.keys() if isinstance(data, dict) else 'not a dict'}")
+                data = _json_loads(response.content)
+                app.logger.debug("Received valid dataset data with keys: %s", data.keys() if isinstance(data, dict) else 'not a dict')
                 return data
             elif response.status_code == 404:
-                print(f"Dataset not found: {dataset_id}")
+                app.logger.debug("Dataset not found: %s", dataset_id)
                 return None
             else:
-                print(f"API returned unexpected status code: {response.status_code}")
+                app.logger.warning("API returned unexpected status code: %s", response.status_code)
                 try:
-                    error_data = response.json()
+                    error_data = _json_loads(response.content)
                 except:
-                    print(f"Could not parse error response: {response.text[:200]}")
+                    app.logger.warning("Could not parse error response: %.200s", response.text)
                 return None
         except Exception as e:
             return None
 
+    @_public_dataset_cache
     def get_public_dataset_details(self, dataset_id: str) -> Optional[Dict]:
         """Fetch dataset details from the public I14Y API (api.i14y.admin.ch).
         This endpoint returns the 'identifiers' list with human-readable identifiers."""
         public_url = f"https://api.i14y.admin.ch/api/public/v1/datasets/{dataset_id}"
-        print(f"Fetching public dataset details from: {public_url}")
+        app.logger.debug("Fetching public dataset details from: %s", public_url)
         try:
-            response = requests.get(public_url, timeout=10)
-            print(f"Public API response status: {response.status_code}")
+            response = self.session.get(public_url, timeout=10)
+            app.logger.debug("Public API response status: %s", response.status_code)
             if response.status_code == 200:
-                raw = response.json()
+                raw = _json_loads(response.content)
                 # The public API wraps the payload in {"data": {...}}
                 data = raw.get('data', raw) if isinstance(raw, dict) else raw
-                print(f"Public API keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
-                print(f"Public API identifiers: {data.get('identifiers') if isinstance(data, dict) else 'n/a'}")
+                app.logger.debug("Public API keys: %s", list(data.keys()) if isinstance(data, dict) else 'not a dict')
+                app.logger.debug("Public API identifiers: %s", data.get('identifiers') if isinstance(data, dict) else 'n/a')
                 return data
             else:
-                print(f"Public API returned {response.status_code} for {dataset_id}")
+                app.logger.debug("Public API returned %s for %s", response.status_code, dataset_id)
                 return None
         except Exception as e:
             return None
@@ -446,7 +883,7 @@ class I14YAPIClient:
                 # Extract values from codelist entries
                 enum_values = []
                 for entry in codelist_entries:
-                    print(f"Processing codelist entry: {entry}")
+                    app.logger.debug("Processing codelist entry: %s", entry)
                     # Try different possible value fields in order of preference
                     value = None
 
@@ -463,10 +900,7 @@ class I14YAPIClient:
                                 field_value = entry[field_name]
                                 if isinstance(field_value, dict):
                                     # Multilingual field - try different languages
-                                    value = (field_value.get('de') or
-                                            field_value.get('en') or
-                                            field_value.get('fr') or
-                                            field_value.get('it'))
+                                    value = _pick_lang(field_value, None, _PRIMARY_LANGS)
                                 elif field_value:
                                     value = str(field_value)
 
@@ -475,21 +909,21 @@ class I14YAPIClient:
 
                     if value:
                         enum_values.append(value)
-                        print(f"Added enum value: {value}")
+                        app.logger.debug("Added enum value: %s", value)
 
                 if enum_values:
                     # Sort enumeration values (numerically if all numeric, else alphabetically)
                     sorted_values = sort_enumeration_values(enum_values)
                     constraints['in_values'] = sorted_values
-                    print(f"Found {len(sorted_values)} codelist entries for concept {concept_id}: {sorted_values}")
+                    app.logger.debug("Found %s codelist entries for concept %s: %s", len(sorted_values), concept_id, sorted_values)
                 else:
-                    print(f"No usable values found in codelist entries for concept {concept_id}")
+                    app.logger.debug("No usable values found in codelist entries for concept %s", concept_id)
 
         # Extract datatype constraints from I14Y concept data
         datatype = self._extract_datatype_from_i14y(concept_data)
         if datatype:
             constraints['datatype'] = datatype
-            print(f"Extracted datatype from I14Y: {datatype}")
+            app.logger.debug("Extracted datatype from I14Y: %s", datatype)
 
         # Extract length constraints if available
         if 'minLength' in concept_data:
@@ -513,38 +947,16 @@ class I14YAPIClient:
             datatype = concept_data['datatype']
             if datatype:
                 # Map I14Y datatypes to XSD datatypes
-                datatype_lower = str(datatype).lower()
-                if 'string' in datatype_lower or 'text' in datatype_lower:
-                    return 'xsd:string'
-                elif 'int' in datatype_lower or 'number' in datatype_lower:
-                    return 'xsd:decimal'
-                elif 'date' in datatype_lower:
-                    return 'xsd:date'
-                elif 'datetime' in datatype_lower:
-                    return 'xsd:dateTime'
-                elif 'boolean' in datatype_lower or 'bool' in datatype_lower:
-                    return 'xsd:boolean'
-                elif 'decimal' in datatype_lower or 'float' in datatype_lower:
-                    return 'xsd:decimal'
-                elif 'uri' in datatype_lower or 'url' in datatype_lower:
-                    return 'xsd:anyURI'
+                xsd_type = _datatype_from_type_name(str(datatype).lower())
+                if xsd_type:
+                    return xsd_type
 
         # Check conceptValueType
         concept_type = concept_data.get('conceptValueType', '').lower()
         if concept_type:
-            if 'date' in concept_type:
-                if 'time' in concept_type:
-                    return 'xsd:dateTime'
-                else:
-                    return 'xsd:date'
-            elif 'number' in concept_type or 'integer' in concept_type or 'numeric' in concept_type:
-                return 'xsd:decimal'
-            elif 'boolean' in concept_type or 'bool' in concept_type:
-                return 'xsd:boolean'
-            elif 'string' in concept_type or 'text' in concept_type:
-                return 'xsd:string'
-            elif 'uri' in concept_type or 'url' in concept_type:
-                return 'xsd:anyURI'
+            xsd_type = _datatype_from_value_type(concept_type)
+            if xsd_type:
+                return xsd_type
 
         # Check for format hints
         if 'format' in concept_data:
@@ -569,32 +981,18 @@ class I14YAPIClient:
         else:
             desc_text = str(description_lower).lower()
 
-        combined_text = f"{title_text} {desc_text}"
-
         # Pattern-based detection
-        if any(word in combined_text for word in ['date', 'datum', 'birth', 'geburt', 'naissance', 'nascita']):
-            if any(word in combined_text for word in ['time', 'zeit', 'heure', 'ora']):
-                return 'xsd:dateTime'
-            else:
-                return 'xsd:date'
-        elif any(word in combined_text for word in ['number', 'nummer', 'numéro', 'numero', 'age', 'alter', 'âge', 'età', 'count', 'anzahl']):
-            return 'xsd:decimal'
-        elif any(word in combined_text for word in ['yes', 'no', 'ja', 'nein', 'oui', 'non', 'sì', 'boolean']):
-            return 'xsd:boolean'
-        elif any(word in combined_text for word in ['url', 'uri', 'link', 'website', 'webpage']):
-            return 'xsd:anyURI'
-
-        return None
+        return _datatype_from_text(f"{title_text} {desc_text}")
 
     def get_concept_schemes(self) -> List[Dict]:
         """Get all concept schemes from I14Y API"""
         try:
             url = f"{self.base_url}/concept-schemes"
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
-                print(f"API returned status code: {response.status_code}")
+                app.logger.debug("API returned status code: %s", response.status_code)
                 return []
         except Exception as e:
             return []
@@ -643,11 +1041,11 @@ class I14YAPIClient:
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=20)
+            response = self.session.get(url, headers=headers, timeout=20)
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = _json_loads(response.content)
             if isinstance(data, dict) and isinstance(data.get('data'), list):
                 return data['data']
             if isinstance(data, list):
@@ -670,14 +1068,14 @@ class I14YAPIClient:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(url, headers=headers, json=payload, timeout=30)
 
             if response.status_code == 201:
                 guid = None
                 raw_body = response.text.strip()
 
                 try:
-                    response_json = response.json()
+                    response_json = _json_loads(response.content)
                 except ValueError:
                     response_json = None
 
@@ -702,7 +1100,7 @@ class I14YAPIClient:
 
             error_message = 'I14Y API request failed'
             try:
-                error_json = response.json()
+                error_json = _json_loads(response.content)
                 if isinstance(error_json, dict):
                     error_message = (
                         error_json.get('detail') or
@@ -818,7 +1216,7 @@ class I14YAPIClient:
             }
 
             try:
-                response = requests.post(url, headers=headers, files=files, timeout=30)
+                response = self.session.post(url, headers=headers, files=files, timeout=30)
             except requests.RequestException as e:
                 last_status = 500
                 last_error = f'Network error while contacting I14Y API: {e}'
@@ -827,7 +1225,7 @@ class I14YAPIClient:
             if response.status_code in (200, 201, 202, 204):
                 response_json = None
                 try:
-                    response_json = response.json()
+                    response_json = _json_loads(response.content)
                 except ValueError:
                     response_json = response.text.strip()
 
@@ -840,7 +1238,7 @@ class I14YAPIClient:
 
             last_status = response.status_code
             try:
-                error_json = response.json()
+                error_json = _json_loads(response.content)
                 if isinstance(error_json, dict):
                     title = error_json.get('title') or ''
                     detail = error_json.get('detail') or error_json.get('message') or error_json.get('error') or ''
@@ -861,11 +1259,53 @@ class I14YAPIClient:
             'error': last_error or 'Failed to create codelist entries on I14Y'
         }
 
+
+# The client keeps no per-user state (lookups go through the shared HTTP session
+# and caches), so one instance serves all editors and nodes
+i14y_client = I14YAPIClient()
+
+
+@dataclass(init=False, repr=False, eq=False, slots=True)
 class SHACLNode:
     """Represents a node in the SHACL graph"""
     
+    # Declared fields, in project file order; orjson serializes these directly
+    id: str
+    type: str
+    title: Any
+    description: Any
+    identifier: Optional[str]
+    i14y_id: Optional[str]
+    i14y_data: Optional[Dict]
+    i14y_concept_uri: Optional[str]
+    i14y_dataset_uri: Optional[str]
+    local_name: Optional[str]
+    conforms_to_concept_uri: Optional[str]
+    is_linked_to_concept: bool
+    connections: set
+    datatype: str
+    min_count: Optional[int]
+    max_count: Optional[int]
+    min_length: Optional[int]
+    max_length: Optional[int]
+    pattern: Optional[str]
+    in_values: List
+    node_reference: Optional[str]
+    xone_groups: List
+    range: Optional[str]
+    order: Optional[int]
+    min_inclusive: Any
+    max_inclusive: Any
+    min_exclusive: Any
+    max_exclusive: Any
+    suggested_pattern: Optional[str]
+    suggested_in_values: Optional[List]
+    suggested_min_length: Optional[int]
+    suggested_max_length: Optional[int]
+    position: Dict
+    
     def __init__(self, node_type: str, node_id: str = None, title: str = "", description: str = ""):
-        self.id = node_id or str(uuid.uuid4())
+        self.id = node_id or fast_uuid()
         self.type = node_type  # 'dataset', 'data_element', 'concept', 'class'
         self.title = title
         # Support both string and multilingual object descriptions
@@ -989,7 +1429,7 @@ class SHACLNode:
             return {}
 
         normalized = {}
-        for lang in ['de', 'en', 'fr', 'it', 'rm']:
+        for lang in _LANG_FALLBACK:
             text = source.get(lang)
             if text is None:
                 continue
@@ -1091,11 +1531,13 @@ class SHACLNode:
         data_element.min_length = concept_node.min_length
         data_element.max_length = concept_node.max_length
         data_element.pattern = concept_node.pattern
-        data_element.in_values = concept_node.in_values.copy() if concept_node.in_values else []
+        # Enumeration values and I14Y data are only ever replaced, never changed
+        # in place, so the concept's objects can be shared instead of copied
+        data_element.in_values = concept_node.in_values or []
         
-        # Copy I14Y reference information (but not the direct link)
+        # Share I14Y reference information (but not the direct link)
         if concept_node.i14y_data:
-            data_element.i14y_data = concept_node.i14y_data.copy()
+            data_element.i14y_data = concept_node.i14y_data
             
         return data_element
     
@@ -1111,17 +1553,12 @@ class SHACLNode:
         for field_name in ['title', 'name', 'label', 'identifier', 'identifiers']:
             if field_name in concept_data:
                 title_obj = concept_data[field_name]
-                print(f"Found title field '{field_name}': {title_obj}")
+                app.logger.debug("Found title field '%s': %s", field_name, title_obj)
                 break
         
         if isinstance(title_obj, dict):
             # Handle multilingual titles
-            self.title = (title_obj.get('de') or 
-                         title_obj.get('en') or 
-                         title_obj.get('fr') or 
-                         title_obj.get('it') or 
-                         title_obj.get('rm') or 
-                         'Unknown')
+            self.title = _pick_lang(title_obj, 'Unknown')
         elif isinstance(title_obj, list):
             # Handle array of identifiers/titles
             self.title = title_obj[0] if title_obj else 'Unknown'
@@ -1132,7 +1569,7 @@ class SHACLNode:
             # Final fallback - use the concept ID or 'Unknown'
             self.title = concept_data.get('id', 'Unknown')
         
-        print(f"Extracted title: {self.title}")
+        app.logger.debug("Extracted title: %s", self.title)
         
         # Add concept type info if available
         concept_type = concept_data.get('conceptValueType', '')
@@ -1145,7 +1582,7 @@ class SHACLNode:
             # Store the full multilingual description object
             self.description = {
                 lang: desc for lang, desc in desc_obj.items() 
-                if lang in ['de', 'en', 'fr', 'it', 'rm'] and desc
+                if lang in _ALL_LANGS and desc
             }
             # Ensure we have at least a German description as fallback
             if not self.description:
@@ -1174,12 +1611,7 @@ class SHACLNode:
         # Extract title from dataset data
         title_obj = dataset_data.get('title', {})
         if isinstance(title_obj, dict):
-            self.title = (title_obj.get('de') or 
-                          title_obj.get('en') or 
-                          title_obj.get('fr') or 
-                          title_obj.get('it') or 
-                          title_obj.get('rm') or 
-                          'Unknown Dataset')
+            self.title = _pick_lang(title_obj, 'Unknown Dataset')
         else:
             self.title = str(title_obj) if title_obj else 'Unknown Dataset'
         
@@ -1189,7 +1621,7 @@ class SHACLNode:
             # Store the full multilingual description object
             self.description = {
                 lang: desc for lang, desc in desc_obj.items() 
-                if lang in ['de', 'en', 'fr', 'it', 'rm'] and desc
+                if lang in _ALL_LANGS and desc
             }
             # Ensure we have at least a German description as fallback
             if not self.description:
@@ -1206,53 +1638,43 @@ class SHACLNode:
         if not self.i14y_data:
             return
         
-        # Create API client to extract constraints
-        api_client = I14YAPIClient()
-        
         # Extract constraints
-        constraints = api_client.extract_constraints_from_concept(self.i14y_data)
+        constraints = i14y_client.extract_constraints_from_concept(self.i14y_data)
         
         # Apply extracted constraints
         if 'pattern' in constraints:
             self.pattern = constraints['pattern']
-            print(f"Applied pattern constraint: {self.pattern}")
+            app.logger.debug("Applied pattern constraint: %s", self.pattern)
         
         if 'in_values' in constraints:
             self.in_values = sort_enumeration_values(constraints['in_values'])
-            print(f"Applied enumeration constraint with {len(self.in_values)} values")
+            app.logger.debug("Applied enumeration constraint with %s values", len(self.in_values))
         
         if 'min_length' in constraints:
             self.min_length = constraints['min_length']
-            print(f"Applied min_length constraint: {self.min_length}")
+            app.logger.debug("Applied min_length constraint: %s", self.min_length)
         
         if 'max_length' in constraints:
             self.max_length = constraints['max_length']
-            print(f"Applied max_length constraint: {self.max_length}")
+            app.logger.debug("Applied max_length constraint: %s", self.max_length)
         
         if 'datatype' in constraints:
             self.datatype = constraints['datatype']
-            print(f"Applied datatype constraint: {self.datatype}")
+            app.logger.debug("Applied datatype constraint: %s", self.datatype)
     
     def _determine_datatype(self):
         """Determine appropriate XSD datatype based on concept information"""
         if not self.i14y_data:
             return
         
-        # Check concept category or keywords to determine datatype
+        # Check concept title keywords to determine datatype
         title_lower = self.title.lower()
-        desc_lower = self.description.lower()
         
-        # Date-related concepts
-        if any(word in title_lower for word in ['date', 'datum', 'birth', 'geburt', 'naissance', 'nascita']):
-            if any(word in title_lower for word in ['year', 'jahr', 'année', 'anno']):
-                self.datatype = "xsd:decimal"
-            else:
-                self.datatype = "xsd:date"
-        # Numeric concepts
-        elif any(word in title_lower for word in ['number', 'nummer', 'numéro', 'numero', 'age', 'alter', 'âge', 'età']):
+        if _DATE_HINT_RE.search(title_lower):
+            self.datatype = "xsd:decimal" if _YEAR_HINT_RE.search(title_lower) else "xsd:date"
+        elif _CONCEPT_NUMBER_HINT_RE.search(title_lower):
             self.datatype = "xsd:decimal"
-        # Boolean concepts
-        elif any(word in title_lower for word in ['over', 'älter', 'plus', 'superiore', 'boolean']):
+        elif _CONCEPT_BOOLEAN_HINT_RE.search(title_lower):
             self.datatype = "xsd:boolean"
         else:
             self.datatype = "xsd:string"
@@ -1261,12 +1683,7 @@ class SHACLNode:
         """Get multilingual titles from I14Y data or fallback to single title"""
         parsed_title = SHACLNode._parse_multilingual_value(self.title)
         if parsed_title:
-            base_title = (parsed_title.get('de') or
-                         parsed_title.get('en') or
-                         parsed_title.get('fr') or
-                         parsed_title.get('it') or
-                         parsed_title.get('rm') or
-                         '')
+            base_title = _pick_lang(parsed_title)
             return {
                 'de': str(parsed_title.get('de') or base_title),
                 'en': str(parsed_title.get('en') or base_title),
@@ -1278,12 +1695,7 @@ class SHACLNode:
             title_obj = self.i14y_data['title']
             if isinstance(title_obj, dict):
                 # Use available titles, fallback to base title for missing languages
-                base_title = (title_obj.get('de') or 
-                             title_obj.get('en') or 
-                             title_obj.get('fr') or 
-                             title_obj.get('it') or 
-                             title_obj.get('rm') or 
-                             self.title)
+                base_title = _pick_lang(title_obj, self.title)
                 return {
                     'de': str(title_obj.get('de', base_title)),
                     'en': str(title_obj.get('en', base_title)),
@@ -1305,12 +1717,7 @@ class SHACLNode:
         parsed_description = SHACLNode._parse_multilingual_value(self.description)
         if parsed_description:
             # Return the stored multilingual descriptions, filling in missing languages
-            base_desc = (parsed_description.get('de') or 
-                        parsed_description.get('en') or 
-                        parsed_description.get('fr') or 
-                        parsed_description.get('it') or 
-                        parsed_description.get('rm') or 
-                        '')
+            base_desc = _pick_lang(parsed_description)
             return {
                 'de': str(parsed_description.get('de', base_desc)),
                 'en': str(parsed_description.get('en', base_desc)),
@@ -1328,12 +1735,6 @@ class SHACLNode:
             }
     
     def to_dict(self) -> Dict:
-        connections_list = list(self.connections)
-        
-        # Debug log for connections
-        if connections_list:
-            print(f"Node {self.id} ({self.title}) has {len(connections_list)} connections")
-        
         return {
             'id': self.id,
             'type': self.type,
@@ -1347,7 +1748,7 @@ class SHACLNode:
             'local_name': self.local_name,
             'conforms_to_concept_uri': self.conforms_to_concept_uri,
             'is_linked_to_concept': self.is_linked_to_concept,
-            'connections': connections_list,
+            'connections': tuple(self.connections),
             'datatype': self.datatype,
             # Advanced SHACL constraints
             'min_count': self.min_count,
@@ -1375,39 +1776,30 @@ class SHACLNode:
     @classmethod
     def from_dict(cls, data: Dict) -> 'SHACLNode':
         node = cls(data['type'], data['id'], data['title'], data['description'])
-        node.identifier = data.get('identifier')
-        node.i14y_id = data.get('i14y_id')
-        node.i14y_data = data.get('i14y_data')
-        node.i14y_concept_uri = data.get('i14y_concept_uri')
-        node.i14y_dataset_uri = data.get('i14y_dataset_uri')
-        node.local_name = data.get('local_name')
-        node.conforms_to_concept_uri = data.get('conforms_to_concept_uri')
-        node.is_linked_to_concept = data.get('is_linked_to_concept', False)
-        node.connections = set(data.get('connections', []))
-        node.datatype = data.get('datatype', 'xsd:string')
-        # Advanced SHACL constraints
-        node.min_count = data.get('min_count')
-        node.max_count = data.get('max_count')
-        node.min_length = data.get('min_length')
-        node.max_length = data.get('max_length')
-        node.pattern = data.get('pattern')
-        node.in_values = data.get('in_values', [])
-        node.node_reference = data.get('node_reference')
-        node.xone_groups = data.get('xone_groups', [])
-        node.range = data.get('range')
-        node.order = data.get('order')
-        node.min_inclusive = data.get('min_inclusive')
-        node.max_inclusive = data.get('max_inclusive')
-        node.min_exclusive = data.get('min_exclusive')
-        node.max_exclusive = data.get('max_exclusive')
-        node.suggested_pattern = data.get('suggested_pattern')
-        node.suggested_in_values = data.get('suggested_in_values')
-        node.suggested_min_length = data.get('suggested_min_length')
-        node.suggested_max_length = data.get('suggested_max_length')
-        # Visualization properties
-        node.position = data.get('position', {'x': 0.5, 'y': 0.5})
+        # __init__ already set the defaults, so only fields present in the data are copied
+        for name in _NODE_DATA_FIELDS:
+            if name in data:
+                setattr(node, name, data[name])
+        node.connections = set(data.get('connections', ()))
+        return node
+    
+    @classmethod
+    def new(cls, node_type: str, node_id: str = None, title: Any = "", description: Any = "", **fields) -> 'SHACLNode':
+        """Create a node with the given attributes set directly (no from_dict() round-trip)"""
+        node = cls(node_type, node_id, title, description)
+        for name, value in fields.items():
+            setattr(node, name, value)
         return node
 
+# Fields that SHACLNode.from_dict() copies as-is (the constructor arguments and
+# connections are handled separately)
+_NODE_DATA_FIELDS = tuple(
+    field.name for field in dataclass_fields(SHACLNode)
+    if field.name not in ('id', 'type', 'title', 'description', 'connections')
+)
+
+
+@functools.lru_cache(maxsize=64)
 def parse_cardinality(cardinality_str: str) -> Tuple[Optional[int], Optional[int]]:
     """Parse cardinality string like '1..1', '0..n', '1..n', etc.
     
@@ -1446,38 +1838,165 @@ def parse_cardinality(cardinality_str: str) -> Tuple[Optional[int], Optional[int
     return None, None
 
 def get_unique_lang_values(multilang_dict, sanitize_literal_func):
-    """Only keep one language per unique content value to avoid SHACL violations"""
+    """Only keep one language per unique content value to avoid SHACL violations
+    
+    Returned values are already passed through sanitize_literal_func.
+    """
     seen_values = {}
     unique_values = {}
     for lang, value in multilang_dict.items():
-        if lang in ['de', 'fr', 'it', 'en'] and value:
+        if lang in _SUPPORTED_LANGS and value:
             cleaned_value = sanitize_literal_func(value)
             if cleaned_value not in seen_values:
                 seen_values[cleaned_value] = lang
-                unique_values[lang] = value
+                unique_values[lang] = cleaned_value
             # If content is identical, prefer 'de', then 'en', then others
-            elif seen_values[cleaned_value] not in ['de'] and lang in ['de']:
+            elif seen_values[cleaned_value] != 'de' and lang == 'de':
                 # Replace with German if we had a non-German version
                 old_lang = seen_values[cleaned_value]
                 if old_lang in unique_values:
                     del unique_values[old_lang]
                 seen_values[cleaned_value] = lang
-                unique_values[lang] = value
+                unique_values[lang] = cleaned_value
     return unique_values
 
-def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[str, Dict] = None) -> str:
-    """Generate full TTL using the RDF-based approach directly"""
+# Literal 1 (xsd:integer) is by far the most common cardinality value; build it once
+LITERAL_ONE = Literal(1)
+# sh:minCount / sh:maxCount literals for the default '1..1' edge cardinality
+_DEFAULT_CARDINALITY_LITERALS = (LITERAL_ONE, LITERAL_ONE)
+
+class _TermCache:
+    """Namespace wrapper that resolves each term once and then serves it as a plain attribute
+    
+    Term lookups on rdflib's DefinedNamespace (RDF, SH, ...) are validated on every
+    access, which costs close to a microsecond each in TTL export loops.
+    """
+    
+    def __init__(self, namespace):
+        self._namespace = namespace
+        self._items = {}
+    
+    def __getattr__(self, name):
+        term = getattr(self._namespace, name)
+        setattr(self, name, term)
+        return term
+    
+    def __getitem__(self, name):
+        term = self._items.get(name)
+        if term is None:
+            term = self._items[name] = self._namespace[name]
+        return term
+
+
+_RDF_TERMS = _TermCache(RDF)
+_RDFS_TERMS = _TermCache(RDFS)
+_XSD_TERMS = _TermCache(XSD)
+_SH_TERMS = _TermCache(SH)
+_OWL_TERMS = _TermCache(OWL)
+_QB_TERMS = _TermCache(QB)
+_DCTERMS_TERMS = _TermCache(DCTERMS)
+
+# Namespaces bound on every exported graph besides the per-dataset i14y one
+_TTL_BINDINGS = (
+    ("rdf", RDF), ("rdfs", RDFS), ("xsd", XSD), ("dcterms", DCTERMS), ("sh", SH),
+    ("owl", OWL), ("QB", QB), ("pav", PAV), ("schema", SCHEMA),
+)
+
+# Predicates under which multilingual titles and descriptions are exported
+_DATASET_TITLE_PREDICATES = (DCTERMS.title, RDFS.label)
+_CLASS_TITLE_PREDICATES = (SH.name,)
+_PROPERTY_TITLE_PREDICATES = (DCTERMS.title, RDFS.label, SH.name)
+_DESCRIPTION_PREDICATES = (DCTERMS.description, RDFS.comment)
+_PROPERTY_DESCRIPTION_PREDICATES = (DCTERMS.description, RDFS.comment, SH.description)
+
+# Fixed prefix header for exported TTL; only the dataset id varies per export
+_PREFIX_TEMPLATE = (
+    b"@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>.\n"
+    b"@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#>.\n"
+    b"@prefix xsd: <http://www.w3.org/2001/XMLSchema#>.\n"
+    b"@prefix xml: <http://www.w3.org/XML/1998/namespace>.\n"
+    b"@prefix QB: <http://purl.org/linked-data/cube#>.\n"
+    b"@prefix dcterms: <http://purl.org/dc/terms/>.\n"
+    b"@prefix i14y: <https://register.ld.admin.ch/i14y/dataset/%s/structure/>.\n"
+    b"@prefix owl: <http://www.w3.org/2002/07/owl#>.\n"
+    b"@prefix pav: <http://purl.org/pav/>.\n"
+    b"@prefix schema: <https://schema.org/>.\n"
+    b"@prefix sh: <http://www.w3.org/ns/shacl#>.\n"
+    b"\n"
+)
+
+_SLUG_SPACES = re.compile(r"\s+")
+_SLUG_INVALID = re.compile(r"[^A-Za-z0-9_-]")
+_SLUG_UNDERSCORES = re.compile(r"_+")
+_SLUG_HYPHENS = re.compile(r"-+")
+
+
+# Titles and descriptions are sanitized once when deduplicating languages and
+# again when written, so the results are cached
+@functools.lru_cache(maxsize=4096)
+def _sanitize_text(text: str) -> str:
+    """Collapse whitespace/newlines and escape quotes for a TTL literal"""
+    return " ".join(text.split()).replace('"', '\\"')
+
+
+# Nodes, concepts and classes often share labels, and the same labels come
+# back on every export, so slugs are cached across calls
+@functools.lru_cache(maxsize=4096)
+def _ascii_slug(value: str) -> str:
+    """ASCII-only identifier segment for a label, preserving casing ('' if nothing is left)"""
+    raw = (value or "").strip()
+    if not raw:
+        return ""
+
+    normalized = unicodedata.normalize("NFKD", raw)
+    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
+    slug = _SLUG_SPACES.sub("_", ascii_text)
+    slug = _SLUG_INVALID.sub("", slug)
+    slug = _SLUG_UNDERSCORES.sub("_", slug)
+    slug = _SLUG_HYPHENS.sub("-", slug)
+    return slug.strip("_-")
+
+
+@functools.lru_cache(maxsize=64)
+def _datatype_uri(datatype: Optional[str]) -> URIRef:
+    """sh:datatype URI for a node datatype ('xsd:<name>' or a full URI), defaulting to xsd:string"""
+    if not datatype:
+        return XSD.string
+    if datatype.startswith('xsd:'):
+        return getattr(XSD, datatype.split(':')[1])
+    return URIRef(datatype)
+
+
+def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[str, Dict] = None,
+                      store: Optional[str] = None) -> bytes:
+    """Generate full TTL using the RDF-based approach directly (UTF-8 encoded bytes)
     
-    # Find dataset node  
+    store selects the rdflib store plugin for the graph (defaults to _EXPORT_GRAPH_STORE).
+    """
+    
+    # Namespace terms are used for every property shape; look them up through the caches
+    RDF, RDFS, XSD, SH, OWL, QB, DCTERMS = (
+        _RDF_TERMS, _RDFS_TERMS, _XSD_TERMS, _SH_TERMS, _OWL_TERMS, _QB_TERMS, _DCTERMS_TERMS
+    )
+    
+    # Find dataset node (through the by-type index when given a NodeStore)
     dataset_node = None
-    for node in nodes.values():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    if isinstance(nodes, NodeStore):
+        dataset_id = next(iter(nodes.ids_by_type.get('dataset', ())), None)
+        dataset_node = nodes.get(dataset_id)
+    else:
+        for node in nodes.values():
+            if node.type == 'dataset':
+                dataset_node = node
+                break
     
     if not dataset_node:
         raise ValueError("No dataset node found")
     
+    # Edge cardinalities are looked up by node pair; index plain dicts once up front
+    if edges and not isinstance(edges, EdgeStore):
+        edges = EdgeStore(edges)
+    
     # Helper function to extract text from multilingual objects or strings
     def get_text_value(value, lang='de'):
         """Extract text from a value that might be a string or multilingual dict"""
@@ -1485,43 +2004,17 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
             return ""
         if isinstance(value, dict):
             # Try requested language first, then fallback chain
-            return (value.get(lang) or 
-                   value.get('de') or 
-                   value.get('en') or 
-                   value.get('fr') or 
-                   value.get('it') or 
+            return (_pick_lang(value, '', (lang,) + _PRIMARY_LANGS) or
                    next(iter(value.values()), ""))
         return str(value)
     
     def slug_id(value: str, fallback: str = "property") -> str:
         """Build a lowercase ASCII-safe identifier for use in the dataset namespace prefix."""
-        raw = (value or "").strip()
-        if not raw:
-            return fallback
-
-        normalized = unicodedata.normalize("NFKD", raw)
-        ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-        slug = re.sub(r"\s+", "_", ascii_text)
-        slug = re.sub(r"[^A-Za-z0-9_-]", "", slug)
-        slug = re.sub(r"_+", "_", slug)
-        slug = re.sub(r"-+", "-", slug)
-        slug = slug.strip("_-")
-        return slug.lower() or fallback
+        return _ascii_slug(value).lower() or fallback
 
     def preserve_id(value: str, fallback: str = "property") -> str:
         """ASCII-safe identifier preserving original casing, used for class/property IRI segments."""
-        raw = (value or "").strip()
-        if not raw:
-            return fallback
-
-        normalized = unicodedata.normalize("NFKD", raw)
-        ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-        slug = re.sub(r"\s+", "_", ascii_text)
-        slug = re.sub(r"[^A-Za-z0-9_-]", "", slug)
-        slug = re.sub(r"_+", "_", slug)
-        slug = re.sub(r"-+", "-", slug)
-        slug = slug.strip("_-")
-        return slug or fallback
+        return _ascii_slug(value) or fallback
 
     # Use the business identifier for the dataset namespace, with title fallback.
     dataset_identifier_str = get_text_value(getattr(dataset_node, 'identifier', None), 'de').strip()
@@ -1532,46 +2025,73 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
         dataset_id = slug_id(dataset_title_str, fallback="dataset")
 
     # Create RDF graph
-    g = Graph()
+    g = Graph(store=store or _EXPORT_GRAPH_STORE)
 
     # Bind namespaces
     i14y_ns = Namespace(f"https://register.ld.admin.ch/i14y/dataset/{dataset_id}/structure/")
-    QB = Namespace("http://purl.org/linked-data/cube#")
-    g.bind("rdf", RDF)
-    g.bind("rdfs", RDFS)
-    g.bind("xsd", XSD)
-    g.bind("dcterms", DCTERMS)
-    g.bind("sh", SH)
-    g.bind("owl", OWL)
-    g.bind("QB", QB)
+    for prefix, namespace in _TTL_BINDINGS:
+        g.bind(prefix, namespace)
     g.bind("i14y", i14y_ns)
 
     # Global tracking to prevent duplicate language tags for the same URI and property
     uri_lang_tracker = {}  # Format: {(uri, property, lang): content}
+    # The same text is emitted under several predicates (title, label, name, ...),
+    # so build each language-tagged Literal once and reuse it
+    literal_pool = {}  # Format: {(content, lang): Literal}
+    # Constraint values, enumeration values and referenced URIs repeat across
+    # properties; terms are immutable, so each one is built once
+    term_pool = {}  # Format: {(type, value, datatype): Literal or URIRef}
+    
+    def cached_literal(value, datatype=None):
+        key = (type(value), value, datatype)
+        literal = term_pool.get(key)
+        if literal is None:
+            literal = term_pool[key] = Literal(value, datatype=datatype)
+        return literal
+    
+    def cached_uri(value):
+        key = (URIRef, value, None)
+        uri = term_pool.get(key)
+        if uri is None:
+            uri = term_pool[key] = URIRef(value)
+        return uri
     
     def safe_add_multilingual_property(uri, property_type, content, lang):
         """Safely add a multilingual property, preventing duplicates for same URI+property+lang"""
-        if not content or lang not in ['de', 'fr', 'it', 'en']:
+        if not content or lang not in _SUPPORTED_LANGS:
             return False
-            
-        # Sanitize content before using as key
-        sanitized_content = sanitize_literal(content)
-        key = (str(uri), str(property_type), lang)
+        
+        sanitized_content = str(content) if isinstance(content, Literal) else sanitize_literal(content)
+        key = (uri, property_type, lang)
         
         if key in uri_lang_tracker:
             # Check if content is the same - if different, log a warning
             existing_content = uri_lang_tracker[key]
             if existing_content != sanitized_content:
-                print(f"WARNING: Different content for same URI+property+lang: {key}")
-                print(f"  Existing: {existing_content}")
-                print(f"  Attempted: {sanitized_content}")
+                app.logger.warning("Different content for same URI+property+lang: %s %s %s", uri, property_type, lang)
+                app.logger.debug("  Existing: %s", existing_content)
+                app.logger.debug("  Attempted: %s", sanitized_content)
             return False
         
+        if isinstance(content, Literal):
+            # Pre-built literal: use as-is
+            literal = content
+        else:
+            literal = literal_pool.get((sanitized_content, lang))
+            if literal is None:
+                literal = literal_pool[(sanitized_content, lang)] = Literal(sanitized_content, lang=lang)
+        
         # Add to graph and track
-        g.add((uri, property_type, Literal(sanitized_content, lang=lang)))
+        g.add((uri, property_type, literal))
         uri_lang_tracker[key] = sanitized_content
         return True
     
+    def add_multilingual(uri, values, predicates):
+        """Add each distinct language value of a multilingual dict under all the given predicates"""
+        for lang, sanitized_value in get_unique_lang_values(values, sanitize_literal).items():
+            for predicate in predicates:
+                safe_add_multilingual_property(uri, predicate, sanitized_value, lang)
+    
     def resolve_conforms_to_uri(node) -> Optional[str]:
         """Resolve the best dcterms:conformsTo URI for a node."""
         fallback_uri = None
@@ -1586,15 +2106,18 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
             fallback_uri
         )
 
+    conforms_to_added = set()  # (subject URI, conformsTo URI) pairs already in the graph
+
     def safe_add_conforms_to(uri, node):
         """Safely add dcterms:conformsTo if node has concept reference"""
         conforms_to_uri = resolve_conforms_to_uri(node)
 
         if conforms_to_uri:
-            # Check if already exists to prevent duplicates
-            existing = list(g.triples((uri, DCTERMS.conformsTo, URIRef(conforms_to_uri))))
-            if not existing:
-                g.add((uri, DCTERMS.conformsTo, URIRef(conforms_to_uri)))
+            # Check if already added to prevent duplicates
+            key = (uri, conforms_to_uri)
+            if key not in conforms_to_added:
+                conforms_to_added.add(key)
+                g.add((uri, DCTERMS.conformsTo, cached_uri(conforms_to_uri)))
                 return True
         return False
 
@@ -1602,9 +2125,7 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
     def sanitize_literal(text: str) -> str:
         if text is None:
             return ""
-        # Collapse whitespace/newlines and escape quotes
-        cleaned = " ".join(str(text).split())
-        return cleaned.replace('"', '\\"')
+        return _sanitize_text(str(text))
 
     def norm_id(label) -> str:
         """Normalize a label (string or multilingual dict) to a valid ID, preserving original casing."""
@@ -1639,53 +2160,114 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
     g.add((dataset_shape, RDF.type, QB.DataStructureDefinition))
 
     # Add dataset metadata with multilingual support
-    dataset_titles = dataset_node.get_multilingual_title()
-    dataset_descriptions = dataset_node.get_multilingual_description()
-
-    unique_dataset_titles = get_unique_lang_values(dataset_titles, sanitize_literal)
-    unique_dataset_descriptions = get_unique_lang_values(dataset_descriptions, sanitize_literal)
-
-    for lang, title in unique_dataset_titles.items():
-        sanitized_title = sanitize_literal(title)
-        safe_add_multilingual_property(dataset_shape, DCTERMS.title, sanitized_title, lang)
-        safe_add_multilingual_property(dataset_shape, RDFS.label, sanitized_title, lang)
-
-    for lang, desc in unique_dataset_descriptions.items():
-        sanitized_desc = sanitize_literal(desc)
-        safe_add_multilingual_property(dataset_shape, DCTERMS.description, sanitized_desc, lang)
-        safe_add_multilingual_property(dataset_shape, RDFS.comment, sanitized_desc, lang)
+    add_multilingual(dataset_shape, dataset_node.get_multilingual_title(), _DATASET_TITLE_PREDICATES)
+    add_multilingual(dataset_shape, dataset_node.get_multilingual_description(), _DESCRIPTION_PREDICATES)
 
     # Add version and schema information (following I14Y pattern)
-    PAV = Namespace("http://purl.org/pav/")
-    SCHEMA = Namespace("https://schema.org/")
-    g.bind("pav", PAV)
-    g.bind("schema", SCHEMA)
-    
     g.add((dataset_shape, PAV.version, Literal("1.0.0")))
     g.add((dataset_shape, SCHEMA.version, Literal("1.0.0")))
     
     # Add current date as validFrom
-    current_date = datetime.now().strftime("%Y-%m-%d")
+    current_date = date.today().isoformat()
     g.add((dataset_shape, SCHEMA.validFrom, Literal(current_date, datatype=XSD.date)))
 
+    def concept_count_literals(concept, datatype=None):
+        """sh:minCount / sh:maxCount literals for a concept property (None when unset)"""
+        min_literal = cached_literal(concept.min_count, datatype) if concept.min_count is not None else None
+        max_literal = cached_literal(concept.max_count, datatype) if concept.max_count is not None else None
+        return min_literal, max_literal
+
+    def data_element_count_literals(parent_node, data_element):
+        """sh:minCount / sh:maxCount literals for a data element, from the edge to its parent"""
+        # Get cardinality from edge if available
+        edge = edges.edge_between(parent_node.id, data_element.id) if edges else None
+        cardinality = edge.get('cardinality', '1..1') if edge else None
+
+        if cardinality == '1..1':
+            # Default cardinality: reuse the prebuilt literals, nothing to parse
+            return _DEFAULT_CARDINALITY_LITERALS
+        if edge:
+            min_count, max_count = parse_cardinality(cardinality)
+        else:
+            # Fallback to node attributes
+            min_count = data_element.min_count
+            max_count = data_element.max_count
+        # Default minCount for data elements is 1
+        min_literal = cached_literal(min_count) if min_count is not None else LITERAL_ONE
+        max_literal = cached_literal(max_count) if max_count is not None else None
+        return min_literal, max_literal
+
+    def add_property_shape(property_uri, node, min_literal, max_literal,
+                           integer_datatype=None, extra_types=(), include_order=False):
+        """Add the PropertyShape for a concept or data element, including its titles and descriptions"""
+        g.add((property_uri, RDF.type, SH.PropertyShape))
+        g.add((property_uri, RDF.type, OWL.DatatypeProperty))
+        for extra_type in extra_types:
+            g.add((property_uri, RDF.type, extra_type))
+        g.add((property_uri, SH.path, property_uri))
+        g.add((property_uri, SH.datatype, _datatype_uri(node.datatype)))
+
+        # Add I14Y concept reference if available
+        safe_add_conforms_to(property_uri, node)
+
+        # Add cardinality and other SHACL constraints
+        if min_literal is not None:
+            g.add((property_uri, SH.minCount, min_literal))
+        if max_literal is not None:
+            g.add((property_uri, SH.maxCount, max_literal))
+        if node.min_length is not None:
+            g.add((property_uri, SH.minLength, cached_literal(node.min_length, integer_datatype)))
+        if node.max_length is not None:
+            g.add((property_uri, SH.maxLength, cached_literal(node.max_length, integer_datatype)))
+        if node.pattern:
+            g.add((property_uri, SH.pattern, cached_literal(node.pattern)))
+        if node.range:
+            g.add((property_uri, RDFS.range, cached_uri(node.range)))
+
+        # Add enumeration values (sh:in)
+        if node.in_values:
+            # Add QB:CodedProperty for enumerated values
+            g.add((property_uri, RDF.type, QB.CodedProperty))
+
+            # sh:in takes an RDF list of the enumeration values
+            list_head = BNode()
+            g.add((property_uri, SH['in'], list_head))
+            Collection(g, list_head, [cached_literal(value) for value in node.in_values])
+
+        # Add class reference (sh:node)
+        if node.node_reference:
+            g.add((property_uri, SH.node, cached_uri(node.node_reference)))
+
+        # Add order property (sh:order) for sorting
+        if include_order and node.order is not None:
+            g.add((property_uri, SH.order, cached_literal(node.order)))
+
+        # Add multilingual titles and descriptions
+        add_multilingual(property_uri, node.get_multilingual_title(), _PROPERTY_TITLE_PREDICATES)
+        add_multilingual(property_uri, node.get_multilingual_description(), _PROPERTY_DESCRIPTION_PREDICATES)
+
+    def connected_by_type(node):
+        """Group the nodes connected to a node by node type, in one pass over its connections"""
+        grouped = defaultdict(list)
+        for conn_id in node.connections:
+            connected_node = nodes.get(conn_id)
+            if connected_node is not None:
+                grouped[connected_node.type].append(connected_node)
+        return grouped
+
+    def data_element_sort_key(data_element):
+        """Order data elements by their order field (unset ones last), then by title"""
+        order = data_element.order if data_element.order is not None else math.inf
+        return order, get_text_value(data_element.title, 'de') if data_element.title else ""
+
     # Collect concepts, classes, and data elements connected to dataset
-    connected_concepts = []
-    connected_classes = []
-    connected_data_elements = []
-
-    for conn_id in dataset_node.connections:
-        if conn_id in nodes:
-            connected_node = nodes[conn_id]
-            if connected_node.type == 'concept':
-                connected_concepts.append(connected_node)
-            elif connected_node.type == 'class':
-                connected_classes.append(connected_node)
-            elif connected_node.type == 'data_element':
-                connected_data_elements.append(connected_node)
+    dataset_connections = connected_by_type(dataset_node)
+    connected_concepts = dataset_connections['concept']
+    connected_classes = dataset_connections['class']
+    connected_data_elements = dataset_connections['data_element']
 
     # First, create all class NodeShapes and collect their properties
     class_properties = {}  # Maps class_id to list of concept property URIs
-    rdf_list_counter = 0  # For generating unique RDF list IDs
 
     for class_node in connected_classes:
         class_id = node_export_id(class_node)
@@ -1699,31 +2281,13 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
         g.add((class_uri, SH.targetClass, class_uri))
 
         # Add class metadata with multilingual support
-        class_titles = class_node.get_multilingual_title()
-        class_descriptions = class_node.get_multilingual_description()
-
-        unique_class_titles = get_unique_lang_values(class_titles, sanitize_literal)
-        unique_class_descriptions = get_unique_lang_values(class_descriptions, sanitize_literal)
-
-        for lang, title in unique_class_titles.items():
-            sanitized_title = sanitize_literal(title)
-            safe_add_multilingual_property(class_uri, SH.name, sanitized_title, lang)
-
-        for lang, desc in unique_class_descriptions.items():
-            sanitized_desc = sanitize_literal(desc)
-            safe_add_multilingual_property(class_uri, DCTERMS.description, sanitized_desc, lang)
-            safe_add_multilingual_property(class_uri, RDFS.comment, sanitized_desc, lang)
+        add_multilingual(class_uri, class_node.get_multilingual_title(), _CLASS_TITLE_PREDICATES)
+        add_multilingual(class_uri, class_node.get_multilingual_description(), _DESCRIPTION_PREDICATES)
 
         # Collect concepts and data elements connected to this class
-        class_concepts = []
-        class_data_elements = []
-        for conn_id in class_node.connections:
-            if conn_id in nodes:
-                connected_node = nodes[conn_id]
-                if connected_node.type == 'concept':
-                    class_concepts.append(connected_node)
-                elif connected_node.type == 'data_element':
-                    class_data_elements.append(connected_node)
+        class_connections = connected_by_type(class_node)
+        class_concepts = class_connections['concept']
+        class_data_elements = class_connections['data_element']
 
         # Create property shapes for concepts belonging to this class
         class_property_uris = []
@@ -1731,208 +2295,23 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
             concept_id = node_export_id(concept)
             property_uri = URIRef(f"{i14y_ns}{class_type_id}/{concept_id}")
 
-            # Create PropertyShape
-            g.add((property_uri, RDF.type, SH.PropertyShape))
-            g.add((property_uri, RDF.type, OWL.DatatypeProperty))
-            g.add((property_uri, SH.path, property_uri))
-            
-            # Fix datatype syntax - use XSD namespace properly
-            if concept.datatype:
-                if concept.datatype.startswith('xsd:'):
-                    datatype_name = concept.datatype.split(':')[1]
-                    g.add((property_uri, SH.datatype, getattr(XSD, datatype_name)))
-                else:
-                    g.add((property_uri, SH.datatype, URIRef(concept.datatype)))
-            else:
-                g.add((property_uri, SH.datatype, XSD.string))  # Default to string
-
-            # Add I14Y concept reference if available
-            safe_add_conforms_to(property_uri, concept)
-
-            # Add advanced SHACL constraints
-            if concept.min_count is not None:
-                g.add((property_uri, SH.minCount, Literal(concept.min_count, datatype=XSD.integer)))
-            if concept.max_count is not None:
-                g.add((property_uri, SH.maxCount, Literal(concept.max_count, datatype=XSD.integer)))
-            if concept.min_length is not None:
-                g.add((property_uri, SH.minLength, Literal(concept.min_length, datatype=XSD.integer)))
-            if concept.max_length is not None:
-                g.add((property_uri, SH.maxLength, Literal(concept.max_length, datatype=XSD.integer)))
-            if concept.pattern:
-                g.add((property_uri, SH.pattern, Literal(concept.pattern)))
-            if concept.range:
-                g.add((property_uri, RDFS.range, URIRef(concept.range)))
-
-            # Add enumeration values (sh:in)
-            if concept.in_values:
-                # Add QB:CodedProperty for enumerated values
-                g.add((property_uri, RDF.type, QB.CodedProperty))
-                
-                # Create RDF list for enumeration values using proper blank node references
-                list_items = []
-                for i, value in enumerate(concept.in_values):
-                    blank_node = BNode(f"autos{rdf_list_counter}")
-                    list_items.append(blank_node)
-                    rdf_list_counter += 1
-                
-                # Build the list from end to beginning
-                if list_items:
-                    # Set the head for sh:in
-                    g.add((property_uri, SH['in'], list_items[0]))
-                    
-                    # Create the list structure
-                    for i, current in enumerate(list_items):
-                        g.add((current, RDF.first, Literal(concept.in_values[i])))
-                        if i < len(list_items) - 1:
-                            g.add((current, RDF.rest, list_items[i + 1]))
-                        else:
-                            g.add((current, RDF.rest, RDF.nil))
-
-            # Add class reference (sh:node)
-            if concept.node_reference:
-                g.add((property_uri, SH.node, URIRef(concept.node_reference)))
-
-            # Add multilingual titles and descriptions
-            titles = concept.get_multilingual_title()
-            descriptions = concept.get_multilingual_description()
-
-            unique_titles = get_unique_lang_values(titles, sanitize_literal)
-            unique_descriptions = get_unique_lang_values(descriptions, sanitize_literal)
-
-            for lang, title in unique_titles.items():
-                sanitized_title = sanitize_literal(title)
-                safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
-                safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
-                safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
-
-            for lang, desc in unique_descriptions.items():
-                sanitized_desc = sanitize_literal(desc)
-                safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
-                safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
-                safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
-
+            add_property_shape(property_uri, concept, *concept_count_literals(concept, XSD.integer),
+                               integer_datatype=XSD.integer)
             class_property_uris.append(property_uri)
 
         # Create property shapes for data elements belonging to this class
         # Sort data elements by order field (if set), then by title
         class_data_elements_sorted = sorted(
             class_data_elements,
-            key=lambda de: (
-                de.order if de.order is not None else float('inf'),
-                get_text_value(de.title, 'de') if de.title else ""
-            )
+            key=data_element_sort_key
         )
         
         for data_element in class_data_elements_sorted:
             element_id = node_export_id(data_element)
             property_uri = URIRef(f"{i14y_ns}{class_type_id}/{element_id}")
 
-            # Create PropertyShape
-            g.add((property_uri, RDF.type, SH.PropertyShape))
-            g.add((property_uri, RDF.type, OWL.DatatypeProperty))
-            g.add((property_uri, SH.path, property_uri))
-            
-            # Fix datatype syntax - use XSD namespace properly
-            if data_element.datatype:
-                if data_element.datatype.startswith('xsd:'):
-                    datatype_name = data_element.datatype.split(':')[1]
-                    g.add((property_uri, SH.datatype, getattr(XSD, datatype_name)))
-                else:
-                    g.add((property_uri, SH.datatype, URIRef(data_element.datatype)))
-            else:
-                g.add((property_uri, SH.datatype, XSD.string))  # Default to string
-
-            # Add I14Y concept reference if the data element is linked to a concept
-            safe_add_conforms_to(property_uri, data_element)
-
-            # Get cardinality from edge if available
-            edge_id = f"{class_node.id}-{data_element.id}"
-            min_count = None
-            max_count = None
-            
-            if edges and edge_id in edges:
-                cardinality = edges[edge_id].get('cardinality', '1..1')
-                min_count, max_count = parse_cardinality(cardinality)
-            else:
-                # Try reverse edge
-                reverse_edge_id = f"{data_element.id}-{class_node.id}"
-                if edges and reverse_edge_id in edges:
-                    cardinality = edges[reverse_edge_id].get('cardinality', '1..1')
-                    min_count, max_count = parse_cardinality(cardinality)
-                else:
-                    # Fallback to node attributes
-                    min_count = data_element.min_count
-                    max_count = data_element.max_count
-                    
-            # Add cardinality constraints
-            if min_count is not None:
-                g.add((property_uri, SH.minCount, Literal(min_count)))
-            else:
-                g.add((property_uri, SH.minCount, Literal(1)))  # Default minCount for data elements
-                
-            if max_count is not None:
-                g.add((property_uri, SH.maxCount, Literal(max_count)))
-            if data_element.min_length is not None:
-                g.add((property_uri, SH.minLength, Literal(data_element.min_length)))
-            if data_element.max_length is not None:
-                g.add((property_uri, SH.maxLength, Literal(data_element.max_length)))
-            if data_element.pattern:
-                g.add((property_uri, SH.pattern, Literal(data_element.pattern)))
-            if data_element.range:
-                g.add((property_uri, RDFS.range, URIRef(data_element.range)))
-
-            # Add enumeration values (sh:in)
-            if data_element.in_values:
-                # Add QB:CodedProperty for enumerated values
-                g.add((property_uri, RDF.type, QB.CodedProperty))
-                
-                # Create RDF list for enumeration values using proper blank node references
-                list_items = []
-                for i, value in enumerate(data_element.in_values):
-                    blank_node = BNode(f"autos{rdf_list_counter}")
-                    list_items.append(blank_node)
-                    rdf_list_counter += 1
-                
-                # Build the list from end to beginning
-                if list_items:
-                    # Set the head for sh:in
-                    g.add((property_uri, SH['in'], list_items[0]))
-                    
-                    # Create the list structure
-                    for i, current in enumerate(list_items):
-                        g.add((current, RDF.first, Literal(data_element.in_values[i])))
-                        if i < len(list_items) - 1:
-                            g.add((current, RDF.rest, list_items[i + 1]))
-                        else:
-                            g.add((current, RDF.rest, RDF.nil))
-
-            # Add class reference (sh:node)
-            if data_element.node_reference:
-                g.add((property_uri, SH.node, URIRef(data_element.node_reference)))
-
-            # Add order property (sh:order) for sorting
-            if data_element.order is not None:
-                g.add((property_uri, SH.order, Literal(data_element.order)))
-
-            # Add multilingual titles and descriptions
-            element_titles = data_element.get_multilingual_title()
-            element_descriptions = data_element.get_multilingual_description()
-
-            unique_element_titles = get_unique_lang_values(element_titles, sanitize_literal)
-            unique_element_descriptions = get_unique_lang_values(element_descriptions, sanitize_literal)
-
-            for lang, title in unique_element_titles.items():
-                sanitized_title = sanitize_literal(title)
-                safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
-                safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
-                safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
-
-            for lang, desc in unique_element_descriptions.items():
-                sanitized_desc = sanitize_literal(desc)
-                safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
-                safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
-                safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
-
+            add_property_shape(property_uri, data_element, *data_element_count_literals(class_node, data_element),
+                               include_order=True)
             class_property_uris.append(property_uri)
 
         # Add properties to the class NodeShape
@@ -1947,85 +2326,8 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
         concept_id = node_export_id(concept)
         property_uri = URIRef(f"{i14y_ns}{dataset_id}/{concept_id}")
 
-        # Create PropertyShape
-        g.add((property_uri, RDF.type, SH.PropertyShape))
-        g.add((property_uri, RDF.type, OWL.DatatypeProperty))
-        g.add((property_uri, RDF.type, QB.AttributeProperty))
-        g.add((property_uri, SH.path, property_uri))
-        # Fix datatype syntax - use XSD namespace properly
-        if concept.datatype:
-            if concept.datatype.startswith('xsd:'):
-                datatype_name = concept.datatype.split(':')[1]
-                g.add((property_uri, SH.datatype, getattr(XSD, datatype_name)))
-            else:
-                g.add((property_uri, SH.datatype, URIRef(concept.datatype)))
-        else:
-            g.add((property_uri, SH.datatype, XSD.string))  # Default to string
-
-        # Add I14Y concept reference if available
-        safe_add_conforms_to(property_uri, concept)
-
-        # Add advanced SHACL constraints
-        if concept.min_count is not None:
-            g.add((property_uri, SH.minCount, Literal(concept.min_count)))
-        if concept.max_count is not None:
-            g.add((property_uri, SH.maxCount, Literal(concept.max_count)))
-        if concept.min_length is not None:
-            g.add((property_uri, SH.minLength, Literal(concept.min_length)))
-        if concept.max_length is not None:
-            g.add((property_uri, SH.maxLength, Literal(concept.max_length)))
-        if concept.pattern:
-            g.add((property_uri, SH.pattern, Literal(concept.pattern)))
-        if concept.range:
-            g.add((property_uri, RDFS.range, URIRef(concept.range)))
-
-        # Add enumeration values (sh:in)
-        if concept.in_values:
-            # Add QB:CodedProperty for enumerated values
-            g.add((property_uri, RDF.type, QB.CodedProperty))
-            
-            # Create RDF list for enumeration values using proper blank node references
-            list_items = []
-            for i, value in enumerate(concept.in_values):
-                blank_node = BNode(f"autos{rdf_list_counter}")
-                list_items.append(blank_node)
-                rdf_list_counter += 1
-            
-            # Build the list from end to beginning
-            if list_items:
-                # Set the head for sh:in
-                g.add((property_uri, SH['in'], list_items[0]))
-                
-                # Create the list structure
-                for i, current in enumerate(list_items):
-                    g.add((current, RDF.first, Literal(concept.in_values[i])))
-                    if i < len(list_items) - 1:
-                        g.add((current, RDF.rest, list_items[i + 1]))
-                    else:
-                        g.add((current, RDF.rest, RDF.nil))
-
-        # Add class reference (sh:node)
-        if concept.node_reference:
-            g.add((property_uri, SH.node, URIRef(concept.node_reference)))
-
-        # Add multilingual titles and descriptions
-        titles = concept.get_multilingual_title()
-        descriptions = concept.get_multilingual_description()
-
-        unique_titles = get_unique_lang_values(titles, sanitize_literal)
-        unique_descriptions = get_unique_lang_values(descriptions, sanitize_literal)
-
-        for lang, title in unique_titles.items():
-            sanitized_title = sanitize_literal(title)
-            safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
-            safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
-            safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
-
-        for lang, desc in unique_descriptions.items():
-            sanitized_desc = sanitize_literal(desc)
-            safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
-            safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
-            safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
+        add_property_shape(property_uri, concept, *concept_count_literals(concept),
+                           extra_types=(QB.AttributeProperty,))
 
         # Add to dataset properties
         g.add((dataset_shape, SH.property, property_uri))
@@ -2033,149 +2335,43 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
     # Sort data elements by order field (if set), then by title
     connected_data_elements_sorted = sorted(
         connected_data_elements,
-        key=lambda de: (
-            de.order if de.order is not None else float('inf'),
-            get_text_value(de.title, 'de') if de.title else ""
-        )
+        key=data_element_sort_key
     )
     
     for data_element in connected_data_elements_sorted:
         element_id = node_export_id(data_element)
         property_uri = URIRef(f"{i14y_ns}{dataset_id}/{element_id}")
 
-        # Create PropertyShape
-        g.add((property_uri, RDF.type, SH.PropertyShape))
-        g.add((property_uri, RDF.type, OWL.DatatypeProperty))
-        g.add((property_uri, SH.path, property_uri))
-        
-        # Fix datatype syntax - use XSD namespace properly
-        if data_element.datatype:
-            if data_element.datatype.startswith('xsd:'):
-                datatype_name = data_element.datatype.split(':')[1]
-                g.add((property_uri, SH.datatype, getattr(XSD, datatype_name)))
-            else:
-                g.add((property_uri, SH.datatype, URIRef(data_element.datatype)))
-        else:
-            g.add((property_uri, SH.datatype, XSD.string))  # Default to string
+        add_property_shape(property_uri, data_element, *data_element_count_literals(dataset_node, data_element),
+                           include_order=True)
+
+        # Add to dataset properties
+        g.add((dataset_shape, SH.property, property_uri))
+    for class_node in connected_classes:
+        class_id = node_export_id(class_node)
+        class_type_id = class_id if class_id.lower().endswith("type") else f"{class_id}Type"
+        class_uri = class_properties[class_node.id]
+        # Create a property shape that references the class
+        property_uri = URIRef(f"{i14y_ns}{dataset_id}/{class_id}")
 
-        # Add I14Y concept reference if the data element is linked to a concept
-        safe_add_conforms_to(property_uri, data_element)
+        # Create PropertyShape for class
+        g.add((property_uri, RDF.type, SH.PropertyShape))
+        g.add((property_uri, RDF.type, OWL.ObjectProperty))
+        # Object-property path points to the class resource path in i14y namespace.
+        g.add((property_uri, SH.path, URIRef(f"{i14y_ns}{class_id}")))
 
-        # Get cardinality from edge if available
-        edge_id = f"{dataset_node.id}-{data_element.id}"
-        min_count = None
-        max_count = None
-        
-        if edges and edge_id in edges:
-            cardinality = edges[edge_id].get('cardinality', '1..1')
-            min_count, max_count = parse_cardinality(cardinality)
-        else:
-            # Try reverse edge
-            reverse_edge_id = f"{data_element.id}-{dataset_node.id}"
-            if edges and reverse_edge_id in edges:
-                cardinality = edges[reverse_edge_id].get('cardinality', '1..1')
-                min_count, max_count = parse_cardinality(cardinality)
-            else:
-                # Fallback to node attributes
-                min_count = data_element.min_count
-                max_count = data_element.max_count
-                
-        # Add cardinality constraints
-        if min_count is not None:
-            g.add((property_uri, SH.minCount, Literal(min_count)))
-        else:
-            g.add((property_uri, SH.minCount, Literal(1)))  # Default minCount for data elements
-            
-        if max_count is not None:
-            g.add((property_uri, SH.maxCount, Literal(max_count)))
-        if data_element.min_length is not None:
-            g.add((property_uri, SH.minLength, Literal(data_element.min_length)))
-        if data_element.max_length is not None:
-            g.add((property_uri, SH.maxLength, Literal(data_element.max_length)))
-        if data_element.pattern:
-            g.add((property_uri, SH.pattern, Literal(data_element.pattern)))
-        if data_element.range:
-            g.add((property_uri, RDFS.range, URIRef(data_element.range)))
-
-        # Add enumeration values (sh:in)
-        if data_element.in_values:
-            # Add QB:CodedProperty for enumerated values
-            g.add((property_uri, RDF.type, QB.CodedProperty))
-            
-            # Create RDF list for enumeration values using proper blank node references
-            list_items = []
-            for i, value in enumerate(data_element.in_values):
-                blank_node = BNode(f"autos{rdf_list_counter}")
-                list_items.append(blank_node)
-                rdf_list_counter += 1
-            
-            # Build the list from end to beginning
-            if list_items:
-                # Set the head for sh:in
-                g.add((property_uri, SH['in'], list_items[0]))
-                
-                # Create the list structure
-                for i, current in enumerate(list_items):
-                    g.add((current, RDF.first, Literal(data_element.in_values[i])))
-                    if i < len(list_items) - 1:
-                        g.add((current, RDF.rest, list_items[i + 1]))
-                    else:
-                        g.add((current, RDF.rest, RDF.nil))
-
-        # Add class reference (sh:node)
-        if data_element.node_reference:
-            g.add((property_uri, SH.node, URIRef(data_element.node_reference)))
-
-        # Add order property (sh:order) for sorting
-        if data_element.order is not None:
-            g.add((property_uri, SH.order, Literal(data_element.order)))
-
-        # Add multilingual titles and descriptions for data elements
-        element_titles = data_element.get_multilingual_title()
-        element_descriptions = data_element.get_multilingual_description()
-
-        unique_element_titles = get_unique_lang_values(element_titles, sanitize_literal)
-        unique_element_descriptions = get_unique_lang_values(element_descriptions, sanitize_literal)
-
-        for lang, title in unique_element_titles.items():
-            sanitized_title = sanitize_literal(title)
-            safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
-            safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
-            safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
-
-        for lang, desc in unique_element_descriptions.items():
-            sanitized_desc = sanitize_literal(desc)
-            safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
-            safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
-            safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
-
-        # Add to dataset properties
-        g.add((dataset_shape, SH.property, property_uri))
-    for class_node in connected_classes:
-        class_id = node_export_id(class_node)
-        class_type_id = class_id if class_id.lower().endswith("type") else f"{class_id}Type"
-        class_uri = class_properties[class_node.id]
-        # Create a property shape that references the class
-        property_uri = URIRef(f"{i14y_ns}{dataset_id}/{class_id}")
-
-        # Create PropertyShape for class
-        g.add((property_uri, RDF.type, SH.PropertyShape))
-        g.add((property_uri, RDF.type, OWL.ObjectProperty))
-        # Object-property path points to the class resource path in i14y namespace.
-        g.add((property_uri, SH.path, URIRef(f"{i14y_ns}{class_id}")))
-
-        # Add advanced SHACL constraints for classes
-        if class_node.min_count is not None:
-            g.add((property_uri, SH.minCount, Literal(class_node.min_count)))
+        # Add advanced SHACL constraints for classes
+        if class_node.min_count is not None:
+            g.add((property_uri, SH.minCount, cached_literal(class_node.min_count)))
         else:
             # Add default minCount 1 for class references to indicate 1:1 relationship
-            g.add((property_uri, SH.minCount, Literal(1)))
+            g.add((property_uri, SH.minCount, LITERAL_ONE))
             
         if class_node.max_count is not None:
-            g.add((property_uri, SH.maxCount, Literal(class_node.max_count)))
+            g.add((property_uri, SH.maxCount, cached_literal(class_node.max_count)))
         else:
             # Add default maxCount 1 for class references to indicate 1:1 relationship
-            g.add((property_uri, SH.maxCount, Literal(1)))
+            g.add((property_uri, SH.maxCount, LITERAL_ONE))
 
         # Link to the class NodeShape using sh:node (recommended for I14Y)
         g.add((property_uri, SH.node, class_uri))
@@ -2186,672 +2382,21 @@ def generate_full_ttl(nodes: Dict[str, SHACLNode], base_uri: str, edges: Dict[st
         if not titles or not any(titles.values()):
             titles = {lang: class_node.title for lang in ['de', 'fr', 'it', 'en']}
         
-        unique_titles = get_unique_lang_values(titles, sanitize_literal)
-        for lang, title in unique_titles.items():
-            sanitized_title = sanitize_literal(title)
-            safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
-            safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
-            safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
+        add_multilingual(property_uri, titles, _PROPERTY_TITLE_PREDICATES)
 
         # Add to dataset properties
         g.add((dataset_shape, SH.property, property_uri))
 
-    # Serialize to TTL format with custom prefixes
-    ttl_content = g.serialize(format='turtle', encoding='utf-8').decode('utf-8')
-
-    # Clean up duplicate prefixes and organize the output
-    lines = ttl_content.split('\n')
-    seen_prefixes = set()
-    cleaned_lines = []
-    data_lines = []
-
-    for line in lines:
-        if line.startswith('@prefix'):
-            prefix_name = line.split(':')[0].replace('@prefix ', '')
-            if prefix_name not in seen_prefixes:
-                seen_prefixes.add(prefix_name)
-                cleaned_lines.append(line)
-        elif line.strip():
-            data_lines.append(line)
-
-    # Add our custom prefixes first
-    custom_prefixes = f"""@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>.
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#>.
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#>.
-@prefix xml: <http://www.w3.org/XML/1998/namespace>.
-@prefix QB: <http://purl.org/linked-data/cube#>.
-@prefix dcterms: <http://purl.org/dc/terms/>.
-@prefix i14y: <https://register.ld.admin.ch/i14y/dataset/{dataset_id}/structure/>.
-@prefix owl: <http://www.w3.org/2002/07/owl#>.
-@prefix pav: <http://purl.org/pav/>.
-@prefix schema: <https://schema.org/>.
-@prefix sh: <http://www.w3.org/ns/shacl#>.
-
-"""
-
-    return custom_prefixes + '\n'.join(data_lines) + '\n'
-    
-    def add_custom_concept(self, title, description):
-        """Add a custom concept node (Flask version) - returns node_id"""
-        concept_node = SHACLNode('concept', title=title, description=description or "")
-        self.nodes[concept_node.id] = concept_node
-        
-        # Only connect to dataset if no parent is specified (handled in Flask app)
-        # This prevents automatic dataset connection when adding to a class
-        return concept_node.id
-    
-    def add_i14y_concept(self, concept_data):
-        """Add an I14Y concept node (Flask version) - returns node_id"""
-        if not concept_data:
-            raise ValueError("No concept data provided")
-        
-        concept_id = concept_data.get('id')
-        if not concept_id:
-            raise ValueError("Concept ID is required")
-        
-        # Extract title from multilingual data
-        title_data = concept_data.get('title', {})
-        if isinstance(title_data, dict):
-            title = title_data.get('de') or title_data.get('fr') or title_data.get('it') or title_data.get('en') or str(title_data)
-        else:
-            title = str(title_data) if title_data else f"Concept {concept_id}"
-        
-        # Extract description from multilingual data
-        desc_data = concept_data.get('description', {})
-        if isinstance(desc_data, dict):
-            description = desc_data.get('de') or desc_data.get('fr') or desc_data.get('it') or desc_data.get('en') or ""
-        else:
-            description = str(desc_data) if desc_data else ""
-        
-        # Create SHACL node
-        shacl_node = SHACLNode('concept', title=title, description=description, i14y_id=concept_id)
-        
-        # Extract constraints from I14Y concept
-        try:
-            constraints = self.api_client.extract_constraints_from_concept(concept_data)
-            if constraints:
-                # Apply constraints to the node
-                if 'pattern' in constraints:
-                    shacl_node.pattern = constraints['pattern']
-                if 'in_values' in constraints:
-                    shacl_node.in_values = constraints['in_values']
-                if 'min_length' in constraints:
-                    shacl_node.min_length = constraints['min_length']
-                if 'max_length' in constraints:
-                    shacl_node.max_length = constraints['max_length']
-                if 'datatype' in constraints:
-                    shacl_node.datatype = constraints['datatype']
-        except Exception as e:
-            print(f"Warning: Could not extract constraints from I14Y concept: {e}")
-        
-        self.nodes[shacl_node.id] = shacl_node
-        
-        # Only connect to dataset if no parent is specified (handled in Flask app)
-        # This prevents automatic dataset connection when adding to a class
-        return shacl_node.id
-    
-    def update_graph(self):
-        """Update the graph visualization"""
-        self.ax.clear()
-        
-        if not self.nodes:
-            self.canvas.draw()
-            return
-        
-        # Create NetworkX graph
-        G = nx.Graph()
-        
-        # Add nodes
-        for node in self.nodes.values():
-            G.add_node(node.id, label=node.title, type=node.type)
-        
-        # Add edges
-        for node in self.nodes.values():
-            for conn_id in node.connections:
-                if conn_id in self.nodes:
-                    G.add_edge(node.id, conn_id)
-        
-        # Calculate layout
-        if len(G.nodes()) > 0:
-            pos = nx.spring_layout(G, k=2, iterations=50)
-        else:
-            pos = {}
-        
-        # Define colors for different node types
-        node_colors = []
-        for node_id in G.nodes():
-            node = self.nodes[node_id]
-            if node.type == 'dataset':
-                color = '#87CEFA'  # Light blue
-            elif node.type == 'concept':
-                color = '#99ccff'  # Light blue
-            elif node.type == 'class':
-                color = '#99ff99'  # Light green
-            else:
-                color = '#ffffff'
-            
-            # Highlight selected nodes
-            if node_id in self.selected_nodes:
-                color = '#ffff00'  # Yellow for selected
-            
-            node_colors.append(color)
-        
-        # Draw the graph
-        if pos:
-            nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
-                                 node_size=1000, ax=self.ax)
-            nx.draw_networkx_edges(G, pos, ax=self.ax)
-            
-            # Draw labels
-            labels = {node_id: self.nodes[node_id].title[:15] + ('...' if len(self.nodes[node_id].title) > 15 else '') 
-                     for node_id in G.nodes()}
-            nx.draw_networkx_labels(G, pos, labels, font_size=8, ax=self.ax)
-        
-        self.ax.set_title("SHACL Graph Structure")
-        self.ax.axis('off')
-        
-        # Store positions for click detection
-        self.node_positions = pos
-        
-        self.canvas.draw()
-    
-    def on_node_click(self, event):
-        """Handle node clicks"""
-        if event.inaxes != self.ax or not self.node_positions:
-            return
-        
-        # Find closest node
-        click_x, click_y = event.xdata, event.ydata
-        if click_x is None or click_y is None:
-            return
-        
-        min_dist = float('inf')
-        closest_node = None
-        
-        for node_id, (x, y) in self.node_positions.items():
-            dist = ((click_x - x) ** 2 + (click_y - y) ** 2) ** 0.5
-            if dist < min_dist and dist < 0.1:  # Threshold for node selection
-                min_dist = dist
-                closest_node = node_id
-        
-        if closest_node:
-            if event.button == 1:  # Left click
-                if closest_node in self.selected_nodes:
-                    self.selected_nodes.remove(closest_node)
-                else:
-                    self.selected_nodes.add(closest_node)
-                
-                self.update_graph()
-                self.update_info_panel()
-    
-    def update_info_panel(self):
-        """Update the info panel with selected node information"""
-        self.info_text.delete('1.0', 'end')
-        
-        if not self.selected_nodes:
-            self.info_text.insert('end', "No node selected")
-            # Clear constraint fields
-            self.clear_constraint_fields()
-            return
-        
-        for node_id in self.selected_nodes:
-            node = self.nodes[node_id]
-            info = f"Type: {node.type.capitalize()}\n"
-            info += f"Title: {node.title}\n"
-            info += f"Description: {node.description}\n"
-            
-            if node.i14y_id:
-                info += f"I14Y ID: {node.i14y_id}\n"
-            
-            if node.connections:
-                info += f"Connections: {len(node.connections)}\n"
-            
-            info += "\n" + "-" * 30 + "\n\n"
-            
-            self.info_text.insert('end', info)
-        
-        # Update constraint fields if a single node is selected
-        if len(self.selected_nodes) == 1:
-            node_id = list(self.selected_nodes)[0]
-            node = self.nodes[node_id]
-            self.update_constraint_fields(node)
-        else:
-            self.clear_constraint_fields()
-    
-    def update_constraint_fields(self, node):
-        """Update constraint input fields with node values"""
-        # Cardinality
-        self.min_count_var.set(str(node.min_count) if node.min_count is not None else "")
-        self.max_count_var.set(str(node.max_count) if node.max_count is not None else "")
-        
-        # Length
-        self.min_length_var.set(str(node.min_length) if node.min_length is not None else "")
-        self.max_length_var.set(str(node.max_length) if node.max_length is not None else "")
-        
-        # Pattern
-        self.pattern_var.set(node.pattern or "")
-        
-        # Enumeration values
-        self.in_values_var.set(", ".join(node.in_values) if node.in_values else "")
-        
-        # Class reference
-        self.node_ref_var.set(node.node_reference or "")
-        
-        # Range
-        self.range_var.set(node.range or "")
-    
-    def clear_constraint_fields(self):
-        """Clear all constraint input fields"""
-        self.min_count_var.set("")
-        self.max_count_var.set("")
-        self.min_length_var.set("")
-        self.max_length_var.set("")
-        self.pattern_var.set("")
-        self.in_values_var.set("")
-        self.node_ref_var.set("")
-        self.range_var.set("")
-    
-    def apply_constraints(self):
-        """Apply constraint changes to selected node"""
-        if len(self.selected_nodes) != 1:
-            messagebox.showwarning("Selection Error", "Please select exactly one node to apply constraints.")
-            return
-        
-        node_id = list(self.selected_nodes)[0]
-        node = self.nodes[node_id]
-        
-        try:
-            # Apply cardinality constraints
-            min_count_text = self.min_count_var.get().strip()
-            max_count_text = self.max_count_var.get().strip()
-            
-            node.min_count = int(min_count_text) if min_count_text else None
-            node.max_count = int(max_count_text) if max_count_text else None
-            
-            # Apply length constraints
-            min_length_text = self.min_length_var.get().strip()
-            max_length_text = self.max_length_var.get().strip()
-            
-            node.min_length = int(min_length_text) if min_length_text else None
-            node.max_length = int(max_length_text) if max_length_text else None
-            
-            # Apply pattern
-            node.pattern = self.pattern_var.get().strip() or None
-            
-            # Apply enumeration values
-            in_values_text = self.in_values_var.get().strip()
-            if in_values_text:
-                # Split by comma and strip whitespace
-                raw_values = [v.strip() for v in in_values_text.split(",") if v.strip()]
-                # Sort values (numerically if all numeric, else alphabetically)
-                node.in_values = sort_enumeration_values(raw_values)
-            else:
-                node.in_values = []
-            
-            # Apply class reference
-            node.node_reference = self.node_ref_var.get().strip() or None
-            
-            # Apply range
-            node.range = self.range_var.get().strip() or None
-            
-            messagebox.showinfo("Success", "SHACL constraints applied successfully!")
-            
-        except ValueError as e:
-            messagebox.showerror("Input Error", f"Invalid numeric value: {str(e)}")
-    
-    def clear_constraints(self):
-        """Clear all constraints from selected node"""
-        if len(self.selected_nodes) != 1:
-            messagebox.showwarning("Selection Error", "Please select exactly one node to clear constraints.")
-            return
-        
-        node_id = list(self.selected_nodes)[0]
-        node = self.nodes[node_id]
-        
-        # Clear all constraints
-        node.min_count = None
-        node.max_count = None
-        node.min_length = None
-        node.max_length = None
-        node.pattern = None
-        node.in_values = []
-        node.node_reference = None
-        node.range = None
-        
-        # Update UI
-        self.clear_constraint_fields()
-        
-        messagebox.showinfo("Success", "All SHACL constraints cleared!")
-    
-    def remove_selected(self):
-        """Remove selected nodes"""
-        if not self.selected_nodes:
-            messagebox.showwarning("No Selection", "Please select nodes to remove.")
-            return
-        
-        # Don't allow removing the dataset node
-        dataset_nodes = [node_id for node_id in self.selected_nodes 
-                        if self.nodes[node_id].type == 'dataset']
-        if dataset_nodes:
-            messagebox.showwarning("Cannot Remove", "Cannot remove the dataset node.")
-            return
-        
-        # Remove connections first
-        for node_id in self.selected_nodes:
-            node = self.nodes[node_id]
-            for conn_id in list(node.connections):
-                if conn_id in self.nodes:
-                    self.nodes[conn_id].connections.discard(node_id)
-        
-        # Remove nodes
-        for node_id in self.selected_nodes:
-            del self.nodes[node_id]
-        
-        self.selected_nodes.clear()
-        self.update_graph()
-        self.update_info_panel()
-    
-    def connect_nodes(self):
-        """Connect selected nodes"""
-        if len(self.selected_nodes) != 2:
-            messagebox.showwarning("Invalid Selection", "Please select exactly 2 nodes to connect.")
-            return
-        
-        node_ids = list(self.selected_nodes)
-        node1, node2 = self.nodes[node_ids[0]], self.nodes[node_ids[1]]
-        
-        node1.connections.add(node2.id)
-        node2.connections.add(node1.id)
-        
-        self.update_graph()
-    
-    def disconnect_nodes(self):
-        """Disconnect selected nodes"""
-        if len(self.selected_nodes) != 2:
-            messagebox.showwarning("Invalid Selection", "Please select exactly 2 connected nodes to disconnect.")
-            return
-        
-        node_ids = list(self.selected_nodes)
-        node1, node2 = self.nodes[node_ids[0]], self.nodes[node_ids[1]]
-        
-        node1.connections.discard(node2.id)
-        node2.connections.discard(node1.id)
-        
-        self.update_graph()
-    
-    def export_ttl(self):
-        """Export the graph as TTL file"""
-        if not self.nodes:
-            messagebox.showwarning("No Data", "No data to export.")
-            return
-        
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".ttl",
-            filetypes=[("Turtle files", "*.ttl"), ("All files", "*.*")]
-        )
-        
-        if not file_path:
-            return
-        
-        ttl_content = self.generate_ttl()
-        
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(ttl_content)
-            messagebox.showinfo("Export Successful", f"TTL file exported to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting TTL file: {str(e)}")
-    
-    def save_project(self):
-        """Save the current project"""
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-        )
-        
-        if not file_path:
-            return
-        
-        project_data = {
-            'nodes': {node_id: node.to_dict() for node_id, node in self.nodes.items()},
-            'dataset_title': self.dataset_title_var.get(),
-            'dataset_description': self.dataset_desc_var.get(),
-            'created': datetime.now().isoformat()
-        }
-        
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2)
-            messagebox.showinfo("Save Successful", f"Project saved to {file_path}")
-        except Exception as e:
-            messagebox.showerror("Save Error", f"Error saving project: {str(e)}")
-    
-    def load_project(self):
-        """Load a project from file"""
-        file_path = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
-            
-            # Clear current data
-            self.nodes.clear()
-            self.selected_nodes.clear()
-            
-            # Load nodes
-            for node_id, node_data in project_data.get('nodes', {}).items():
-                self.nodes[node_id] = SHACLNode.from_dict(node_data)
-            
-            # Update UI
-            self.dataset_title_var.set(project_data.get('dataset_title', ''))
-            self.dataset_desc_var.set(project_data.get('dataset_description', ''))
-            
-            self.update_graph()
-            self.update_info_panel()
-            
-            messagebox.showinfo("Load Successful", f"Project loaded from {file_path}")
-        except Exception as e:
-            messagebox.showerror("Load Error", f"Error loading project: {str(e)}")
-    
-    def import_ttl(self):
-        """Import SHACL schema from TTL file"""
-        file_path = filedialog.askopenfilename(
-            filetypes=[("Turtle files", "*.ttl"), ("All files", "*.*")]
-        )
-        
-        if not file_path:
-            return
-        
-        try:
-            # Clear current data
-            self.nodes.clear()
-            self.selected_nodes.clear()
-            
-            # Parse TTL file
-            from rdflib import Graph, Namespace, RDF, RDFS, SH, DCTERMS, XSD
-            
-            g = Graph()
-            g.parse(file_path, format='turtle')
-            
-            # Extract SHACL information
-            self._extract_shacl_from_graph(g)
-            
-            # Update UI
-            self.update_graph()
-            self.update_info_panel()
-            
-            messagebox.showinfo("Import Successful", f"TTL file imported from {file_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Import Error", f"Error importing TTL file: {str(e)}")
-    
-    def load_example_ttl(self):
-        """Load the example working.ttl file"""
-        file_path = "/home/this/Dokumente/bfs/shacl-creator/working.ttl"
-        if not os.path.exists(file_path):
-            messagebox.showerror("File Not Found", f"Example file not found: {file_path}")
-            return
-        
-        try:
-            # Clear current data
-            self.nodes.clear()
-            self.selected_nodes.clear()
-            
-            # Parse TTL file
-            from rdflib import Graph
-            
-            g = Graph()
-            g.parse(file_path, format='turtle')
-            
-            # Extract SHACL information
-            self._extract_shacl_from_graph(g)
-            
-            # Update UI
-            self.update_graph()
-            self.update_info_panel()
-            
-            messagebox.showinfo("Load Successful", f"Example TTL file loaded from {file_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Load Error", f"Error loading example TTL file: {str(e)}")
-    
-    def _extract_shacl_from_graph(self, g):
-        """Extract SHACL information from RDF graph and create SHACLNode objects"""
-        from rdflib import Namespace, RDF, RDFS, SH, DCTERMS, XSD, URIRef, Literal
-        from rdflib.namespace import OWL
-        
-        # Find the main dataset NodeShape
-        dataset_shape = None
-        for s, p, o in g.triples((None, RDF.type, SH.NodeShape)):
-            # Look for the main dataset shape (usually has sh:property but not sh:path)
-            if (s, SH.path, None) not in g and (s, SH.property, None) in g:
-                dataset_shape = s
-                break
-        
-        if not dataset_shape:
-            raise ValueError("No main dataset NodeShape found in TTL file")
-        
-        # Create dataset node
-        dataset_node = SHACLNode('dataset', title=str(dataset_shape).split('/')[-1])
-        
-        # Extract dataset metadata
-        for p, o in g.predicate_objects(dataset_shape):
-            if p == DCTERMS.title:
-                if hasattr(o, 'language') and o.language:
-                    # Handle multilingual titles
-                    if o.language == 'de':
-                        dataset_node.title = str(o)
-                    elif o.language == 'fr':
-                        dataset_node.description = str(o)  # Use description for French
-                else:
-                    dataset_node.title = str(o)
-            elif p == DCTERMS.description:
-                if hasattr(o, 'language') and o.language:
-                    if o.language == 'de':
-                        dataset_node.description = str(o)
-                else:
-                    dataset_node.description = str(o)
-        
-        self.nodes[dataset_node.id] = dataset_node
-        
-        # Extract property shapes
-        property_shapes = []
-        for s, p, o in g.triples((dataset_shape, SH.property, None)):
-            property_shapes.append(o)
-        
-        # Process each property shape
-        for prop_shape in property_shapes:
-            # Get property path
-            path = None
-            for s, p, o in g.triples((prop_shape, SH.path, None)):
-                path = o
-                break
-            
-            if not path:
-                continue
-            
-            # Determine if it's a datatype or object property
-            is_object_property = False
-            for s, p, o in g.triples((prop_shape, RDF.type, OWL.ObjectProperty)):
-                is_object_property = True
-                break
-            
-            # Create concept or class node
-            node_type = 'class' if is_object_property else 'concept'
-            node_title = str(path).split('/')[-1]
-            
-            shacl_node = SHACLNode(node_type, title=node_title)
-            
-            # Extract constraints
-            for p, o in g.predicate_objects(prop_shape):
-                if p == SH.minCount:
-                    shacl_node.min_count = int(o)
-                elif p == SH.maxCount:
-                    shacl_node.max_count = int(o)
-                elif p == SH.minLength:
-                    shacl_node.min_length = int(o)
-                elif p == SH.maxLength:
-                    shacl_node.max_length = int(o)
-                elif p == SH.pattern:
-                    shacl_node.pattern = str(o)
-                elif p == SH.datatype:
-                    shacl_node.datatype = str(o)
-                elif p == RDFS.range:
-                    shacl_node.range = str(o)
-                elif p == SH.node:
-                    shacl_node.node_reference = str(o)
-                elif p == SH['in']:
-                    # Extract RDF list values and sort them
-                    extracted_values = self._extract_rdf_list(g, o)
-                    shacl_node.in_values = sort_enumeration_values(extracted_values)
-                elif p == DCTERMS.title:
-                    if hasattr(o, 'language') and o.language:
-                        if o.language == 'de':
-                            shacl_node.title = str(o)
-                    else:
-                        shacl_node.title = str(o)
-                elif p == DCTERMS.description:
-                    if hasattr(o, 'language') and o.language:
-                        if o.language == 'de':
-                            shacl_node.description = str(o)
-                    else:
-                        shacl_node.description = str(o)
-            
-            self.nodes[shacl_node.id] = shacl_node
-            
-            # Connect to dataset
-            dataset_node.connections.add(shacl_node.id)
-            shacl_node.connections.add(dataset_node.id)
-    
-    def _extract_rdf_list(self, g, list_head):
-        """Extract values from RDF list (used for sh:in enumerations)"""
-        from rdflib import RDF
-        
-        values = []
-        current = list_head
-        
-        while current != RDF.nil:
-            # Get first value
-            for s, p, o in g.triples((current, RDF.first, None)):
-                values.append(str(o))
-                break
-            
-            # Get rest of list
-            rest = None
-            for s, p, o in g.triples((current, RDF.rest, None)):
-                rest = o
-                break
-            
-            if rest is None or rest == RDF.nil:
-                break
-            current = rest
-        
-        return values
+    # Serialize to TTL and drop rdflib's own prefix block; ours is prepended below
+    ttl_content = g.serialize(format='turtle', encoding='utf-8')
+    body_parts = [
+        line + b'\n'
+        for line in ttl_content.split(b'\n')
+        if line.strip() and not line.startswith(b'@prefix')
+    ]
+
+    header = _PREFIX_TEMPLATE % dataset_id.encode('utf-8')
+    return b''.join([header, *body_parts])
 
 #------------------------------------------------------------------------------
 # Flask Web Application
@@ -2870,6 +2415,56 @@ def _load_secret_key():
 app.secret_key = _load_secret_key()
 app.config['SESSION_PERMANENT'] = False
 app.config['SESSION_TYPE'] = 'filesystem'
+# Compact, unsorted JSON responses (also in debug mode)
+app.json.compact = True
+app.json.sort_keys = False
+
+
+def _orjson_default(obj):
+    """Serialize types orjson does not handle natively"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def ojsonify(obj, status=200):
+    """jsonify() replacement that encodes with orjson when it is installed"""
+    if orjson is None:
+        response = jsonify(obj)
+        response.status_code = status
+        return response
+    return app.response_class(
+        orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+_EMPTY_CONCEPTS_RESPONSE = b'{"concepts":[]}'
+_EMPTY_DATASETS_RESPONSE = b'{"datasets":[]}'
+
+
+def _not_modified(etag):
+    """Empty 304 response for a client that already holds the current ETag"""
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    return response
+
+
+def _search_query():
+    """Return the search text from the 'query' or 'q' request argument"""
+    return request.args.get('query') or request.args.get('q') or ''
+
+
+def _int_arg(name, default):
+    """Parse an integer request argument, falling back to a default when missing or invalid"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
 
 
 @app.route('/health')
@@ -2882,12 +2477,12 @@ def reset_structure_api():
     """Reset the structure to a new empty one with just a dataset node"""
     editor = get_user_editor()
     try:
-        print("API: Resetting project structure (via /api/reset)")
+        app.logger.debug("API: Resetting project structure (via /api/reset)")
         result = editor.reset_structure()
         if result:
             node_count = len(editor.nodes)
             edge_count = len(editor.edges)
-            print(f"Structure reset: {node_count} nodes, {edge_count} edges")
+            app.logger.debug("Structure reset: %s nodes, %s edges", node_count, edge_count)
             return jsonify({
                 "success": True,
                 "message": "Structure reset successfully",
@@ -2899,6 +2494,219 @@ def reset_structure_api():
     except Exception as e:
         return jsonify({"error": "Failed to reset structure"}), 500
 
+class IndexedDict(dict, metaclass=ABCMeta):
+    """
+    Dictionary that keeps secondary indexes in sync with its entries
+    
+    Subclasses implement _index(key, value), _unindex(key, value) and
+    _clear_indexes(); every mutating dict method routes through them.
+    """
+    
+    def __new__(cls, *args, **kwargs):
+        # dict.__new__ skips the abstract method check object.__new__ does
+        if cls.__abstractmethods__:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} without an implementation "
+                f"for {', '.join(sorted(cls.__abstractmethods__))}"
+            )
+        return super().__new__(cls, *args, **kwargs)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.update(*args, **kwargs)
+    
+    @abstractmethod
+    def _index(self, key, value):
+        """Add an entry to the secondary indexes"""
+    
+    @abstractmethod
+    def _unindex(self, key, value):
+        """Remove an entry from the secondary indexes"""
+    
+    @abstractmethod
+    def _clear_indexes(self):
+        """Reset the secondary indexes after the dict is cleared"""
+    
+    def __setitem__(self, key, value):
+        if key in self:
+            self._unindex(key, dict.__getitem__(self, key))
+        super().__setitem__(key, value)
+        self._index(key, value)
+    
+    def __delitem__(self, key):
+        self._unindex(key, dict.__getitem__(self, key))
+        super().__delitem__(key)
+    
+    def pop(self, key, *default):
+        if key in self:
+            self._unindex(key, dict.__getitem__(self, key))
+        return super().pop(key, *default)
+    
+    def popitem(self):
+        key, value = super().popitem()
+        self._unindex(key, value)
+        return key, value
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+    
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def clear(self):
+        super().clear()
+        self._clear_indexes()
+
+class NodeStore(IndexedDict):
+    """
+    Node dictionary keyed by node ID that also indexes node IDs by node type
+    
+    Node types are only changed through retype() so the index stays valid.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self.ids_by_type = defaultdict(set)  # node type -> set of node IDs
+        super().__init__(*args, **kwargs)
+    
+    def _index(self, node_id, node):
+        self.ids_by_type[getattr(node, 'type', None)].add(node_id)
+    
+    def _unindex(self, node_id, node):
+        ids = self.ids_by_type.get(getattr(node, 'type', None))
+        if ids is not None:
+            ids.discard(node_id)
+    
+    def _clear_indexes(self):
+        self.ids_by_type.clear()
+    
+    def retype(self, node_id, node_type):
+        """Change the type of a stored node"""
+        node = self[node_id]
+        self._unindex(node_id, node)
+        node.type = node_type
+        self._index(node_id, node)
+
+class EdgeStore(IndexedDict):
+    """
+    Edge dictionary keyed by edge ID that also indexes edges by their nodes
+    
+    Edges are undirected for lookup purposes, so the edge between two nodes can be
+    found in O(1) regardless of which node was stored as 'from' and which as 'to'.
+    
+    Edges are the source of truth for adjacency: once attached to a NodeStore,
+    each node's connections set is updated as edges are added and removed.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        self._edge_by_pair = {}  # frozenset({node1_id, node2_id}) -> edge ID
+        self._edges_by_endpoint = defaultdict(set)  # node ID -> set of edge IDs
+        self._nodes = None  # NodeStore whose connections mirror these edges
+        super().__init__(*args, **kwargs)
+    
+    def attach_nodes(self, nodes):
+        """Mirror the adjacency of these edges into the connections of the given nodes"""
+        self._nodes = nodes
+        for pair in self._edge_by_pair:
+            self._link(*self._pair_ends(pair))
+    
+    @staticmethod
+    def _endpoints(edge):
+        if not isinstance(edge, dict) or edge.get('from') is None or edge.get('to') is None:
+            return None
+        return edge['from'], edge['to']
+    
+    @staticmethod
+    def _pair_ends(pair):
+        ends = tuple(pair)
+        return ends if len(ends) == 2 else (ends[0], ends[0])
+    
+    def _link(self, node1_id, node2_id):
+        if self._nodes is None:
+            return
+        node1 = self._nodes.get(node1_id)
+        node2 = self._nodes.get(node2_id)
+        if node1 is not None and node2 is not None:
+            node1.connections.add(node2_id)
+            node2.connections.add(node1_id)
+    
+    def _unlink(self, node1_id, node2_id):
+        if self._nodes is None:
+            return
+        node1 = self._nodes.get(node1_id)
+        node2 = self._nodes.get(node2_id)
+        if node1 is not None:
+            node1.connections.discard(node2_id)
+        if node2 is not None:
+            node2.connections.discard(node1_id)
+    
+    def _other_edge_for(self, pair, exclude_id):
+        """Find another edge between the same two nodes, if any"""
+        for edge_id in self._edges_by_endpoint.get(next(iter(pair)), ()):
+            if edge_id != exclude_id and frozenset(self._endpoints(dict.__getitem__(self, edge_id))) == pair:
+                return edge_id
+        return None
+    
+    def _index(self, edge_id, edge):
+        endpoints = self._endpoints(edge)
+        if endpoints is None:
+            return
+        self._edge_by_pair[frozenset(endpoints)] = edge_id
+        for node_id in endpoints:
+            self._edges_by_endpoint[node_id].add(edge_id)
+        self._link(*endpoints)
+    
+    def _unindex(self, edge_id, edge):
+        endpoints = self._endpoints(edge)
+        if endpoints is None:
+            return
+        for node_id in endpoints:
+            edge_ids = self._edges_by_endpoint.get(node_id)
+            if edge_ids is not None:
+                edge_ids.discard(edge_id)
+                if not edge_ids:
+                    del self._edges_by_endpoint[node_id]
+        
+        # Another edge may still join the same nodes; keep it findable and
+        # only unlink the node connections once the last one is gone
+        pair = frozenset(endpoints)
+        remaining_id = self._other_edge_for(pair, edge_id)
+        if self._edge_by_pair.get(pair) == edge_id:
+            if remaining_id is not None:
+                self._edge_by_pair[pair] = remaining_id
+            else:
+                del self._edge_by_pair[pair]
+        if remaining_id is None:
+            self._unlink(*endpoints)
+    
+    def _clear_indexes(self):
+        for pair in self._edge_by_pair:
+            self._unlink(*self._pair_ends(pair))
+        self._edge_by_pair.clear()
+        self._edges_by_endpoint.clear()
+    
+    def edge_id_for(self, node1_id, node2_id):
+        """Return the ID of the edge between two nodes in either direction, or None"""
+        return self._edge_by_pair.get(frozenset((node1_id, node2_id)))
+    
+    def edge_between(self, node1_id, node2_id):
+        """Return the edge between two nodes in either direction, or None"""
+        edge_id = self._edge_by_pair.get(frozenset((node1_id, node2_id)))
+        return dict.__getitem__(self, edge_id) if edge_id is not None else None
+    
+    def edge_ids_for_node(self, node_id):
+        """Return the IDs of all edges touching a node"""
+        return set(self._edges_by_endpoint.get(node_id, ()))
+    
+    def add_edge(self, from_id, to_id, cardinality="1..1", edge_id=None, **attrs):
+        """Store a new edge between two nodes and return its ID"""
+        if edge_id is None:
+            edge_id = f"{from_id}-{to_id}"
+        self[edge_id] = {'id': edge_id, 'from': from_id, 'to': to_id, 'cardinality': cardinality, **attrs}
+        return edge_id
+
 class FlaskSHACLGraphEditor:
     """
     SHACL Graph Editor for Flask
@@ -2909,8 +2717,52 @@ class FlaskSHACLGraphEditor:
     def __init__(self):
         self.nodes = {}  # Dictionary of nodes keyed by ID
         self.edges = {}  # Dictionary of edges keyed by ID (format: "node1_id-node2_id")
-        self.i14y_client = I14YAPIClient()
+        self.i14y_client = i14y_client
         self.base_uri = "https://register.ld.admin.ch/i14y/dataset/shacl_editor/structure/"
+        self._dataset_node_id = None  # Cached ID of the (single) dataset node
+        # Revision for ETags: bumped by every request that may modify the editor;
+        # the random prefix keeps tags from different editor instances apart
+        self._revision = 0
+        self._etag_prefix = uuid.uuid4().hex[:12]
+        # Held for the whole of each request on this editor and by background
+        # imports while they swap in the imported structure
+        self.lock = threading.RLock()
+        self.pending_import = None  # ID of a background import job that will replace the structure
+    
+    def touch(self):
+        """Mark the editor state as (possibly) modified"""
+        self._revision += 1
+    
+    def etag_for(self, key):
+        """Return an ETag value for a resource that is valid until the next modification"""
+        return f"{self._etag_prefix}-{key}-{self._revision}"
+    
+    @property
+    def nodes(self):
+        return self._nodes
+    
+    @nodes.setter
+    def nodes(self, value):
+        # Always keep nodes in a NodeStore so the by-type index stays in sync
+        self._nodes = value if isinstance(value, NodeStore) else NodeStore(value or {})
+        if hasattr(self, '_edges'):
+            self._edges.attach_nodes(self._nodes)
+    
+    @property
+    def nodes_by_type(self):
+        """Node IDs grouped by node type"""
+        return self._nodes.ids_by_type
+    
+    @property
+    def edges(self):
+        return self._edges
+    
+    @edges.setter
+    def edges(self, value):
+        # Always keep edges in an EdgeStore so the node-pair index and the
+        # node connections stay in sync
+        self._edges = value if isinstance(value, EdgeStore) else EdgeStore(value or {})
+        self._edges.attach_nodes(self._nodes)
     
     def add_node(self, node_data):
         """Add a new node to the graph"""
@@ -2978,34 +2830,34 @@ class FlaskSHACLGraphEditor:
         if node_id not in self.nodes:
             return False
         
-        print(f"=== Deleting node {node_id} ===")
+        app.logger.debug("=== Deleting node %s ===", node_id)
         
         # First, find and remove all edges connected to this node
-        edges_to_delete = []
-        for edge_id, edge in self.edges.items():
-            if edge.get('from') == node_id or edge.get('to') == node_id:
-                edges_to_delete.append(edge_id)
-                print(f"Marking edge for deletion: {edge_id}")
+        edges_to_delete = self.edges.edge_ids_for_node(node_id)
+        for edge_id in edges_to_delete:
+            app.logger.debug("Marking edge for deletion: %s", edge_id)
         
         # Delete the edges
         for edge_id in edges_to_delete:
             del self.edges[edge_id]
-            print(f"Deleted edge: {edge_id}")
+            app.logger.debug("Deleted edge: %s", edge_id)
         
         # Remove connections to this node from other nodes
         for other_id, node in self.nodes.items():
             if node_id in node.connections:
                 node.connections.remove(node_id)
-                print(f"Removed connection from node {other_id} to {node_id}")
+                app.logger.debug("Removed connection from node %s to %s", other_id, node_id)
         
         # Delete the node itself
         deleted_node = self.nodes[node_id]
-        print(f"Deleting node: {deleted_node.type} - {deleted_node.title}")
+        app.logger.debug("Deleting node: %s - %s", deleted_node.type, deleted_node.title)
         del self.nodes[node_id]
+        if node_id == self._dataset_node_id:
+            self._dataset_node_id = None
         
-        print(f"Node {node_id} successfully deleted")
-        print(f"Remaining nodes: {len(self.nodes)}")
-        print(f"Remaining edges: {len(self.edges)}")
+        app.logger.debug("Node %s successfully deleted", node_id)
+        app.logger.debug("Remaining nodes: %s", len(self.nodes))
+        app.logger.debug("Remaining edges: %s", len(self.edges))
         
         return True
     
@@ -3015,6 +2867,17 @@ class FlaskSHACLGraphEditor:
             return self.nodes[node_id].to_dict()
         return None
     
+    def get_dataset_node(self):
+        """Get the dataset node, or None if the structure has none"""
+        # Nodes are also added and removed directly through self.nodes, so verify
+        # the cached ID and fall back to the type index when it is stale
+        node = self.nodes.get(self._dataset_node_id)
+        if node is not None and node.type == 'dataset':
+            return node
+        
+        self._dataset_node_id = next(iter(self.nodes_by_type.get('dataset', ())), None)
+        return self.nodes.get(self._dataset_node_id)
+    
     def get_node_by_id(self, node_id):
         """Get the actual node object by ID"""
         return self.nodes.get(node_id)
@@ -3036,24 +2899,20 @@ class FlaskSHACLGraphEditor:
         source_node = self.nodes[source_id]
         target_node = self.nodes[target_id]
         
-        print(f"Connecting: {source_node.type}({source_node.title}) → {target_node.type}({target_node.title})")
-            
-        # Add to connections set - bidirectional connection
-        source_node.connections.add(target_id)
-        target_node.connections.add(source_id)  # Add reverse connection
+        app.logger.debug("Connecting: %s(%s) → %s(%s)", source_node.type, source_node.title, target_node.type, target_node.title)
         
-        # Create an edge in the edge dictionary
-        edge_id = f"{source_id}-{target_id}"
-        self.edges[edge_id] = {
-            'id': edge_id,
-            'from': source_id,
-            'to': target_id,
-            'cardinality': '1..1'
-        }
+        # Keep an existing edge (in either direction) and its cardinality
+        existing_edge_id = self.edges.edge_id_for(source_id, target_id)
+        if existing_edge_id:
+            app.logger.debug("Nodes already connected by edge %s", existing_edge_id)
+            return True
         
-        print(f"Successfully connected nodes: {source_id} -> {target_id}")
-        print(f"Node {source_id} now has {len(source_node.connections)} connections")
-        print(f"Node {target_id} now has {len(target_node.connections)} connections")
+        # Create an edge in the edge dictionary (this also links the node connections)
+        self.edges.add_edge(source_id, target_id)
+        
+        app.logger.debug("Successfully connected nodes: %s -> %s", source_id, target_id)
+        app.logger.debug("Node %s now has %s connections", source_id, len(source_node.connections))
+        app.logger.debug("Node %s now has %s connections", target_id, len(target_node.connections))
         return True
     
     def disconnect_nodes(self, source_id, target_id):
@@ -3069,45 +2928,25 @@ class FlaskSHACLGraphEditor:
         source_node = self.nodes[source_id]
         target_node = self.nodes[target_id]
         
-        print(f"Disconnecting: {source_node.type}({source_node.title}) ← → {target_node.type}({target_node.title})")
-        
-        # Remove from connections set - both directions
-        if target_id in source_node.connections:
-            source_node.connections.remove(target_id)
-            print(f"Removed {target_id} from {source_id}'s connections")
-        else:
-            print(f"Warning: {target_id} not found in {source_id}'s connections")
-        
-        if source_id in target_node.connections:
-            target_node.connections.remove(source_id)
-            print(f"Removed {source_id} from {target_id}'s connections")
-        else:
-            print(f"Warning: {source_id} not found in {target_id}'s connections")
+        app.logger.debug("Disconnecting: %s(%s) ← → %s(%s)", source_node.type, source_node.title, target_node.type, target_node.title)
         
-        # Remove edge from edge dictionary
-        edge_id = f"{source_id}-{target_id}"
-        if edge_id in self.edges:
+        # Remove edge(s) between the two nodes, in either direction;
+        # the node connections are unlinked along with the last edge
+        edge_id = self.edges.edge_id_for(source_id, target_id)
+        while edge_id:
             del self.edges[edge_id]
-            print(f"Removed edge {edge_id}")
-        
-        # Also check for reverse edge
-        reverse_edge_id = f"{target_id}-{source_id}"
-        if reverse_edge_id in self.edges:
-            del self.edges[reverse_edge_id]
-            print(f"Removed reverse edge {reverse_edge_id}")
-            
-        print(f"Node {source_id} now has {len(source_node.connections)} connections")
-        print(f"Node {target_id} now has {len(target_node.connections)} connections")
-        return True
+            app.logger.debug("Removed edge %s", edge_id)
+            edge_id = self.edges.edge_id_for(source_id, target_id)
             
-        print(f"Disconnected nodes: {source_id} -> {target_id}")
+        app.logger.debug("Node %s now has %s connections", source_id, len(source_node.connections))
+        app.logger.debug("Node %s now has %s connections", target_id, len(target_node.connections))
         return True
         
     def reset_structure(self):
         """Reset the structure to a new empty one with just a dataset node"""
         try:
             # Complete clearing of all data structures
-            print("Resetting structure - clearing all nodes and edges")
+            app.logger.debug("Resetting structure - clearing all nodes and edges")
             
             # Make a new, empty dictionary instead of clearing the existing one
             self.nodes = {}
@@ -3121,10 +2960,11 @@ class FlaskSHACLGraphEditor:
                 node_type='dataset'
             )
             self.nodes[dataset_node.id] = dataset_node
+            self._dataset_node_id = dataset_node.id
             
             # Log the reset
-            print(f"Reset complete. New structure has {len(self.nodes)} nodes and {len(self.edges)} edges")
-            print("Generating new dataset: Dataset")
+            app.logger.debug("Reset complete. New structure has %s nodes and %s edges", len(self.nodes), len(self.edges))
+            app.logger.debug("Generating new dataset: Dataset")
             
             return True
         except Exception as e:
@@ -3132,26 +2972,22 @@ class FlaskSHACLGraphEditor:
     
     def create_edge(self, node1_id, node2_id, cardinality="1..1", order=None):
         """Create an edge between two nodes with cardinality and optional order"""
-        edge_id = f"{node1_id}-{node2_id}"
-        reverse_edge_id = f"{node2_id}-{node1_id}"
+        # Reuse the edge if the nodes are already connected in either direction
+        existing_edge_id = self.edges.edge_id_for(node1_id, node2_id)
+        if existing_edge_id:
+            edge = self.edges[existing_edge_id]
+            edge['cardinality'] = cardinality
+            if order is not None:
+                edge['order'] = order
+            app.logger.debug("Updated edge '%s' with cardinality %s", existing_edge_id, cardinality)
+            return existing_edge_id
         
         # Store edge with cardinality and order
-        self.edges[edge_id] = {
-            'id': edge_id,
-            'from': node1_id,
-            'to': node2_id,
-            'cardinality': cardinality,
-            'order': order
-        }
+        edge_id = self.edges.add_edge(node1_id, node2_id, cardinality, order=order)
         
-        print(f"Created edge '{edge_id}' with cardinality {cardinality}" + (f" and order {order}" if order is not None else ""))
+        app.logger.debug("Created edge '%s' with cardinality %s and order %s", edge_id, cardinality, order)
         
         return edge_id
-        # Remove reverse edge if it exists (avoid duplicates)
-        if reverse_edge_id in self.edges:
-            del self.edges[reverse_edge_id]
-            
-        return True
     
     def update_edge_cardinality(self, edge_id, cardinality):
         """Update the cardinality of an edge"""
@@ -3163,21 +2999,7 @@ class FlaskSHACLGraphEditor:
     def delete_edge(self, edge_id):
         """Delete an edge"""
         if edge_id in self.edges:
-            # Get source and target ids
-            edge = self.edges[edge_id]
-            source_id = edge.get('from')
-            target_id = edge.get('to')
-            
-            # Remove connections between nodes if they exist
-            if source_id and target_id:
-                if source_id in self.nodes and target_id in self.nodes:
-                    # Remove bidirectional connections
-                    if target_id in self.nodes[source_id].connections:
-                        self.nodes[source_id].connections.remove(target_id)
-                    if source_id in self.nodes[target_id].connections:
-                        self.nodes[target_id].connections.remove(source_id)
-            
-            # Delete the edge
+            # Delete the edge (this also unlinks the node connections)
             del self.edges[edge_id]
             return True
         return False
@@ -3192,7 +3014,7 @@ class FlaskSHACLGraphEditor:
     
     def generate_ttl(self):
         """Generate TTL for all nodes"""
-        return generate_full_ttl(self.nodes, self.base_uri, self.edges)
+        return generate_full_ttl(self.nodes, self.base_uri, self.edges).decode('utf-8')
     
     def save_to_file(self, filepath):
         """Save the current graph to a JSON file"""
@@ -3202,20 +3024,23 @@ class FlaskSHACLGraphEditor:
             "base_uri": self.base_uri
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(filepath, 'wb', buffering=_PROJECT_IO_BUFFER) as f:
+            f.write(_json_dumps(data, indent=True))
         
         return True
     
     def load_from_file(self, filepath):
         """Load a graph from a JSON file"""
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb', buffering=_PROJECT_IO_BUFFER) as f:
+                data = _json_loads(f.read())
                 
             self.nodes = {}
+            self._dataset_node_id = None
             for node_id, node_data in data.get("nodes", {}).items():
-                self.nodes[node_id] = SHACLNode.from_dict(node_data)
+                node = self.nodes[node_id] = SHACLNode.from_dict(node_data)
+                if node.type == 'dataset' and self._dataset_node_id is None:
+                    self._dataset_node_id = node_id
             
             # Load edges if available (for backward compatibility)
             self.edges = data.get("edges", {})
@@ -3226,38 +3051,95 @@ class FlaskSHACLGraphEditor:
         except Exception as e:
             return False
 
+def _export_store_matches_default(store):
+    """Check that a sample export built in the given store is the same graph as with the default store
+    
+    generate_full_ttl replaces rdflib's prefix block with _PREFIX_TEMPLATE, so a store
+    that binds or abbreviates differently could silently produce a different graph.
+    """
+    editor = FlaskSHACLGraphEditor()
+    dataset = SHACLNode('dataset', title={'de': 'Datensatz', 'fr': 'Jeu de données'}, description="Beschreibung")
+    dataset.identifier = 'dataset'
+    person = SHACLNode('class', title={'de': 'Person'}, description={'de': 'Eine Person'})
+    person.identifier = 'Person'
+    age = SHACLNode('concept', title={'de': 'Alter'}, description="Alter in Jahren")
+    age.identifier = 'Alter'
+    age.datatype = 'xsd:integer'
+    age.min_count = 1
+    age.pattern = '^[0-9]+$'
+    status = SHACLNode('data_element', title={'de': 'Status', 'en': 'Status'}, description="Status")
+    status.identifier = 'Status'
+    status.in_values = ['aktiv', 'inaktiv']
+    status.order = 1
+    for node in (dataset, person, age, status):
+        editor.nodes[node.id] = node
+    editor._dataset_node_id = dataset.id
+    editor.edges.add_edge(dataset.id, person.id, '0..1')
+    editor.edges.add_edge(person.id, age.id)
+    editor.edges.add_edge(dataset.id, status.id, '1..1')
+    
+    try:
+        expected = generate_full_ttl(editor.nodes, editor.base_uri, editor.edges, store="default")
+        actual = generate_full_ttl(editor.nodes, editor.base_uri, editor.edges, store=store)
+        return isomorphic(Graph().parse(data=expected, format='turtle'), Graph().parse(data=actual, format='turtle'))
+    except Exception as e:
+        app.logger.warning("Sample TTL export with the %s store failed: %s", store, e)
+        return False
+
+if os.environ.get('TTL_EXPORT_STORE', '').lower() == 'oxigraph':
+    if oxrdflib is None:
+        app.logger.warning("TTL_EXPORT_STORE=oxigraph ignored: oxrdflib is not installed")
+    elif _export_store_matches_default("Oxigraph"):
+        _EXPORT_GRAPH_STORE = "Oxigraph"
+    else:
+        app.logger.warning("TTL_EXPORT_STORE=oxigraph ignored: export differs from the default store")
+
 # Create a session manager instance (moved from above to resolve import order)
 session_manager = SessionManager()
 
-# Session manager will handle initialization for each user session
+# Session manager will handle initialization for each user session
+
+# Endpoints that only read the editor; any other request may modify it
+_READ_ONLY_ENDPOINTS = frozenset({
+    'get_graph', 'get_nodes', 'get_node', 'get_edge', 'save_project', 'export_ttl', 'import_status',
+    'get_i14y_concepts_bulk'
+})
+
+def _new_session_editor():
+    """Create the editor for a new session, starting with a default dataset node"""
+    editor = FlaskSHACLGraphEditor()
+    if editor.get_dataset_node() is None:
+        dataset_node = SHACLNode('dataset', title="New Dataset", description="Dataset description")
+        editor.nodes[dataset_node.id] = dataset_node
+        editor._dataset_node_id = dataset_node.id
+    return editor
 
 def get_user_editor():
     """Get the editor instance for the current user session"""
     if 'session_id' not in session:
         session['session_id'] = str(uuid.uuid4())
     
-    session_id = session['session_id']
-    editor = session_manager.get_editor_for_session(session_id)
+    editor = session_manager.get_editor_for_session(session['session_id'], _new_session_editor)
     
-    # Initialize editor if it's None (first time creation)
-    if editor is None:
-        editor = FlaskSHACLGraphEditor()
-        session_manager.sessions[session_id] = editor
-        session_manager.session_timestamps[session_id] = datetime.now()
-        
-        # Initialize with default dataset node
-        dataset_exists = False
-        for node in editor.nodes.values():
-            if node.type == 'dataset':
-                dataset_exists = True
-                break
-        
-        if not dataset_exists:
-            dataset_node = SHACLNode('dataset', title="New Dataset", description="Dataset description")
-            editor.nodes[dataset_node.id] = dataset_node
+    # Released in _release_editor_lock when the request ends
+    if getattr(flask_g, 'locked_editor', None) is not editor:
+        editor.lock.acquire()
+        flask_g.locked_editor = editor
+    
+    if request.endpoint not in _READ_ONLY_ENDPOINTS:
+        if editor.pending_import is not None:
+            # The running import would overwrite any change made now
+            abort(ojsonify({"error": "An import is still running", "job_id": editor.pending_import}, 409))
+        editor.touch()
     
     return editor
 
+@app.teardown_request
+def _release_editor_lock(exc):
+    editor = flask_g.pop('locked_editor', None)
+    if editor is not None:
+        editor.lock.release()
+
 @app.route('/')
 def index():
     """Render the main application page"""
@@ -3273,7 +3155,7 @@ def get_graph():
     edges_data = []
     
     # Print debug info
-    print(f"Fetching graph with {len(editor.nodes)} nodes and {len(editor.edges)} edges")
+    app.logger.debug("Fetching graph with %s nodes and %s edges", len(editor.nodes), len(editor.edges))
     
     # Process all nodes
     for node_id, node in editor.nodes.items():
@@ -3332,7 +3214,7 @@ def get_graph():
                         )
                     })
                 else:
-                    print(f"Warning: Could not extract from/to IDs for edge {edge_id}")
+                    app.logger.warning("Could not extract from/to IDs for edge %s", edge_id)
             except Exception as e:
                 continue
     
@@ -3396,7 +3278,7 @@ def get_graph_layout():
                     if from_id and to_id:
                         G.add_edge(from_id, to_id)
                     else:
-                        print(f"Warning: Could not extract from/to IDs for edge {edge_id} in layout calculation")
+                        app.logger.warning("Could not extract from/to IDs for edge %s in layout calculation", edge_id)
                 except Exception as e:
                     continue
         
@@ -3474,7 +3356,7 @@ def get_graph_layout():
     
     # Count the total connections
     total_connections = sum(connection_counts.values())
-    print(f"Found {total_connections} connections across all nodes")
+    app.logger.debug("Found %s connections across all nodes", total_connections)
     
     # Process all nodes
     for node_id, node in editor.nodes.items():
@@ -3516,11 +3398,7 @@ def get_graph_layout():
                 publisher_data = node.i14y_data['publisherName']
                 if isinstance(publisher_data, dict):
                     # Try to get German name first, then fall back to others
-                    publisher = (publisher_data.get('de') or 
-                               publisher_data.get('en') or 
-                               publisher_data.get('fr') or 
-                               publisher_data.get('it') or 
-                               '')
+                    publisher = _pick_lang(publisher_data, '', _PRIMARY_LANGS)
                 else:
                     publisher = str(publisher_data)
             
@@ -3640,18 +3518,18 @@ def create_data_element():
                             # Store the full multilingual description object
                             multilingual_descriptions = {
                                 lang: desc for lang, desc in desc_obj.items()
-                                if lang in ['de', 'en', 'fr', 'it', 'rm'] and desc
+                                if lang in _ALL_LANGS and desc
                             }
                             # Ensure we have at least a German description as fallback
                             if multilingual_descriptions:
                                 data_element.description = multilingual_descriptions
-                                print(f"Created data element with multilingual description: {list(multilingual_descriptions.keys())}")
+                                app.logger.debug("Created data element with multilingual description: %s", list(multilingual_descriptions.keys()))
                             else:
                                 data_element.description = {'de': ''}
                         elif isinstance(desc_obj, str) and desc_obj.strip():
                             # Handle string descriptions
                             data_element.description = {'de': desc_obj}
-                            print(f"Created data element with string description")
+                            app.logger.debug("Created data element with string description")
                     else:
                         # Use provided description if no concept description
                         data_element.description = data.get('description', '')
@@ -3680,37 +3558,15 @@ def create_data_element():
         
         # Connect to parent if specified
         if parent_id and parent_id in editor.nodes:
-            # Add to connections sets
-            editor.nodes[parent_id].connections.add(data_element.id)
-            data_element.connections.add(parent_id)
-            
-            # Create an edge in the edge dictionary
-            edge_id = f"{parent_id}-{data_element.id}"
-            editor.edges[edge_id] = {
-                'id': edge_id,
-                'from': parent_id,
-                'to': data_element.id,
-                'cardinality': '1..1'
-            }
+            # Create an edge in the edge dictionary (this also links the node connections)
+            editor.edges.add_edge(parent_id, data_element.id)
         else:
             # Connect to dataset node by default
-            dataset_node = None
-            for n_id, n in editor.nodes.items():
-                if n.type == 'dataset':
-                    dataset_node = n
-                    break
+            dataset_node = editor.get_dataset_node()
             
             if dataset_node:
-                dataset_node.connections.add(data_element.id)
-                data_element.connections.add(dataset_node.id)
-                
-                edge_id = f"{dataset_node.id}-{data_element.id}"
-                editor.edges[edge_id] = {
-                    'id': edge_id,
-                    'from': dataset_node.id,
-                    'to': data_element.id,
-                    'cardinality': '1..1'
-                }
+                # Create an edge in the edge dictionary (this also links the node connections)
+                editor.edges.add_edge(dataset_node.id, data_element.id)
         
         return jsonify({"success": True, "node_id": data_element.id})
     except Exception as e:
@@ -3750,11 +3606,11 @@ def link_node_to_i14y_concept():
         
     # Handle the case where node_id is a dict (from D3.js visualization data)
     if isinstance(node_id, dict) and 'id' in node_id:
-        print(f"Received node_id as dict: {node_id}")
+        app.logger.debug("Received node_id as dict: %s", node_id)
         node_id = node_id['id']
     # Convert node_id to string if it's not already
     elif not isinstance(node_id, str):
-        print(f"Warning: node_id is not a string, it's a {type(node_id)}. Value: {node_id}")
+        app.logger.warning("node_id is not a string, it's a %s. Value: %s", type(node_id), node_id)
         try:
             node_id = str(node_id)
         except Exception as e:
@@ -3769,9 +3625,9 @@ def link_node_to_i14y_concept():
         return jsonify({"error": "Only data elements can be linked to I14Y concepts"}), 400
     
     # Check if already linked to a concept
-    print(f"Attempting to link data element {node_id} to concept")
-    print(f"Current is_linked_to_concept: {node.is_linked_to_concept}")
-    print(f"Current conforms_to_concept_uri: {node.conforms_to_concept_uri}")
+    app.logger.debug("Attempting to link data element %s to concept", node_id)
+    app.logger.debug("Current is_linked_to_concept: %s", node.is_linked_to_concept)
+    app.logger.debug("Current conforms_to_concept_uri: %s", node.conforms_to_concept_uri)
     
     if node.is_linked_to_concept:
         return jsonify({"error": "This data element is already linked to a concept. Please detach the existing concept first."}), 400
@@ -3783,17 +3639,17 @@ def link_node_to_i14y_concept():
         return jsonify({"error": "Concept URI and data are required"}), 400
     
     # Debug logging
-    print(f"=== Linking data element to I14Y concept ===")
-    print(f"Node ID: {node_id}")
-    print(f"Concept URI: {concept_uri}")
-    print(f"Concept data keys: {concept_data.keys() if isinstance(concept_data, dict) else 'not a dict'}")
+    app.logger.debug("=== Linking data element to I14Y concept ===")
+    app.logger.debug("Node ID: %s", node_id)
+    app.logger.debug("Concept URI: %s", concept_uri)
+    app.logger.debug("Concept data keys: %s", concept_data.keys() if isinstance(concept_data, dict) else 'not a dict')
     if isinstance(concept_data, dict) and 'description' in concept_data:
-        print(f"Description type: {type(concept_data['description'])}")
+        app.logger.debug("Description type: %s", type(concept_data['description']))
         if isinstance(concept_data['description'], dict):
-            print(f"Description languages: {list(concept_data['description'].keys())}")
-            print(f"Description DE: {concept_data['description'].get('de', 'N/A')[:100] if concept_data['description'].get('de') else 'N/A'}")
+            app.logger.debug("Description languages: %s", list(concept_data['description'].keys()))
+            app.logger.debug("Description DE: %s", concept_data['description'].get('de', 'N/A')[:100] if concept_data['description'].get('de') else 'N/A')
         else:
-            print(f"Description (string): {str(concept_data['description'])[:100]}")
+            app.logger.debug("Description (string): %.100s", concept_data['description'])
         
     try:
         # Save original values
@@ -3817,7 +3673,7 @@ def link_node_to_i14y_concept():
             if isinstance(node.description, dict):
                 # Check if any language has non-empty content
                 has_existing_description = any(node.description.get(lang, '').strip() 
-                                              for lang in ['de', 'fr', 'it', 'en'])
+                                              for lang in _PRIMARY_LANGS)
             elif isinstance(node.description, str):
                 has_existing_description = bool(node.description.strip())
         
@@ -3830,18 +3686,18 @@ def link_node_to_i14y_concept():
                     # Store the full multilingual description object
                     multilingual_descriptions = {
                         lang: desc for lang, desc in desc_obj.items()
-                        if lang in ['de', 'en', 'fr', 'it', 'rm'] and desc
+                        if lang in _ALL_LANGS and desc
                     }
                     # Ensure we have at least a German description as fallback
                     if multilingual_descriptions:
                         node.description = multilingual_descriptions
-                        print(f"Updated data element description with multilingual content: {list(multilingual_descriptions.keys())}")
+                        app.logger.debug("Updated data element description with multilingual content: %s", list(multilingual_descriptions.keys()))
                     else:
                         node.description = {'de': ''}
                 elif isinstance(desc_obj, str) and desc_obj.strip():
                     # Handle string descriptions
                     node.description = {'de': desc_obj}
-                    print(f"Updated data element description with string content")
+                    app.logger.debug("Updated data element description with string content")
             
         return jsonify({"success": True})
     except Exception as e:
@@ -3884,8 +3740,7 @@ def link_data_element_to_concept(data_element_id):
         data_element.i14y_data = concept_data
         
         # Apply constraints from concept
-        api_client = I14YAPIClient()
-        constraints = api_client.extract_constraints_from_concept(concept_data)
+        constraints = i14y_client.extract_constraints_from_concept(concept_data)
         
         if 'pattern' in constraints:
             data_element.pattern = constraints['pattern']
@@ -3915,17 +3770,17 @@ def unlink_data_element_from_concept(data_element_id):
     if data_element.type != 'data_element':
         return jsonify({"error": "Node is not a data element"}), 400
     
-    print(f"Unlinking data element {data_element_id} from concept")
-    print(f"Before unlink - is_linked_to_concept: {data_element.is_linked_to_concept}")
-    print(f"Before unlink - conforms_to_concept_uri: {data_element.conforms_to_concept_uri}")
+    app.logger.debug("Unlinking data element %s from concept", data_element_id)
+    app.logger.debug("Before unlink - is_linked_to_concept: %s", data_element.is_linked_to_concept)
+    app.logger.debug("Before unlink - conforms_to_concept_uri: %s", data_element.conforms_to_concept_uri)
     
     # Clear concept link
     data_element.conforms_to_concept_uri = None
     data_element.is_linked_to_concept = False
     data_element.i14y_data = None
     
-    print(f"After unlink - is_linked_to_concept: {data_element.is_linked_to_concept}")
-    print(f"After unlink - conforms_to_concept_uri: {data_element.conforms_to_concept_uri}")
+    app.logger.debug("After unlink - is_linked_to_concept: %s", data_element.is_linked_to_concept)
+    app.logger.debug("After unlink - conforms_to_concept_uri: %s", data_element.conforms_to_concept_uri)
     
     return jsonify({"success": True})
 
@@ -3951,41 +3806,17 @@ def add_node():
     
     # Connect to parent if specified
     if parent_id and parent_id in editor.nodes:
-        # Add to connections sets
-        editor.nodes[parent_id].connections.add(node.id)
-        node.connections.add(parent_id)
-        
-        # Create an edge in the edge dictionary
-        edge_id = f"{parent_id}-{node.id}"
-        editor.edges[edge_id] = {
-            'id': edge_id,
-            'from': parent_id,
-            'to': node.id,
-            'cardinality': '1..1'
-        }
-        print(f"Created edge from {parent_id} to {node.id}")
+        # Create an edge in the edge dictionary (this also links the node connections)
+        editor.edges.add_edge(parent_id, node.id)
+        app.logger.debug("Created edge from %s to %s", parent_id, node.id)
     else:
         # If no parent specified, connect to dataset node
-        dataset_node = None
-        for n_id, n in editor.nodes.items():
-            if n.type == 'dataset':
-                dataset_node = n
-                break
+        dataset_node = editor.get_dataset_node()
         
         if dataset_node:
-            # Add to connections sets
-            dataset_node.connections.add(node.id)
-            node.connections.add(dataset_node.id)
-            
-            # Create an edge in the edge dictionary
-            edge_id = f"{dataset_node.id}-{node.id}"
-            editor.edges[edge_id] = {
-                'id': edge_id,
-                'from': dataset_node.id,
-                'to': node.id,
-                'cardinality': '1..1'
-            }
-            print(f"Created edge from {dataset_node.id} to {node.id}")
+            # Create an edge in the edge dictionary (this also links the node connections)
+            editor.edges.add_edge(dataset_node.id, node.id)
+            app.logger.debug("Created edge from %s to %s", dataset_node.id, node.id)
     
     return jsonify({"success": True, "node_id": node.id})
 
@@ -4006,11 +3837,15 @@ def get_node(node_id):
     """Get details for a specific node"""
     editor = get_user_editor()
     if node_id not in editor.nodes:
-        return jsonify({"error": "Node not found"}), 404
+        return ojsonify({"error": "Node not found"}), 404
+    
+    etag = editor.etag_for(node_id)
+    if request.if_none_match.contains_weak(etag):
+        return _not_modified(etag)
     
     node = editor.nodes[node_id]
-    print(f"GET NODE {node_id}: Returning node with order={node.order}")
-    return jsonify({
+    app.logger.debug("GET NODE %s: Returning node with order=%s", node_id, node.order)
+    response = ojsonify({
         'id': node.id,
         'type': node.type,
         'title': node.title,
@@ -4038,49 +3873,33 @@ def get_node(node_id):
         'suggested_min_length': node.suggested_min_length,
         'suggested_max_length': node.suggested_max_length
     })
+    response.set_etag(etag, weak=True)
+    return response
+
+# Integer constraint fields accepted by update_constraints
+_INT_FIELDS = ('min_count', 'max_count', 'min_length', 'max_length')
 
 @app.route('/api/nodes/<node_id>/constraints', methods=['POST'])
 def update_constraints(node_id):
     """Update constraints for a node"""
     editor = get_user_editor()
     if node_id not in editor.nodes:
-        return jsonify({"error": "Node not found"}), 404
+        return ojsonify({"error": "Node not found"}), 404
     
     node = editor.nodes[node_id]
-    data = request.json
+    # Decode the raw body directly instead of going through request.json's cache
+    try:
+        data = _json_loads(request.get_data(cache=False))
+    except ValueError:
+        return ojsonify({"error": "Invalid JSON body"}), 400
     
-    # Update constraint fields
-    if 'min_count' in data and data['min_count']:
-        try:
-            node.min_count = int(data['min_count'])
-        except ValueError:
-            node.min_count = None
-    else:
-        node.min_count = None
-        
-    if 'max_count' in data and data['max_count']:
-        try:
-            node.max_count = int(data['max_count'])
-        except ValueError:
-            node.max_count = None
-    else:
-        node.max_count = None
-        
-    if 'min_length' in data and data['min_length']:
+    # Update integer constraint fields; missing, empty or invalid values clear the constraint
+    for field in _INT_FIELDS:
+        value = data.get(field)
         try:
-            node.min_length = int(data['min_length'])
-        except ValueError:
-            node.min_length = None
-    else:
-        node.min_length = None
-        
-    if 'max_length' in data and data['max_length']:
-        try:
-            node.max_length = int(data['max_length'])
-        except ValueError:
-            node.max_length = None
-    else:
-        node.max_length = None
+            setattr(node, field, int(value) if value else None)
+        except (TypeError, ValueError):
+            setattr(node, field, None)
         
     node.pattern = data.get('pattern', '').strip() or None
     
@@ -4097,7 +3916,7 @@ def update_constraints(node_id):
     node.range = data.get('range', '').strip() or None
     node.datatype = data.get('datatype', '').strip() or "xsd:string"
     
-    return jsonify({"success": True})
+    return ojsonify({"success": True})
 
 @app.route('/api/nodes/<node_id>/link-to-i14y', methods=['POST'])
 def link_node_to_i14y(node_id):
@@ -4234,19 +4053,15 @@ def create_connection():
     cardinality = data.get('cardinality', '1..1')  # Default cardinality
     
     if not node1_id or not node2_id:
-        return jsonify({"error": "Both node IDs are required"}), 400
+        return ojsonify({"error": "Both node IDs are required"}), 400
         
     if node1_id not in editor.nodes or node2_id not in editor.nodes:
-        return jsonify({"error": "One or both nodes not found"}), 404
+        return ojsonify({"error": "One or both nodes not found"}), 404
         
-    # Create bidirectional connection in the nodes (for backward compatibility)
-    editor.nodes[node1_id].connections.add(node2_id)
-    editor.nodes[node2_id].connections.add(node1_id)
-    
-    # Create edge with cardinality
+    # Create edge with cardinality (node connections follow the edges)
     editor.create_edge(node1_id, node2_id, cardinality)
     
-    return jsonify({"success": True})
+    return ojsonify({"success": True})
 
 @app.route('/api/connections', methods=['DELETE'])
 def delete_connection():
@@ -4257,24 +4072,18 @@ def delete_connection():
     node2_id = data.get('node2_id')
     
     if not node1_id or not node2_id:
-        return jsonify({"error": "Both node IDs are required"}), 400
+        return ojsonify({"error": "Both node IDs are required"}), 400
         
     if node1_id not in editor.nodes or node2_id not in editor.nodes:
-        return jsonify({"error": "One or both nodes not found"}), 404
+        return ojsonify({"error": "One or both nodes not found"}), 404
         
-    # Remove bidirectional connection
-    if node2_id in editor.nodes[node1_id].connections:
-        editor.nodes[node1_id].connections.remove(node2_id)
-    if node1_id in editor.nodes[node2_id].connections:
-        editor.nodes[node2_id].connections.remove(node1_id)
-    
-    # Remove edges
-    edge_id1 = f"{node1_id}-{node2_id}"
-    edge_id2 = f"{node2_id}-{node1_id}"
-    editor.delete_edge(edge_id1)
-    editor.delete_edge(edge_id2)
+    # Remove edges (in either direction); node connections follow the edges
+    edge_id = editor.edges.edge_id_for(node1_id, node2_id)
+    while edge_id:
+        editor.delete_edge(edge_id)
+        edge_id = editor.edges.edge_id_for(node1_id, node2_id)
     
-    return jsonify({"success": True})
+    return ojsonify({"success": True})
 
 @app.route('/api/edges/<edge_id>', methods=['GET'])
 def get_edge(edge_id):
@@ -4282,17 +4091,23 @@ def get_edge(edge_id):
     editor = get_user_editor()
     edge = editor.get_edge(edge_id)
     if edge:
+        etag = editor.etag_for(edge_id)
+        if request.if_none_match.contains_weak(etag):
+            return _not_modified(etag)
+        
+        payload = edge
         # Add source and target node details to the response
         if 'from' in edge and 'to' in edge:
             from_node = editor.nodes.get(edge['from'])
             to_node = editor.nodes.get(edge['to'])
             if from_node and to_node:
-                edge_with_nodes = edge.copy()
-                edge_with_nodes['from_node'] = from_node.to_dict()
-                edge_with_nodes['to_node'] = to_node.to_dict()
-                return jsonify(edge_with_nodes)
-        return jsonify(edge)
-    return jsonify({"error": "Edge not found"}), 404
+                payload = edge.copy()
+                payload['from_node'] = from_node.to_dict()
+                payload['to_node'] = to_node.to_dict()
+        response = ojsonify(payload)
+        response.set_etag(etag, weak=True)
+        return response
+    return ojsonify({"error": "Edge not found"}), 404
 
 @app.route('/api/edges/<edge_id>', methods=['DELETE'])
 def delete_edge(edge_id):
@@ -4301,40 +4116,19 @@ def delete_edge(edge_id):
     
     # Ensure the edge exists
     if edge_id not in editor.edges:
-        print(f"Edge not found: {edge_id}")
-        return jsonify({"error": "Edge not found"}), 404
-    
-    # Get the nodes connected by this edge before deletion
-    edge = editor.edges.get(edge_id)
-    if edge and 'from' in edge and 'to' in edge:
-        from_id = edge['from']
-        to_id = edge['to']
-        
-        print(f"Deleting edge {edge_id} connecting {from_id} to {to_id}")
-        
-        # Remove the connection from both nodes' connection sets
-        if from_id in editor.nodes and to_id in editor.nodes:
-            if to_id in editor.nodes[from_id].connections:
-                editor.nodes[from_id].connections.remove(to_id)
-                print(f"Removed {to_id} from {from_id}'s connections")
-            else:
-                print(f"Warning: {to_id} not found in {from_id}'s connections")
-                
-            if from_id in editor.nodes[to_id].connections:
-                editor.nodes[to_id].connections.remove(from_id)
-                print(f"Removed {from_id} from {to_id}'s connections")
-            else:
-                print(f"Warning: {from_id} not found in {to_id}'s connections")
-    else:
-        print(f"Warning: Edge {edge_id} doesn't have valid from/to fields")
+        app.logger.debug("Edge not found: %s", edge_id)
+        return ojsonify({"error": "Edge not found"}), 404
     
-    # Delete the edge
+    edge = editor.edges[edge_id]
+    app.logger.debug("Deleting edge %s connecting %s to %s", edge_id, edge.get('from'), edge.get('to'))
+    
+    # The edge store unlinks the node connections unless another edge still joins the nodes
     try:
         del editor.edges[edge_id]
-        print(f"Successfully deleted edge {edge_id}")
-        return jsonify({"success": True})
+        app.logger.debug("Successfully deleted edge %s", edge_id)
+        return ojsonify({"success": True})
     except Exception as e:
-        return jsonify({"error": "Failed to delete edge"}), 500
+        return ojsonify({"error": "Failed to delete edge"}), 500
 
 @app.route('/api/edges/<edge_id>/cardinality', methods=['POST'])
 def update_edge_cardinality(edge_id):
@@ -4344,12 +4138,12 @@ def update_edge_cardinality(edge_id):
     cardinality = data.get('cardinality')
     
     if not cardinality:
-        return jsonify({"error": "Cardinality is required"}), 400
+        return ojsonify({"error": "Cardinality is required"}), 400
         
     success = editor.update_edge_cardinality(edge_id, cardinality)
     if success:
-        return jsonify({"success": True})
-    return jsonify({"error": "Edge not found"}), 404
+        return ojsonify({"success": True})
+    return ojsonify({"error": "Edge not found"}), 404
 
 @app.route('/api/connect', methods=['POST'])
 def connect_nodes():
@@ -4360,12 +4154,12 @@ def connect_nodes():
     target_id = data.get('target')
     
     if not source_id or not target_id:
-        return jsonify({"error": "Source and target IDs are required"}), 400
+        return ojsonify({"error": "Source and target IDs are required"}), 400
         
     success = editor.connect_nodes(source_id, target_id)
     if success:
-        return jsonify({"success": True})
-    return jsonify({"error": "Failed to connect nodes"}), 400
+        return ojsonify({"success": True})
+    return ojsonify({"error": "Failed to connect nodes"}), 400
 
 @app.route('/api/disconnect', methods=['POST'])
 def disconnect_nodes():
@@ -4376,12 +4170,12 @@ def disconnect_nodes():
     target_id = data.get('target')
     
     if not source_id or not target_id:
-        return jsonify({"error": "Source and target IDs are required"}), 400
+        return ojsonify({"error": "Source and target IDs are required"}), 400
         
     success = editor.disconnect_nodes(source_id, target_id)
     if success:
-        return jsonify({"success": True})
-    return jsonify({"error": "Failed to disconnect nodes"}), 400
+        return ojsonify({"success": True})
+    return ojsonify({"error": "Failed to disconnect nodes"}), 400
 
 @app.route('/api/save', methods=['POST'])
 def save_graph():
@@ -4434,31 +4228,35 @@ def save_project():
     """Save the current project to a file for download"""
     editor = get_user_editor()
     try:
-        # Prepare project data
+        # Prepare project data; nodes are encoded by the serializer itself
+        # (orjson walks the SHACLNode dataclass fields without calling to_dict)
         project_data = {
-            "nodes": {node_id: node.to_dict() for node_id, node in editor.nodes.items()},
+            "nodes": editor.nodes,
             "edges": editor.edges,
             "timestamp": datetime.now().isoformat()
         }
         
-        # Convert to JSON
-        project_json = json.dumps(project_data, indent=2)
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as tmp:
-            tmp.write(project_json.encode('utf-8'))
-            tmp_path = tmp.name
+        if request.args.get('format') == 'msgpack':
+            # Compact binary variant for programmatic round-trips
+            if msgpack is None:
+                return ojsonify({"error": "msgpack format is not available"}), 400
+            project_bytes = msgpack.packb(project_data, use_bin_type=True, default=_json_default)
+            extension, mimetype = 'msgpack', 'application/msgpack'
+        else:
+            # Convert to JSON (indented only on request)
+            project_bytes = _json_dumps(project_data, indent=request.args.get('pretty') == '1')
+            extension, mimetype = 'json', 'application/json'
         
-        # Return file for download
+        # Return file for download straight from memory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return send_file(
-            tmp_path,
+            io.BytesIO(project_bytes),
             as_attachment=True,
-            download_name=f"shacl_project_{timestamp}.json",
-            mimetype='application/json'
+            download_name=f"shacl_project_{timestamp}.{extension}",
+            mimetype=mimetype
         )
     except Exception as e:
-        return jsonify({"error": "Failed to save project"}), 500
+        return ojsonify({"error": "Failed to save project"}), 500
 
 @app.route('/api/project/load', methods=['POST'])
 def load_project():
@@ -4471,28 +4269,34 @@ def load_project():
     if file.filename == '':
         return jsonify({"error": "No selected file"}), 400
     
-    if not file.filename.endswith('.json'):
-        return jsonify({"error": "Only JSON files are supported"}), 400
+    is_msgpack = file.filename.endswith('.msgpack')
+    if not (file.filename.endswith('.json') or is_msgpack):
+        return jsonify({"error": "Only JSON and msgpack files are supported"}), 400
+    if is_msgpack and msgpack is None:
+        return jsonify({"error": "msgpack format is not available"}), 400
     
     try:
         # Debug logging
-        print(f"File upload debug: filename={file.filename}, content_type={file.content_type}")
-        print(f"File object: {file}")
+        app.logger.debug("File upload debug: filename=%s, content_type=%s", file.filename, file.content_type)
+        app.logger.debug("File object: %s", file)
         
         # Read file content
         raw_content = file.read()
-        print(f"Raw content length: {len(raw_content)} bytes")
+        app.logger.debug("Raw content length: %s bytes", len(raw_content))
         
         if len(raw_content) == 0:
             return jsonify({"error": "Uploaded file is empty"}), 400
         
-        content = raw_content.decode('utf-8')
-        print(f"Decoded content length: {len(content)} characters")
-        print(f"Content preview: {content[:200]}...")
+        if app.logger.isEnabledFor(logging.DEBUG):
+            app.logger.debug("Content preview: %s...", raw_content[:200].decode('utf-8', errors='replace'))
         
-        project_data = json.loads(content)
+        # Parse the raw bytes directly, without an intermediate decoded string
+        if is_msgpack:
+            project_data = msgpack.unpackb(raw_content, raw=False)
+        else:
+            project_data = _json_loads(raw_content)
         
-        print(f"Loading project - data keys: {project_data.keys()}")
+        app.logger.debug("Loading project - data keys: %s", project_data.keys())
         
         # Clear existing nodes and edges
         editor.nodes.clear()
@@ -4502,7 +4306,7 @@ def load_project():
         edges_loaded_from_file = False  # Track if edges were loaded from file
         
         if "concepts" in project_data and "nodes" not in project_data:
-            print("Detected legacy project format - converting concepts to nodes")
+            app.logger.debug("Detected legacy project format - converting concepts to nodes")
             # Convert legacy format to current format
             nodes_data = {}
             for concept_id, concept_data in project_data.get("concepts", {}).items():
@@ -4529,7 +4333,7 @@ def load_project():
                     break
             
             if not dataset_node_id:
-                dataset_node_id = str(uuid.uuid4())
+                dataset_node_id = fast_uuid()
                 nodes_data[dataset_node_id] = {
                     'id': dataset_node_id,
                     'type': 'dataset',
@@ -4557,13 +4361,13 @@ def load_project():
             
             node_count = len(editor.nodes)
             edge_count = len(editor.edges)
-            print(f"Converted legacy format: {node_count} nodes and {edge_count} edges")
+            app.logger.debug("Converted legacy format: %s nodes and %s edges", node_count, edge_count)
             
         else:
             # Load current format
             # Load nodes
             node_count = len(project_data.get("nodes", {}))
-            print(f"Loading {node_count} nodes from project")
+            app.logger.debug("Loading %s nodes from project", node_count)
             for node_id, node_data in project_data.get("nodes", {}).items():
                 editor.nodes[node_id] = SHACLNode.from_dict(node_data)
             
@@ -4572,33 +4376,48 @@ def load_project():
             if "edges" in project_data:
                 edges_data = project_data.get("edges", {})
                 edge_count = len(edges_data)
-                print(f"Loading {edge_count} edges from project data")
+                app.logger.debug("Loading %s edges from project data", edge_count)
                 editor.edges = edges_data
                 edges_loaded_from_file = True
             else:
-                print("No edges found in project data - will generate from node connections")
+                app.logger.debug("No edges found in project data - will generate from node connections")
         
         # Generate edges from node connections ONLY for backward compatibility
         # (when edges were not saved in the project file)
         if not edges_loaded_from_file:
-            conn_edges_added = 0
-            for node_id, node in editor.nodes.items():
+            # Collect the missing edges first and add them in a single update;
+            # each connected pair gets one edge, whichever direction comes first
+            nodes = editor.nodes
+            edges = editor.edges
+            new_edges = {}
+            seen_pairs = set()
+            for node_id, node in nodes.items():
                 for conn_id in node.connections:
-                    if conn_id in editor.nodes:
-                        edge_id = f"{node_id}-{conn_id}"
-                        # Only add if not already in edges
-                        if edge_id not in editor.edges:
-                            editor.create_edge(node_id, conn_id, '1..1')
-                            conn_edges_added += 1
+                    if conn_id not in nodes:
+                        continue
+                    pair = frozenset((node_id, conn_id))
+                    if pair in seen_pairs or edges.edge_id_for(node_id, conn_id):
+                        continue
+                    seen_pairs.add(pair)
+                    edge_id = f"{node_id}-{conn_id}"
+                    new_edges[edge_id] = {
+                        'id': edge_id,
+                        'from': node_id,
+                        'to': conn_id,
+                        'cardinality': '1..1',
+                        'order': None
+                    }
+            edges.update(new_edges)
+            conn_edges_added = len(new_edges)
             
             if conn_edges_added > 0:
-                print(f"Created {conn_edges_added} edges from node connections (backward compatibility)")
+                app.logger.debug("Created %s edges from node connections (backward compatibility)", conn_edges_added)
         else:
-            print(f"Skipped edge generation from node connections - edges already loaded from file")
+            app.logger.debug("Skipped edge generation from node connections - edges already loaded from file")
         
         total_nodes = len(editor.nodes)
         total_edges = len(editor.edges)
-        print(f"Project loaded: {total_nodes} nodes and {total_edges} total edges")
+        app.logger.debug("Project loaded: %s nodes and %s total edges", total_nodes, total_edges)
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"error": "Failed to load project"}), 500
@@ -4608,14 +4427,14 @@ def list_files():
     """List all saved graph files"""
     os.makedirs('data', exist_ok=True)
     files = [f for f in os.listdir('data') if f.endswith('.json')]
-    return jsonify({"files": files})
+    return ojsonify({"files": files})
 
 @app.route('/api/project/new', methods=['POST'])
 def new_project():
     """Create a new empty structure"""
     editor = get_user_editor()
     try:
-        print("API: Creating new project structure")
+        app.logger.debug("API: Creating new project structure")
         
         # Reset the structure
         result = editor.reset_structure()
@@ -4624,28 +4443,28 @@ def new_project():
             # Double-check that the reset worked
             node_count = len(editor.nodes)
             edge_count = len(editor.edges)
-            print(f"New project created: {node_count} nodes, {edge_count} edges")
+            app.logger.debug("New project created: %s nodes, %s edges", node_count, edge_count)
             
             # There should be exactly 1 node (the dataset) and 0 edges
             if node_count == 1 and edge_count == 0:
-                return jsonify({
+                return ojsonify({
                     "success": True,
                     "message": "New structure created successfully",
                     "nodeCount": node_count,
                     "edgeCount": edge_count
                 })
             else:
-                print(f"WARNING: Unexpected node/edge count after reset: {node_count} nodes, {edge_count} edges")
-                return jsonify({
+                app.logger.warning("Unexpected node/edge count after reset: %s nodes, %s edges", node_count, edge_count)
+                return ojsonify({
                     "success": True,
                     "message": "Structure reset, but with unexpected counts",
                     "nodeCount": node_count,
                     "edgeCount": edge_count
                 })
         else:
-            return jsonify({"error": "Failed to create new structure"}), 500
+            return ojsonify({"error": "Failed to create new structure"}), 500
     except Exception as e:
-        return jsonify({"error": "Failed to create new project"}), 500
+        return ojsonify({"error": "Failed to create new project"}), 500
 
 @app.route('/new-structure', methods=['GET'])
 def new_structure_page():
@@ -4662,40 +4481,29 @@ def new_structure_page():
 @app.route('/api/i14y/search', methods=['GET'])
 def search_i14y():
     """Search for concepts in I14Y"""
-    editor = get_user_editor()
-    print("=== API: Received request to search I14Y concepts ===")
-    
-    query = request.args.get('query', '') or request.args.get('q', '')
-    print(f"Search query: '{query}'")
-    
-    # Safely parse page and page_size parameters
-    try:
-        page = int(request.args.get('page', 1))
-    except (ValueError, TypeError):
-        page = 1
-        
-    try:
-        page_size = int(request.args.get('page_size', 20))
-    except (ValueError, TypeError):
-        page_size = 20
-    
-    print(f"Search parameters: page={page}, page_size={page_size}")
+    app.logger.debug("=== API: Received request to search I14Y concepts ===")
     
+    query = _search_query()
     if not query:
-        print("Empty query, returning empty results")
-        # Return empty results
-        return jsonify({"concepts": []})
+        # Empty query: return empty results without touching the editor or the client
+        return app.response_class(_EMPTY_CONCEPTS_RESPONSE, mimetype='application/json')
+    
+    app.logger.debug("Search query: '%s'", query)
+    editor = get_user_editor()
+    page = _int_arg('page', 1)
+    page_size = _int_arg('page_size', 20)
+    app.logger.debug("Search parameters: page=%s, page_size=%s", page, page_size)
     
     try:
         # Use I14Y client to search for concepts
-        print(f"Searching for concepts with query: '{query}'")
+        app.logger.debug("Searching for concepts with query: '%s'", query)
         results = editor.i14y_client.search_concepts(query, page, page_size)
-        print(f"Found {len(results)} concepts")
+        app.logger.debug("Found %s concepts", len(results))
         if results:
-            print(f"First result: {results[0].get('title') if results[0] else None}")
-        return jsonify({"concepts": results})
+            app.logger.debug("First result: %s", results[0].get('title') if results[0] else None)
+        return ojsonify({"concepts": results})
     except Exception as e:
-        return jsonify({"error": "Failed to search I14Y concepts", "concepts": []}), 500
+        return ojsonify({"error": "Failed to search I14Y concepts", "concepts": []}), 500
 
 
 @app.route('/api/i14y/agents', methods=['POST'])
@@ -4948,29 +4756,18 @@ def create_i14y_concept_from_data_element():
 @app.route('/api/i14y/dataset/search', methods=['GET'])
 def search_i14y_datasets():
     """Search for datasets in I14Y"""
-    editor = get_user_editor()
-    print("=== API: Received request to search I14Y datasets ===")
-    
-    query = request.args.get('query', '') or request.args.get('q', '')
-    print(f"Search query: '{query}'")
-    
-    # Safely parse page and page_size parameters
-    try:
-        page = int(request.args.get('page', 1))
-    except (ValueError, TypeError):
-        page = 1
-        
-    try:
-        page_size = int(request.args.get('page_size', 20))
-    except (ValueError, TypeError):
-        page_size = 20
-    
-    print(f"Search parameters: page={page}, page_size={page_size}")
+    app.logger.debug("=== API: Received request to search I14Y datasets ===")
     
+    query = _search_query()
     if not query:
-        print("Empty query, returning empty results")
-        # Return empty results
-        return jsonify({"datasets": []})
+        # Empty query: return empty results without touching the editor or the client
+        return app.response_class(_EMPTY_DATASETS_RESPONSE, mimetype='application/json')
+    
+    app.logger.debug("Search query: '%s'", query)
+    editor = get_user_editor()
+    page = _int_arg('page', 1)
+    page_size = _int_arg('page_size', 20)
+    app.logger.debug("Search parameters: page=%s, page_size=%s", page, page_size)
     
     try:
         # If query contains a UUID (dataset GUID), fetch it directly
@@ -4997,49 +4794,49 @@ def search_i14y_datasets():
                     continue
 
         if dataset_guid:
-            print(f"Detected dataset GUID query: {dataset_guid}")
+            app.logger.debug("Detected dataset GUID query: %s", dataset_guid)
             dataset = editor.i14y_client.get_dataset_details(dataset_guid)
             results = [dataset] if dataset else []
         else:
             # Use I14Y client to search for datasets by text
-            print(f"Searching for datasets with query: '{query}'")
+            app.logger.debug("Searching for datasets with query: '%s'", query)
             results = editor.i14y_client.search_datasets(query, page, page_size)
 
-        print(f"Found {len(results)} datasets")
+        app.logger.debug("Found %s datasets", len(results))
         if results:
-            print(f"First result: {results[0].get('title') if results[0] else None}")
-        return jsonify({"datasets": results})
+            app.logger.debug("First result: %s", results[0].get('title') if results[0] else None)
+        return ojsonify({"datasets": results})
     except Exception as e:
-        return jsonify({"error": "Failed to search I14Y datasets", "datasets": []}), 500
+        return ojsonify({"error": "Failed to search I14Y datasets", "datasets": []}), 500
 
 @app.route('/api/i14y/dataset/link', methods=['POST'])
 def link_i14y_dataset():
     """Link an I14Y dataset to the current dataset node"""
     editor = get_user_editor()
-    print("=== API: Received request to link I14Y dataset ===")
+    app.logger.debug("=== API: Received request to link I14Y dataset ===")
     
     if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
+        return ojsonify({"error": "Request must be JSON"}), 400
     
     # Get the JSON data
     data = request.json
-    print(f"Request data: {data.keys() if data else 'None'}")
+    app.logger.debug("Request data: %s", data.keys() if data else 'None')
     
     dataset_id = data.get('dataset_id')
     dataset_data = data.get('dataset_data')
     
     # Validate dataset data
     if not dataset_id or not dataset_data:
-        return jsonify({"error": "Dataset ID and data are required"}), 400
+        return ojsonify({"error": "Dataset ID and data are required"}), 400
     
-    print(f"Dataset ID: {dataset_id}")
-    print(f"Dataset data: {dataset_data.keys() if isinstance(dataset_data, dict) else 'not a dict'}")
+    app.logger.debug("Dataset ID: %s", dataset_id)
+    app.logger.debug("Dataset data: %s", dataset_data.keys() if isinstance(dataset_data, dict) else 'not a dict')
     
     try:
         # Find the specific dataset node
         dataset_node = editor.nodes.get(dataset_id)
         if not dataset_node or dataset_node.type != 'dataset':
-            return jsonify({"error": "Dataset node not found"}), 404
+            return ojsonify({"error": "Dataset node not found"}), 404
         
         # Update the dataset node with I14Y information
         if 'title' in dataset_data:
@@ -5047,7 +4844,7 @@ def link_i14y_dataset():
                 # Handle multilingual titles - store the full multilingual object
                 multilingual_titles = {
                     lang: desc for lang, desc in dataset_data['title'].items() 
-                    if lang in ['de', 'en', 'fr', 'it', 'rm'] and desc
+                    if lang in _ALL_LANGS and desc
                 }
                 # Ensure we have at least a German title as fallback
                 if not multilingual_titles:
@@ -5061,7 +4858,7 @@ def link_i14y_dataset():
                 # Handle multilingual descriptions - store the full multilingual object
                 multilingual_descriptions = {
                     lang: desc for lang, desc in dataset_data['description'].items() 
-                    if lang in ['de', 'en', 'fr', 'it', 'rm'] and desc
+                    if lang in _ALL_LANGS and desc
                 }
                 # Ensure we have at least a German description as fallback
                 if not multilingual_descriptions:
@@ -5082,9 +4879,9 @@ def link_i14y_dataset():
                 if public_data and isinstance(public_data, dict):
                     # Merge: public_data wins, so identifiers/identifier from public API overwrite
                     dataset_data = {**dataset_data, **public_data}
-                    print(f"Enriched with public API data. identifiers={public_data.get('identifiers')}")
+                    app.logger.debug("Enriched with public API data. identifiers=%s", public_data.get('identifiers'))
             except Exception as enrich_error:
-                print(f"Warning: Failed to fetch public dataset details: {enrich_error}")
+                app.logger.warning("Failed to fetch public dataset details: %s", enrich_error)
 
         # Store full I14Y dataset payload for UI display
         dataset_node.i14y_data = dataset_data
@@ -5118,7 +4915,7 @@ def link_i14y_dataset():
         if not i14y_identifier:
             i14y_identifier = dataset_data.get('identifier') or dataset_data.get('id')
 
-        print(f"Resolved i14y_identifier: {i14y_identifier}")
+        app.logger.debug("Resolved i14y_identifier: %s", i14y_identifier)
 
         # Set the identifier on the node
         dataset_node.identifier = i14y_identifier
@@ -5126,9 +4923,9 @@ def link_i14y_dataset():
         # Set the I14Y dataset URI
         dataset_node.i14y_dataset_uri = SHACLNode.build_i14y_dataset_uri(dataset_data)
         
-        print(f"Successfully linked dataset: {dataset_node.title} (ID: {dataset_id})")
+        app.logger.debug("Successfully linked dataset: %s (ID: %s)", dataset_node.title, dataset_id)
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "node": {
                 "id": dataset_node.id,
@@ -5140,29 +4937,25 @@ def link_i14y_dataset():
             }
         })
     except Exception as e:
-        return jsonify({"error": "Failed to link I14Y dataset"}), 500
+        return ojsonify({"error": "Failed to link I14Y dataset"}), 500
 
 @app.route('/api/i14y/dataset/disconnect', methods=['POST'])
 def disconnect_i14y_dataset():
     """Disconnect an I14Y dataset from the current dataset node"""
     editor = get_user_editor()
-    print("=== API: Received request to disconnect I14Y dataset ===")
+    app.logger.debug("=== API: Received request to disconnect I14Y dataset ===")
     
     try:
         # Find the dataset node
-        dataset_node = None
-        for node_id, node in editor.nodes.items():
-            if node.type == 'dataset':
-                dataset_node = node
-                break
+        dataset_node = editor.get_dataset_node()
         
         if not dataset_node:
-            return jsonify({"error": "No dataset node found"}), 404
+            return ojsonify({"error": "No dataset node found"}), 404
         
         # Check if dataset is actually connected to I14Y
         if not dataset_node.i14y_id and not dataset_node.i14y_dataset_uri:
-            print("WARNING: Dataset is not connected to I14Y")
-            return jsonify({"success": False, "message": "Dataset is not connected to I14Y"}), 400
+            app.logger.warning("Dataset is not connected to I14Y")
+            return ojsonify({"success": False, "message": "Dataset is not connected to I14Y"}), 400
         
         # Reset I14Y specific fields
         original_title = dataset_node.title
@@ -5172,9 +4965,9 @@ def disconnect_i14y_dataset():
         dataset_node.i14y_dataset_uri = None
         # Keep the title and description as they were
         
-        print(f"Successfully disconnected dataset: {original_title}")
+        app.logger.debug("Successfully disconnected dataset: %s", original_title)
         
-        return jsonify({
+        return ojsonify({
             "success": True,
             "node": {
                 "id": dataset_node.id,
@@ -5185,7 +4978,22 @@ def disconnect_i14y_dataset():
             }
         })
     except Exception as e:
-        return jsonify({"error": "Failed to disconnect I14Y dataset"}), 500
+        return ojsonify({"error": "Failed to disconnect I14Y dataset"}), 500
+
+# Filename sanitization for TTL downloads
+_FN_NON_ALNUM = re.compile(r'[^a-zA-Z0-9\-_]')
+_FN_UNDERSCORES = re.compile(r'_+')
+
+
+def _set_attachment_filename(response, filename):
+    """Mark a response as a download, encoding non-ASCII filenames like send_file does"""
+    try:
+        filename.encode('ascii')
+        names = {'filename': filename}
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+        names = {'filename': simple, 'filename*': f"UTF-8''{quote(filename, safe='!#$&+^`|~')}"}
+    response.headers.set('Content-Disposition', 'attachment', **names)
 
 @app.route('/api/export/ttl', methods=['GET'])
 def export_ttl():
@@ -5200,11 +5008,7 @@ def export_ttl():
         
         if not filename:
             # Try to get filename from dataset information
-            dataset_node = None
-            for node in editor.nodes.values():
-                if node.type == 'dataset':
-                    dataset_node = node
-                    break
+            dataset_node = editor.get_dataset_node()
             
             if dataset_node:
                 # Use dataset identifier if available
@@ -5215,10 +5019,7 @@ def export_ttl():
                     # Sanitize title for use as filename
                     # Handle multilingual title
                     if isinstance(dataset_node.title, dict):
-                        title_text = (dataset_node.title.get('de') or 
-                                     dataset_node.title.get('en') or 
-                                     dataset_node.title.get('fr') or 
-                                     dataset_node.title.get('it') or 
+                        title_text = (_pick_lang(dataset_node.title, '', _PRIMARY_LANGS) or
                                      next(iter(dataset_node.title.values()), ""))
                     else:
                         title_text = str(dataset_node.title)
@@ -5226,9 +5027,8 @@ def export_ttl():
                     if title_text and title_text.strip():
                         sanitized_title = title_text.strip()
                         # Replace invalid filename characters
-                        import re
-                        sanitized_title = re.sub(r'[^a-zA-Z0-9\-_]', '_', sanitized_title)
-                        sanitized_title = re.sub(r'_+', '_', sanitized_title)
+                        sanitized_title = _FN_NON_ALNUM.sub('_', sanitized_title)
+                        sanitized_title = _FN_UNDERSCORES.sub('_', sanitized_title)
                         sanitized_title = sanitized_title.strip('_')
                         filename = sanitized_title + '.ttl'
             
@@ -5237,18 +5037,10 @@ def export_ttl():
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"shacl_export_{timestamp}.ttl"
         
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(suffix='.ttl', delete=False) as tmp:
-            tmp.write(ttl_content.encode('utf-8'))
-            tmp_path = tmp.name
-        
-        # Return file for download with dynamic filename
-        return send_file(
-            tmp_path,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='text/turtle'
-        )
+        # Return the in-memory TTL for download with dynamic filename
+        response = Response(ttl_content, mimetype='text/turtle')
+        _set_attachment_filename(response, filename)
+        return response
     except Exception as e:
         return jsonify({"error": "Failed to export TTL"}), 500
 
@@ -5271,120 +5063,111 @@ def get_schemes():
 def get_i14y_concept(concept_id):
     """Get details of a specific I14Y concept by ID"""
     editor = get_user_editor()
-    print(f"=== API: Received request to get I14Y concept with ID: {concept_id} ===")
+    app.logger.debug("=== API: Received request to get I14Y concept with ID: %s ===", concept_id)
     
     try:
         concept_data = editor.i14y_client.get_concept_details(concept_id)
         if concept_data:
-            print(f"Found concept: {concept_data.get('title', {}).get('de', 'Unknown')}")
-            return jsonify({"success": True, "concept": concept_data})
+            app.logger.debug("Found concept: %s", concept_data.get('title', {}).get('de', 'Unknown'))
+            return ojsonify({"success": True, "concept": concept_data})
         else:
-            print(f"Concept not found with ID: {concept_id}")
+            app.logger.debug("Concept not found with ID: %s", concept_id)
             # Return a 404 status code to indicate the concept was not found
-            return jsonify({
+            return ojsonify({
                 "success": False, 
                 "error": "Concept not found",
                 "message": "The concept could not be found via the I14Y API. This may be due to an invalid ID or API changes."
             }), 404
     except Exception as e:
-        return jsonify({
+        return ojsonify({
             "success": False, 
             "error": "Failed to fetch concept from I14Y API",
             "message": "There was an error fetching the concept from the I14Y API."
         }), 500
 
+# Maximum number of concept IDs accepted by one bulk request
+_BULK_CONCEPT_LIMIT = 100
+
+@app.route('/api/i14y/concepts/bulk', methods=['POST'])
+def get_i14y_concepts_bulk():
+    """Get details of several I14Y concepts in one request"""
+    editor = get_user_editor()
+    data = request.get_json(silent=True) or {}
+    concept_ids = data.get('ids')
+    if not isinstance(concept_ids, list) or not all(isinstance(cid, str) and cid for cid in concept_ids):
+        return ojsonify({"success": False, "error": "ids must be a list of concept IDs"}), 400
+    if len(concept_ids) > _BULK_CONCEPT_LIMIT:
+        return ojsonify({"success": False, "error": f"At most {_BULK_CONCEPT_LIMIT} concept IDs per request"}), 400
+    
+    concepts = editor.i14y_client.get_many_concept_details(concept_ids)
+    app.logger.debug("Fetched %s of %s requested concepts", sum(c is not None for c in concepts.values()), len(concepts))
+    return ojsonify({"success": True, "concepts": {cid: concepts[cid] for cid in dict.fromkeys(concept_ids)}})
+
 @app.route('/api/i14y/add', methods=['POST'])
 def add_i14y_concept():
     """Add an I14Y concept to the graph"""
     editor = get_user_editor()
-    print("=== API: Received request to add I14Y concept ===")
+    app.logger.debug("=== API: Received request to add I14Y concept ===")
     
     if not request.is_json:
-        return jsonify({"error": "Request must be JSON"}), 400
+        return ojsonify({"error": "Request must be JSON"}), 400
     
     # Get the JSON data
     data = request.json
-    print(f"Request data: {data.keys() if data else 'None'}")
+    app.logger.debug("Request data: %s", data.keys() if data else 'None')
     
     concept_data = data.get('concept_data')
     parent_id = data.get('parent_id')
     
     # Validate concept data
     if not concept_data:
-        return jsonify({"error": "Concept data is required"}), 400
+        return ojsonify({"error": "Concept data is required"}), 400
     
-    print(f"Concept data: {concept_data.keys() if isinstance(concept_data, dict) else 'not a dict'}")
-    print(f"Parent ID: {parent_id}")
+    app.logger.debug("Concept data: %s", concept_data.keys() if isinstance(concept_data, dict) else 'not a dict')
+    app.logger.debug("Parent ID: %s", parent_id)
     
     try:
         # Create a concept node from I14Y data
         concept_node = SHACLNode('concept')
         concept_node.set_i14y_concept(concept_data)
         
-        print(f"Created node with ID: {concept_node.id}, title: {concept_node.title}")
+        app.logger.debug("Created node with ID: %s, title: %s", concept_node.id, concept_node.title)
         
         # Add to nodes
         editor.nodes[concept_node.id] = concept_node
-        print(f"Added node to editor, total nodes: {len(editor.nodes)}")
+        app.logger.debug("Added node to editor, total nodes: %s", len(editor.nodes))
         
         # Connect to parent if specified
         if parent_id and parent_id in editor.nodes:
-            # Add to connections sets
-            editor.nodes[parent_id].connections.add(concept_node.id)
-            concept_node.connections.add(parent_id)
-            
-            # Create an edge in the edge dictionary
-            edge_id = f"{parent_id}-{concept_node.id}"
-            editor.edges[edge_id] = {
-                'id': edge_id,
-                'from': parent_id,
-                'to': concept_node.id,
-                'cardinality': '1..1'
-            }
-            print(f"Created edge from {parent_id} to {concept_node.id}")
+            # Create an edge in the edge dictionary (this also links the node connections)
+            editor.edges.add_edge(parent_id, concept_node.id)
+            app.logger.debug("Created edge from %s to %s", parent_id, concept_node.id)
         else:
             # If no parent specified, connect to dataset node
-            dataset_node = None
-            for n_id, n in editor.nodes.items():
-                if n.type == 'dataset':
-                    dataset_node = n
-                    break
+            dataset_node = editor.get_dataset_node()
             
             if dataset_node:
-                # Add to connections sets
-                dataset_node.connections.add(concept_node.id)
-                concept_node.connections.add(dataset_node.id)
-                
-                # Create an edge in the edge dictionary
-                edge_id = f"{dataset_node.id}-{concept_node.id}"
-                editor.edges[edge_id] = {
-                    'id': edge_id,
-                    'from': dataset_node.id,
-                    'to': concept_node.id,
-                    'cardinality': '1..1'
-                }
-                print(f"Created edge from {dataset_node.id} to {concept_node.id}")
+                # Create an edge in the edge dictionary (this also links the node connections)
+                editor.edges.add_edge(dataset_node.id, concept_node.id)
+                app.logger.debug("Created edge from %s to %s", dataset_node.id, concept_node.id)
         
-        print(f"Successfully added concept node with ID: {concept_node.id}")
-        return jsonify({"success": True, "node_id": concept_node.id})
+        app.logger.debug("Successfully added concept node with ID: %s", concept_node.id)
+        return ojsonify({"success": True, "node_id": concept_node.id})
     except Exception as e:
-        return jsonify({"error": "Failed to add I14Y concept"}), 500
+        return ojsonify({"error": "Failed to add I14Y concept"}), 500
 
 @app.route('/api/dataset', methods=['GET', 'POST'])
 def handle_dataset():
     """Get or update dataset information"""
     editor = get_user_editor()
     # Find the dataset node
-    dataset_node = None
-    for node_id, node in editor.nodes.items():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    dataset_node = editor.get_dataset_node()
     
     # If no dataset node exists, create one
     if not dataset_node:
         dataset_node = SHACLNode('dataset', title="New Dataset", description="Dataset description")
         editor.nodes[dataset_node.id] = dataset_node
+        editor._dataset_node_id = dataset_node.id
     
     if request.method == 'POST':
         # Update dataset information
@@ -5404,281 +5187,70 @@ def handle_dataset():
             'identifier': dataset_node.identifier
         })
 
-def parse_ttl_to_nodes(g: Graph, editor) -> bool:
-    """Parse RDF graph back to SHACLNode objects"""
-    try:
-        from rdflib.namespace import DCTERMS, DCAT, QB
-        
-        # Define namespaces
-        SH = Namespace("http://www.w3.org/ns/shacl#")
-        
-        # Find NodeShapes (classes and dataset)
-        node_shapes = list(g.subjects(RDF.type, SH.NodeShape))
-        dataset_node = None
-        created_nodes = {}
-        
-        print(f"Found {len(node_shapes)} NodeShapes")
-        
-        # First identify which NodeShape is the dataset
-        dataset_shape = None
-        for shape in node_shapes:
-            # Check for dataset-specific indicators
-            is_dataset = False
-            
-            # Check for data structure definition
-            if (shape, RDF.type, QB.DataStructureDefinition) in g:
-                is_dataset = True
-            
-            # Check for DCAT dataset type
-            if (shape, RDF.type, DCAT.Dataset) in g:
-                is_dataset = True
-                
-            # Check for version information (typically only on datasets)
-            if list(g.objects(shape, Namespace("http://purl.org/pav/").version)):
-                is_dataset = True
-                
-            # Check if it has validFrom (typically only on datasets)
-            if list(g.objects(shape, Namespace("https://schema.org/").validFrom)):
-                is_dataset = True
-                
-            if is_dataset:
-                dataset_shape = shape
-                break
-        
-        def _collect_multilingual(literals, fallback_literals=None):
-            """Collect all language-tagged literals into a dict; fall back to untagged as 'de'."""
-            result = {}
-            source = literals if literals else (fallback_literals or [])
-            for lit in source:
-                lang = getattr(lit, 'language', None)
-                if lang:
-                    result[lang] = str(lit)
-            if not result:
-                # No language tags — use first available as 'de' fallback
-                if source:
-                    result['de'] = str(source[0])
-            return result
-
-        # First pass: Create dataset and class nodes
-        for shape in node_shapes:
-            # Get basic properties
-            titles = list(g.objects(shape, DCTERMS.title))
-            labels = list(g.objects(shape, SH.name)) or list(g.objects(shape, RDFS.label))
-            descriptions = list(g.objects(shape, DCTERMS.description)) or list(g.objects(shape, SH.description))
-
-            # Collect all available language variants
-            title = _collect_multilingual(titles, labels)
-            description = _collect_multilingual(descriptions)
-            
-            # Determine if this is a dataset or class
-            node_id = str(uuid.uuid4())
-            node_type = 'dataset' if shape == dataset_shape else 'class'
-            
-            if not dataset_node and node_type == 'dataset':
-                dataset_node = node_id
-            
-            # Create SHACLNode
-            node_data = {
-                'id': node_id,
-                'type': node_type,
-                'title': title,
-                'description': description
-            }
-            
-            node = SHACLNode.from_dict(node_data)
-            editor.nodes[node_id] = node
-            created_nodes[str(shape)] = node_id
-            
-            display_title = title.get('de') or next(iter(title.values()), '') if isinstance(title, dict) else title
-            print(f"Created {node_type}: {display_title}")
-        
-        # Second pass: Create data element nodes from PropertyShapes
-        property_shapes = list(g.subjects(RDF.type, SH.PropertyShape))
-        
-        for prop_shape in property_shapes:
-            # Handle object properties (class-to-class relationship) separately
-            is_object_property = (prop_shape, RDF.type, OWL.ObjectProperty) in g
-            
-            # Get property details
-            titles = list(g.objects(prop_shape, DCTERMS.title))
-            labels = list(g.objects(prop_shape, SH.name)) or list(g.objects(prop_shape, RDFS.label))
-            descriptions = list(g.objects(prop_shape, DCTERMS.description)) or list(g.objects(prop_shape, SH.description))
-
-            # Collect all available language variants
-            title = _collect_multilingual(titles, labels)
-            description = _collect_multilingual(descriptions)
-            
-            # Extract constraints
-            min_count = None
-            max_count = None
-            min_length = None
-            max_length = None
-            pattern = None
-            datatype = None
-            
-            # Get cardinality constraints
-            min_counts = list(g.objects(prop_shape, SH.minCount))
-            if min_counts:
-                min_count = int(min_counts[0])
-                
-            max_counts = list(g.objects(prop_shape, SH.maxCount))
-            if max_counts:
-                max_count = int(max_counts[0])
-            
-            # Get length constraints
-            min_lengths = list(g.objects(prop_shape, SH.minLength))
-            if min_lengths:
-                min_length = int(min_lengths[0])
-                
-            max_lengths = list(g.objects(prop_shape, SH.maxLength))
-            if max_lengths:
-                max_length = int(max_lengths[0])
-            
-            # Get pattern
-            patterns = list(g.objects(prop_shape, SH.pattern))
-            if patterns:
-                pattern = str(patterns[0])
-            
-            # Get datatype
-            datatypes = list(g.objects(prop_shape, SH.datatype))
-            if datatypes:
-                datatype = str(datatypes[0])
-                
-            # Extract enumeration values (sh:in)
-            in_values = []
-            in_lists = list(g.objects(prop_shape, SH['in']))
-            if in_lists:
-                # Follow the RDF list structure
-                current = in_lists[0]
-                while current and current != RDF.nil:
-                    value_literals = list(g.objects(current, RDF.first))
-                    if value_literals:
-                        in_values.append(str(value_literals[0]))
-                    next_nodes = list(g.objects(current, RDF.rest))
-                    if next_nodes:
-                        current = next_nodes[0]
-                    else:
-                        break
-            
-            # Read sh:order
-            order = None
-            order_vals = list(g.objects(prop_shape, SH.order))
-            if order_vals:
-                try:
-                    order = int(order_vals[0])
-                except (ValueError, TypeError):
-                    pass
+# Leading bytes of binary formats that are sometimes uploaded by mistake
+# (ZIP/XLSX, legacy Office, PDF, PNG, JPEG, GIF)
+_BINARY_SIGNATURES = (b'PK\x03\x04', b'\xd0\xcf\x11\xe0', b'%PDF', b'\x89PNG', b'\xff\xd8\xff', b'GIF8')
+# First statement of a Turtle document: a directive, an IRI, a blank node or a comment
+_TTL_START = re.compile(rb'\s*(?:@prefix|@base|prefix\s|base\s|<|_:|\[|#|$)', re.IGNORECASE)
 
-            # Check for conformsTo to identify data elements with concept links
-            conforms_to_uris = list(g.objects(prop_shape, DCTERMS.conformsTo))
-            conforms_to_uri = conforms_to_uris[0] if conforms_to_uris else None
-                
-            # Create data element node (not concept)
-            node_id = str(uuid.uuid4())
-            node_data = {
-                'id': node_id,
-                'type': 'data_element',  # Always create as data_element instead of concept
-                'title': title,
-                'description': description,
-                'min_count': min_count,
-                'max_count': max_count,
-                'min_length': min_length,
-                'max_length': max_length,
-                'pattern': pattern,
-                'datatype': datatype or 'xsd:string',
-                'in_values': in_values,
-                'order': order
-            }
-            
-            # If this is an object property pointing to a class, handle it differently
-            if is_object_property:
-                # Extract the target class that this object property points to
-                node_refs = list(g.objects(prop_shape, SH.node))
-                if node_refs:
-                    target_class_uri = str(node_refs[0])
-                    if target_class_uri in created_nodes:
-                        # The class has already been created, so just store the reference
-                        # We'll create connections in the next pass
-                        created_nodes[str(prop_shape)] = created_nodes[target_class_uri]
-                        _dt = title.get('de') or next(iter(title.values()), '') if isinstance(title, dict) else title
-                        print(f"Mapped object property {_dt} to class reference")
-                        continue
-            
-            # Add the local_name for the data element (from path or extracted from shape URI)
-            local_name = None
-            paths = list(g.objects(prop_shape, SH.path))
-            if paths:
-                path_str = str(paths[0])
-                local_name = path_str.split('/')[-1].replace('#', '')
-                
-            if not local_name:
-                local_name = str(prop_shape).split('/')[-1].replace('#', '')
-                
-            node_data['local_name'] = local_name
-                
-            # If this data element has a conformsTo link, set it
-            if conforms_to_uri:
-                node_data['conforms_to_concept_uri'] = str(conforms_to_uri)
-                node_data['is_linked_to_concept'] = True
-            
-            node = SHACLNode.from_dict(node_data)
-            editor.nodes[node_id] = node
-            created_nodes[str(prop_shape)] = node_id
-            
-            # Log message based on whether it has a concept link
-            _dt = title.get('de') or next(iter(title.values()), '') if isinstance(title, dict) else title
-            if conforms_to_uri:
-                print(f"Created data element with concept link: {_dt}")
-            else:
-                print(f"Created data element: {_dt}")
-        
-        # Third pass: Create connections based on sh:property relationships
-        for shape in node_shapes:
-            shape_node_id = created_nodes.get(str(shape))
-            if not shape_node_id:
-                continue
-                
-            # Find properties of this shape
-            properties = list(g.objects(shape, SH.property))
-            for prop in properties:
-                prop_node_id = created_nodes.get(str(prop))
-                if prop_node_id:
-                    # Connect shape to property
-                    editor.nodes[shape_node_id].connections.add(prop_node_id)
-                    editor.nodes[prop_node_id].connections.add(shape_node_id)
-                    
-                    # Create edge with cardinality
-                    cardinality = "1..1"  # Default
-                    min_counts = list(g.objects(prop, SH.minCount))
-                    max_counts = list(g.objects(prop, SH.maxCount))
-                    
-                    if min_counts or max_counts:
-                        min_c = int(min_counts[0]) if min_counts else 0
-                        max_c = int(max_counts[0]) if max_counts else None
-                        
-                        if max_c is None:
-                            cardinality = f"{min_c}..n"
-                        else:
-                            cardinality = f"{min_c}..{max_c}"
-                    
-                    editor.create_edge(shape_node_id, prop_node_id, cardinality)
-                    def _dt(t): return t.get('de') or next(iter(t.values()), '') if isinstance(t, dict) else t
-                    print(f"Connected {_dt(editor.nodes[shape_node_id].title)} -> {_dt(editor.nodes[prop_node_id].title)} ({cardinality})")
-        
-        # Connect everything to dataset if we have one
-        if dataset_node:
-            for node_id, node in editor.nodes.items():
-                if node_id != dataset_node and node.type in ['class', 'concept']:
-                    # Only connect if not already connected to something else
-                    if not node.connections:
-                        editor.nodes[dataset_node].connections.add(node_id)
-                        editor.nodes[node_id].connections.add(dataset_node)
-                        editor.create_edge(dataset_node, node_id, "1..1")
-        
+
+def _peek_upload(file, size=4096) -> bytes:
+    """Return the first bytes of an uploaded file without consuming its stream"""
+    head = file.stream.read(size)
+    file.stream.seek(0)
+    return head
+
+
+def _looks_like_ttl(head: bytes) -> bool:
+    """Cheap check that an upload can be Turtle before it is parsed"""
+    if head.startswith(b'\xef\xbb\xbf'):
+        head = head[3:]
+    return not head.startswith(_BINARY_SIGNATURES) and b'\x00' not in head and _TTL_START.match(head) is not None
+
+
+def _looks_like_csv(head: bytes) -> bool:
+    """Cheap check that an upload is not an empty or binary file before it is decoded"""
+    return bool(head.strip()) and not head.startswith(_BINARY_SIGNATURES)
+
+
+# Uploads larger than this are imported on a worker thread; the client polls
+# /api/import/status/<job_id> instead of holding the request open
+_BACKGROUND_IMPORT_THRESHOLD = 1 << 20
+_import_executor = ThreadPoolExecutor(max_workers=2)
+_import_jobs = {}  # job ID -> (session ID, Future, expiry time)
+_import_jobs_lock = threading.Lock()
+# Finished jobs nobody polled for are dropped this many seconds after submission
+_IMPORT_JOB_TTL = 3600
+
+
+def _sweep_import_jobs(now):
+    """Drop finished import jobs past their expiry (caller holds _import_jobs_lock)"""
+    expired = [job_id for job_id, (_, future, expires) in _import_jobs.items()
+               if expires <= now and future.done()]
+    for job_id in expired:
+        del _import_jobs[job_id]
+
+
+def _import_ttl_job(data: bytes, editor) -> bool:
+    """Import TTL into a scratch editor and swap the result into the user's editor
+    
+    Requests hold editor.lock while they run, so the swap waits for them and
+    no request sees new edges with old nodes; requests that would modify the
+    editor are refused while editor.pending_import is set.
+    """
+    try:
+        scratch = FlaskSHACLGraphEditor()
+        if not import_ttl_file(data, scratch):
+            return False
+        with editor.lock:
+            # Edges first so the old edges are never linked into the new nodes
+            editor.edges = scratch.edges
+            editor.nodes = scratch.nodes
+            editor.touch()
         return True
-        
-    except Exception as e:
-        return False
+    finally:
+        with editor.lock:
+            editor.pending_import = None
 
 @app.route('/api/import/ttl', methods=['POST'])
 def import_ttl():
@@ -5694,12 +5266,23 @@ def import_ttl():
     if not file.filename.endswith('.ttl'):
         return jsonify({"error": "Only TTL files are supported"}), 400
     
+    if not _looks_like_ttl(_peek_upload(file)):
+        return jsonify({"error": "File does not look like a Turtle (TTL) document"}), 400
+    
+    if (request.content_length or 0) > _BACKGROUND_IMPORT_THRESHOLD:
+        # The upload stream is gone once the request ends, so read it here
+        job_id = uuid.uuid4().hex
+        editor.pending_import = job_id
+        future = _import_executor.submit(_import_ttl_job, file.read(), editor)
+        now = time.monotonic()
+        with _import_jobs_lock:
+            _sweep_import_jobs(now)
+            _import_jobs[job_id] = (session['session_id'], future, now + _IMPORT_JOB_TTL)
+        return jsonify({"job_id": job_id, "status": "running"}), 202
+    
     try:
-        # Read file content
-        content = file.read().decode('utf-8')
-        
-        # Use the import_ttl_file function from imports module
-        success = import_ttl_file(content, editor)
+        # Parse straight from the upload stream (no full read + decode)
+        success = import_ttl_file(file.stream, editor)
         
         if success:
             return jsonify({"success": True})
@@ -5709,6 +5292,27 @@ def import_ttl():
     except Exception as e:
         return jsonify({"error": "Failed to import TTL"}), 500
 
+@app.route('/api/import/status/<job_id>', methods=['GET'])
+def import_status(job_id):
+    """Report the state of a background TTL import"""
+    with _import_jobs_lock:
+        job = _import_jobs.get(job_id)
+        if job is None or job[0] != session.get('session_id'):
+            return jsonify({"error": "Import job not found"}), 404
+        if not job[1].done():
+            return jsonify({"status": "running"})
+        del _import_jobs[job_id]
+    
+    try:
+        success = job[1].result()
+    except Exception as e:
+        app.logger.exception("Background TTL import failed: %s", e)
+        return jsonify({"status": "done", "error": "Failed to import TTL"})
+    
+    if success:
+        return jsonify({"status": "done", "success": True})
+    return jsonify({"status": "done", "error": "Failed to parse TTL structure"})
+
 @app.route('/api/import/example/ttl', methods=['GET'])
 def import_example_ttl():
     """Import example TTL file"""
@@ -5734,19 +5338,24 @@ def import_example_ttl():
     except Exception as e:
         return jsonify({"error": "Failed to import example TTL"}), 500
 
+def _literal_int(value) -> Optional[int]:
+    """Convert an RDF literal to int; None when missing or not an integer"""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
 def _process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name: str):
     """Parse a CSV-generated TTL string and populate the editor with the resulting nodes."""
-    g = Graph()
-    g.parse(data=ttl, format='turtle')
+    g = load_turtle_graph(data=io.BytesIO(ttl.encode('utf-8')))
     SUG = Namespace("https://www.i14y.admin.ch/vocab#")
 
     editor.reset_structure()
 
-    dataset_node = None
-    for node in editor.nodes.values():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    dataset_node = editor.get_dataset_node()
 
     if not dataset_node:
         dataset_node = SHACLNode('dataset', title=dataset_name)
@@ -5758,93 +5367,44 @@ def _process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name
     property_shapes = [s for s, _, _ in g.triples((None, RDF.type, SH.PropertyShape))]
 
     for shape in property_shapes:
-        prop_name = None
-        for _, _, name in g.triples((shape, SH.name, None)):
-            prop_name = str(name)
-            break
-        if not prop_name:
-            prop_name = ""
+        name = g.value(shape, SH.name)
+        prop_name = str(name) if name is not None else ""
 
-        datatype = None
-        for _, _, dt in g.triples((shape, SH.datatype, None)):
-            datatype = str(dt)
-            break
+        datatype = g.value(shape, SH.datatype)
 
         data_element_node = SHACLNode('data_element', title=prop_name)
         data_element_node.local_name = prop_name
         data_element_node.identifier = prop_name
-        data_element_node.datatype = datatype or "xsd:string"
+        data_element_node.datatype = str(datatype) if datatype else "xsd:string"
 
-        for _, _, value in g.triples((shape, SH.order, None)):
-            try:
-                data_element_node.order = int(value)
-            except (ValueError, TypeError):
-                pass
-            break
+        data_element_node.order = _literal_int(g.value(shape, SH.order))
 
-        for _, _, value in g.triples((shape, SUG.suggestedPattern, None)):
+        value = g.value(shape, SUG.suggestedPattern)
+        if value is not None:
             data_element_node.suggested_pattern = str(value)
-            break
 
-        for _, _, value in g.triples((shape, SUG.suggestedInValues, None)):
+        value = g.value(shape, SUG.suggestedInValues)
+        if value is not None:
             try:
                 suggested_values = json.loads(str(value))
                 data_element_node.suggested_in_values = sort_enumeration_values(suggested_values) if isinstance(suggested_values, list) else suggested_values
             except (ValueError, json.JSONDecodeError):
                 pass
-            break
-
-        for _, _, value in g.triples((shape, SUG.suggestedMinLength, None)):
-            try:
-                data_element_node.suggested_min_length = int(value)
-            except (ValueError, TypeError):
-                pass
-            break
 
-        for _, _, value in g.triples((shape, SUG.suggestedMaxLength, None)):
-            try:
-                data_element_node.suggested_max_length = int(value)
-            except (ValueError, TypeError):
-                pass
-            break
+        data_element_node.suggested_min_length = _literal_int(g.value(shape, SUG.suggestedMinLength))
+        data_element_node.suggested_max_length = _literal_int(g.value(shape, SUG.suggestedMaxLength))
 
         editor.nodes[data_element_node.id] = data_element_node
-        dataset_node.connections.add(data_element_node.id)
-        data_element_node.connections.add(dataset_node.id)
-
-        edge_id = f"{dataset_node.id}_{data_element_node.id}"
-        editor.edges[edge_id] = {
-            "id": edge_id,
-            "from": dataset_node.id,
-            "to": data_element_node.id,
-            "cardinality": "0..1"
-        }
-
-        for _, _, value in g.triples((shape, SH.minCount, None)):
-            try:
-                data_element_node.min_count = int(value)
-            except (ValueError, TypeError):
-                pass
-
-        for _, _, value in g.triples((shape, SH.maxCount, None)):
-            try:
-                data_element_node.max_count = int(value)
-            except (ValueError, TypeError):
-                pass
-
-        for _, _, value in g.triples((shape, SH.minLength, None)):
-            try:
-                data_element_node.min_length = int(value)
-            except (ValueError, TypeError):
-                pass
+        editor.edges.add_edge(dataset_node.id, data_element_node.id, "0..1",
+                              edge_id=f"{dataset_node.id}_{data_element_node.id}")
 
-        for _, _, value in g.triples((shape, SH.maxLength, None)):
-            try:
-                data_element_node.max_length = int(value)
-            except (ValueError, TypeError):
-                pass
+        data_element_node.min_count = _literal_int(g.value(shape, SH.minCount))
+        data_element_node.max_count = _literal_int(g.value(shape, SH.maxCount))
+        data_element_node.min_length = _literal_int(g.value(shape, SH.minLength))
+        data_element_node.max_length = _literal_int(g.value(shape, SH.maxLength))
 
-        for _, _, value in g.triples((shape, SH.pattern, None)):
+        value = g.value(shape, SH.pattern)
+        if value is not None:
             data_element_node.pattern = str(value)
 
         for _, _, in_list in g.triples((shape, SH['in'], None)):
@@ -5861,7 +5421,7 @@ def _process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name
             if values_list:
                 data_element_node.in_values = values_list
 
-    print(f"Successfully processed TTL. Created {len(property_shapes)} data element nodes.")
+    app.logger.debug("Successfully processed TTL. Created %s data element nodes.", len(property_shapes))
 
 
 def detect_and_decode_csv(file_content: bytes, encoding: str = 'auto') -> tuple[str, str]:
@@ -5888,37 +5448,37 @@ def detect_and_decode_csv(file_content: bytes, encoding: str = 'auto') -> tuple[
             detected_encoding = detected.get('encoding')
             confidence = detected.get('confidence', 0)
             
-            print(f"Chardet detected encoding: {detected_encoding} (confidence: {confidence})")
+            app.logger.debug("Chardet detected encoding: %s (confidence: %s)", detected_encoding, confidence)
             
             # If confidence is high enough, try the detected encoding first
             if detected_encoding and confidence > 0.7:
                 try:
                     decoded = file_content.decode(detected_encoding)
-                    print(f"Successfully decoded with detected encoding: {detected_encoding}")
+                    app.logger.debug("Successfully decoded with detected encoding: %s", detected_encoding)
                     return decoded, detected_encoding
                 except (UnicodeDecodeError, LookupError) as e:
-                    print(f"Failed to decode with detected encoding {detected_encoding}: {e}")
+                    app.logger.warning("Failed to decode with detected encoding %s: %s", detected_encoding, e)
         except Exception as e:
-            print(f"Chardet detection failed: {e}")
+            app.logger.warning("Chardet detection failed: %s", e)
         
         # Fall back to trying common encodings
         for enc in common_encodings:
             try:
                 decoded = file_content.decode(enc)
-                print(f"Successfully decoded with fallback encoding: {enc}")
+                app.logger.debug("Successfully decoded with fallback encoding: %s", enc)
                 return decoded, enc
             except (UnicodeDecodeError, LookupError):
                 continue
         
         # If all else fails, use latin-1 which accepts all byte values
         decoded = file_content.decode('latin-1', errors='replace')
-        print(f"Using latin-1 as last resort with error replacement")
+        app.logger.warning("Using latin-1 as last resort with error replacement")
         return decoded, 'latin-1'
     else:
         # Use the specified encoding
         try:
             decoded = file_content.decode(encoding)
-            print(f"Successfully decoded with specified encoding: {encoding}")
+            app.logger.debug("Successfully decoded with specified encoding: %s", encoding)
             return decoded, encoding
         except (UnicodeDecodeError, LookupError) as e:
             raise UnicodeDecodeError(
@@ -5955,18 +5515,7 @@ def decode_uploaded_text(file_content: bytes) -> tuple[str, str]:
 
 def slug_identifier(value: str, fallback: str = 'field') -> str:
     """Build an ASCII-safe identifier from free-form input text."""
-    raw = (value or '').strip()
-    if not raw:
-        return fallback
-
-    normalized = unicodedata.normalize('NFKD', raw)
-    ascii_text = normalized.encode('ascii', 'ignore').decode('ascii')
-    slug = re.sub(r"\s+", "_", ascii_text)
-    slug = re.sub(r"[^A-Za-z0-9_-]", "", slug)
-    slug = re.sub(r"_+", "_", slug)
-    slug = re.sub(r"-+", "-", slug)
-    slug = slug.strip('_-')
-    return slug or fallback
+    return _ascii_slug(value) or fallback
 
 
 def infer_geojson_datatype(values: List[Any]) -> str:
@@ -6013,11 +5562,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
 
     editor.reset_structure()
 
-    dataset_node = None
-    for node in editor.nodes.values():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    dataset_node = editor.get_dataset_node()
 
     if not dataset_node:
         dataset_node = SHACLNode('dataset', title=dataset_name, description=f"Dataset imported from {source_filename}")
@@ -6032,15 +5577,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
     class_node.local_name = class_node.identifier
     editor.nodes[class_node.id] = class_node
 
-    dataset_edge_id = f"{dataset_node.id}-{class_node.id}"
-    editor.edges[dataset_edge_id] = {
-        'id': dataset_edge_id,
-        'from': dataset_node.id,
-        'to': class_node.id,
-        'cardinality': '1..1'
-    }
-    dataset_node.connections.add(class_node.id)
-    class_node.connections.add(dataset_node.id)
+    editor.edges.add_edge(dataset_node.id, class_node.id)
 
     property_values: Dict[str, List[Any]] = {}
     present_count: Dict[str, int] = {}
@@ -6086,15 +5623,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
 
         editor.nodes[data_node.id] = data_node
 
-        edge_id = f"{class_node.id}-{data_node.id}"
-        editor.edges[edge_id] = {
-            'id': edge_id,
-            'from': class_node.id,
-            'to': data_node.id,
-            'cardinality': f"{data_node.min_count}..1"
-        }
-        class_node.connections.add(data_node.id)
-        data_node.connections.add(class_node.id)
+        editor.edges.add_edge(class_node.id, data_node.id, f"{data_node.min_count}..1")
         order += 10
 
     if geometry_types:
@@ -6109,15 +5638,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
 
         editor.nodes[geometry_node.id] = geometry_node
 
-        edge_id = f"{class_node.id}-{geometry_node.id}"
-        editor.edges[edge_id] = {
-            'id': edge_id,
-            'from': class_node.id,
-            'to': geometry_node.id,
-            'cardinality': f"{geometry_node.min_count}..1"
-        }
-        class_node.connections.add(geometry_node.id)
-        geometry_node.connections.add(class_node.id)
+        editor.edges.add_edge(class_node.id, geometry_node.id, f"{geometry_node.min_count}..1")
 
 @app.route('/api/import/csv', methods=['POST'])
 def import_csv():
@@ -6140,15 +5661,19 @@ def import_csv():
         lang = request.form.get('lang', 'de')
         encoding = request.form.get('encoding', 'auto')
         
-        print(f"Importing CSV file: {file.filename}, Dataset name: {dataset_name}, Language: {lang}, Encoding: {encoding}")
+        app.logger.debug("Importing CSV file: %s, Dataset name: %s, Language: %s, Encoding: %s",
+                         file.filename, dataset_name, lang, encoding)
+        
+        if not _looks_like_csv(_peek_upload(file)):
+            return jsonify({"error": "File is empty or not a text CSV file"}), 400
         
         # Read CSV data with proper encoding detection/handling
         file_content = file.read()
         try:
             csv_data, actual_encoding = detect_and_decode_csv(file_content, encoding)
-            print(f"CSV decoded successfully with encoding: {actual_encoding}")
+            app.logger.debug("CSV decoded successfully with encoding: %s", actual_encoding)
         except UnicodeDecodeError as e:
-            print(f"Encoding error: {str(e)}")
+            app.logger.warning("Encoding error: %s", e)
             return jsonify({"error": f"Failed to decode CSV file. The file may not be in {encoding} encoding. Please try a different encoding."}), 400
         
         # Convert to TTL
@@ -6157,7 +5682,7 @@ def import_csv():
         if not ttl:
             return jsonify({"error": "Failed to convert CSV to TTL"}), 500
             
-        print(f"Successfully converted CSV to TTL. Size: {len(ttl)} bytes")
+        app.logger.debug("Successfully converted CSV to TTL. Size: %s bytes", len(ttl))
         
         # Process the TTL to extract data structure
         try:
@@ -6295,11 +5820,7 @@ def convert_to_dataset(node_id):
         return jsonify({"error": "Only class nodes can be converted to dataset"}), 400
     
     # Check if there's already a dataset node
-    existing_dataset = None
-    for n in user_editor.nodes.values():
-        if n.type == 'dataset' and n.id != node_id:
-            existing_dataset = n
-            break
+    existing_dataset = user_editor.get_dataset_node()
     
     if existing_dataset:
         return jsonify({
@@ -6308,21 +5829,13 @@ def convert_to_dataset(node_id):
         }), 400
     
     # Convert the class to a dataset
-    node.type = 'dataset'
-    
-    # Remove any connections where this node is the target
-    # (datasets can't be targets of connections)
-    edges_to_remove = []
-    for edge_id, edge in user_editor.edges.items():
-        if edge['to'] == node_id:
-            edges_to_remove.append(edge_id)
-            # Also remove the connection in the nodes
-            if edge['from'] in user_editor.nodes:
-                user_editor.nodes[edge['from']].connections.discard(node_id)
-            node.connections.discard(edge['from'])
+    user_editor.nodes.retype(node_id, 'dataset')
     
+    # Remove any edges where this node is the target (datasets can't be
+    # targets of connections); the edge store keeps the node connections in sync
+    edges_to_remove = [edge_id for edge_id, edge in user_editor.edges.items() if edge.get('to') == node_id]
     for edge_id in edges_to_remove:
-        user_editor.edges.pop(edge_id)
+        del user_editor.edges[edge_id]
     
     return jsonify({"success": True, "node": node.to_dict()})
 
@@ -5,12 +5,16 @@ Based on https://github.com/I14Y-ch/shacl_importer_scripts/blob/main/csv_importe
 
 import csv
 import io
+import logging
 import re
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from rdflib import Graph, Literal, Namespace, URIRef
 from rdflib.namespace import RDF, XSD, SH, OWL, RDFS
 
+logger = logging.getLogger(__name__)
+
+
 class CSVToSHACL:
     """Enhanced CSV to SHACL transformer with better year detection and numeric constraints."""
     
@@ -298,7 +302,7 @@ class CSVToSHACL:
             rows = list(reader)
             
             if not rows:
-                print("CSV data is empty")
+                logger.warning("CSV data is empty")
                 return False
             
             # Use provided shape name, or extract from filename, or use default
@@ -330,7 +334,7 @@ class CSVToSHACL:
             return True
         
         except Exception as e:
-            print(f"Error processing CSV: {e}")
+            logger.exception("Error processing CSV: %s", e)
             return False
     
     def get_ttl(self) -> str:
@@ -3,14 +3,20 @@ TTL Export functionality for SHACL Creator
 Handles generation and export of Turtle RDF files from SHACL graph structures
 """
 
+import functools
+import logging
 import re
 import unicodedata
 from typing import Dict, Optional, Tuple
 from rdflib import Graph, Literal, Namespace, URIRef, BNode
+from rdflib.collection import Collection
 from rdflib.namespace import RDF, XSD, SH, OWL, RDFS, DCTERMS
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=64)
 def parse_cardinality(cardinality_str: str) -> Tuple[Optional[int], Optional[int]]:
     """Parse cardinality string like '1..1', '0..n', '1..n', etc.
     
@@ -50,7 +56,10 @@ def parse_cardinality(cardinality_str: str) -> Tuple[Optional[int], Optional[int
 
 
 def get_unique_lang_values(multilang_dict, sanitize_literal_func):
-    """Only keep one language per unique content value to avoid SHACL violations"""
+    """Only keep one language per unique content value to avoid SHACL violations
+    
+    Returned values are already passed through sanitize_literal_func.
+    """
     seen_values = {}
     unique_values = {}
     for lang, value in multilang_dict.items():
@@ -58,7 +67,7 @@ def get_unique_lang_values(multilang_dict, sanitize_literal_func):
             cleaned_value = sanitize_literal_func(value)
             if cleaned_value not in seen_values:
                 seen_values[cleaned_value] = lang
-                unique_values[lang] = value
+                unique_values[lang] = cleaned_value
             # If content is identical, prefer 'de', then 'en', then others
             elif seen_values[cleaned_value] not in ['de'] and lang in ['de']:
                 # Replace with German if we had a non-German version
@@ -66,10 +75,32 @@ def get_unique_lang_values(multilang_dict, sanitize_literal_func):
                 if old_lang in unique_values:
                     del unique_values[old_lang]
                 seen_values[cleaned_value] = lang
-                unique_values[lang] = value
+                unique_values[lang] = cleaned_value
     return unique_values
 
 
+_SLUG_SPACES = re.compile(r"\s+")
+_SLUG_INVALID = re.compile(r"[^A-Za-z0-9_-]")
+_SLUG_UNDERSCORES = re.compile(r"_+")
+_SLUG_HYPHENS = re.compile(r"-+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _ascii_slug(value: str) -> str:
+    """ASCII-only identifier segment for a label, preserving casing ('' if nothing is left)"""
+    raw = (value or "").strip()
+    if not raw:
+        return ""
+
+    normalized = unicodedata.normalize("NFKD", raw)
+    ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
+    slug = _SLUG_SPACES.sub("_", ascii_text)
+    slug = _SLUG_INVALID.sub("", slug)
+    slug = _SLUG_UNDERSCORES.sub("_", slug)
+    slug = _SLUG_HYPHENS.sub("-", slug)
+    return slug.strip("_-")
+
+
 def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
     """Generate full TTL using the RDF-based approach directly
     
@@ -109,33 +140,11 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
     
     def slug_id(value: str, fallback: str = "property") -> str:
         """Build a lowercase ASCII-safe identifier for use in the dataset namespace prefix."""
-        raw = (value or "").strip()
-        if not raw:
-            return fallback
-
-        normalized = unicodedata.normalize("NFKD", raw)
-        ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-        slug = re.sub(r"\s+", "_", ascii_text)
-        slug = re.sub(r"[^A-Za-z0-9_-]", "", slug)
-        slug = re.sub(r"_+", "_", slug)
-        slug = re.sub(r"-+", "-", slug)
-        slug = slug.strip("_-")
-        return slug.lower() or fallback
+        return _ascii_slug(value).lower() or fallback
 
     def preserve_id(value: str, fallback: str = "property") -> str:
         """ASCII-safe identifier preserving original casing, used for class/property IRI segments."""
-        raw = (value or "").strip()
-        if not raw:
-            return fallback
-
-        normalized = unicodedata.normalize("NFKD", raw)
-        ascii_text = normalized.encode("ascii", "ignore").decode("ascii")
-        slug = re.sub(r"\s+", "_", ascii_text)
-        slug = re.sub(r"[^A-Za-z0-9_-]", "", slug)
-        slug = re.sub(r"_+", "_", slug)
-        slug = re.sub(r"-+", "-", slug)
-        slug = slug.strip("_-")
-        return slug or fallback
+        return _ascii_slug(value) or fallback
 
     # Generate a normalized ASCII dataset ID from title
     dataset_title_str = get_text_value(dataset_node.title, 'de')
@@ -172,9 +181,9 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
             # Check if content is the same - if different, log a warning
             existing_content = uri_lang_tracker[key]
             if existing_content != sanitized_content:
-                print(f"WARNING: Different content for same URI+property+lang: {key}")
-                print(f"  Existing: {existing_content}")
-                print(f"  Attempted: {sanitized_content}")
+                logger.warning("Different content for same URI+property+lang: %s", key)
+                logger.debug("  Existing: %s", existing_content)
+                logger.debug("  Attempted: %s", sanitized_content)
             return False
         
         # Add to graph and track
@@ -265,13 +274,11 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
     unique_dataset_titles = get_unique_lang_values(dataset_titles, sanitize_literal)
     unique_dataset_descriptions = get_unique_lang_values(dataset_descriptions, sanitize_literal)
 
-    for lang, title in unique_dataset_titles.items():
-        sanitized_title = sanitize_literal(title)
+    for lang, sanitized_title in unique_dataset_titles.items():
         safe_add_multilingual_property(dataset_shape, DCTERMS.title, sanitized_title, lang)
         safe_add_multilingual_property(dataset_shape, RDFS.label, sanitized_title, lang)
 
-    for lang, desc in unique_dataset_descriptions.items():
-        sanitized_desc = sanitize_literal(desc)
+    for lang, sanitized_desc in unique_dataset_descriptions.items():
         safe_add_multilingual_property(dataset_shape, DCTERMS.description, sanitized_desc, lang)
         safe_add_multilingual_property(dataset_shape, RDFS.comment, sanitized_desc, lang)
 
@@ -305,7 +312,6 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
 
     # First, create all class NodeShapes and collect their properties
     class_properties = {}  # Maps class_id to list of concept property URIs
-    rdf_list_counter = 0  # For generating unique RDF list IDs
 
     for class_node in connected_classes:
         class_id = node_export_id(class_node)
@@ -325,12 +331,10 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
         unique_class_titles = get_unique_lang_values(class_titles, sanitize_literal)
         unique_class_descriptions = get_unique_lang_values(class_descriptions, sanitize_literal)
 
-        for lang, title in unique_class_titles.items():
-            sanitized_title = sanitize_literal(title)
+        for lang, sanitized_title in unique_class_titles.items():
             safe_add_multilingual_property(class_uri, SH.name, sanitized_title, lang)
 
-        for lang, desc in unique_class_descriptions.items():
-            sanitized_desc = sanitize_literal(desc)
+        for lang, sanitized_desc in unique_class_descriptions.items():
             safe_add_multilingual_property(class_uri, DCTERMS.description, sanitized_desc, lang)
             safe_add_multilingual_property(class_uri, RDFS.comment, sanitized_desc, lang)
 
@@ -388,25 +392,10 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
                 # Add QB:CodedProperty for enumerated values
                 g.add((property_uri, RDF.type, QB.CodedProperty))
                 
-                # Create RDF list for enumeration values using proper blank node references
-                list_items = []
-                for i, value in enumerate(concept.in_values):
-                    blank_node = BNode(f"autos{rdf_list_counter}")
-                    list_items.append(blank_node)
-                    rdf_list_counter += 1
-                
-                # Build the list from end to beginning
-                if list_items:
-                    # Set the head for sh:in
-                    g.add((property_uri, SH['in'], list_items[0]))
-                    
-                    # Create the list structure
-                    for i, current in enumerate(list_items):
-                        g.add((current, RDF.first, Literal(concept.in_values[i])))
-                        if i < len(list_items) - 1:
-                            g.add((current, RDF.rest, list_items[i + 1]))
-                        else:
-                            g.add((current, RDF.rest, RDF.nil))
+                # sh:in takes an RDF list of the enumeration values
+                list_head = BNode()
+                g.add((property_uri, SH['in'], list_head))
+                Collection(g, list_head, [Literal(value) for value in concept.in_values])
 
             # Add class reference (sh:node)
             if concept.node_reference:
@@ -419,14 +408,12 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
             unique_titles = get_unique_lang_values(titles, sanitize_literal)
             unique_descriptions = get_unique_lang_values(descriptions, sanitize_literal)
 
-            for lang, title in unique_titles.items():
-                sanitized_title = sanitize_literal(title)
+            for lang, sanitized_title in unique_titles.items():
                 safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
                 safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
                 safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
 
-            for lang, desc in unique_descriptions.items():
-                sanitized_desc = sanitize_literal(desc)
+            for lang, sanitized_desc in unique_descriptions.items():
                 safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
                 safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
                 safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
@@ -503,25 +490,10 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
                 # Add QB:CodedProperty for enumerated values
                 g.add((property_uri, RDF.type, QB.CodedProperty))
                 
-                # Create RDF list for enumeration values using proper blank node references
-                list_items = []
-                for i, value in enumerate(data_element.in_values):
-                    blank_node = BNode(f"autos{rdf_list_counter}")
-                    list_items.append(blank_node)
-                    rdf_list_counter += 1
-                
-                # Build the list from end to beginning
-                if list_items:
-                    # Set the head for sh:in
-                    g.add((property_uri, SH['in'], list_items[0]))
-                    
-                    # Create the list structure
-                    for i, current in enumerate(list_items):
-                        g.add((current, RDF.first, Literal(data_element.in_values[i])))
-                        if i < len(list_items) - 1:
-                            g.add((current, RDF.rest, list_items[i + 1]))
-                        else:
-                            g.add((current, RDF.rest, RDF.nil))
+                # sh:in takes an RDF list of the enumeration values
+                list_head = BNode()
+                g.add((property_uri, SH['in'], list_head))
+                Collection(g, list_head, [Literal(value) for value in data_element.in_values])
 
             # Add class reference (sh:node)
             if data_element.node_reference:
@@ -538,14 +510,12 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
             unique_element_titles = get_unique_lang_values(element_titles, sanitize_literal)
             unique_element_descriptions = get_unique_lang_values(element_descriptions, sanitize_literal)
 
-            for lang, title in unique_element_titles.items():
-                sanitized_title = sanitize_literal(title)
+            for lang, sanitized_title in unique_element_titles.items():
                 safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
                 safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
                 safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
 
-            for lang, desc in unique_element_descriptions.items():
-                sanitized_desc = sanitize_literal(desc)
+            for lang, sanitized_desc in unique_element_descriptions.items():
                 safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
                 safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
                 safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
@@ -601,25 +571,10 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
             # Add QB:CodedProperty for enumerated values
             g.add((property_uri, RDF.type, QB.CodedProperty))
             
-            # Create RDF list for enumeration values using proper blank node references
-            list_items = []
-            for i, value in enumerate(concept.in_values):
-                blank_node = BNode(f"autos{rdf_list_counter}")
-                list_items.append(blank_node)
-                rdf_list_counter += 1
-            
-            # Build the list from end to beginning
-            if list_items:
-                # Set the head for sh:in
-                g.add((property_uri, SH['in'], list_items[0]))
-                
-                # Create the list structure
-                for i, current in enumerate(list_items):
-                    g.add((current, RDF.first, Literal(concept.in_values[i])))
-                    if i < len(list_items) - 1:
-                        g.add((current, RDF.rest, list_items[i + 1]))
-                    else:
-                        g.add((current, RDF.rest, RDF.nil))
+            # sh:in takes an RDF list of the enumeration values
+            list_head = BNode()
+            g.add((property_uri, SH['in'], list_head))
+            Collection(g, list_head, [Literal(value) for value in concept.in_values])
 
         # Add class reference (sh:node)
         if concept.node_reference:
@@ -632,14 +587,12 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
         unique_titles = get_unique_lang_values(titles, sanitize_literal)
         unique_descriptions = get_unique_lang_values(descriptions, sanitize_literal)
 
-        for lang, title in unique_titles.items():
-            sanitized_title = sanitize_literal(title)
+        for lang, sanitized_title in unique_titles.items():
             safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
             safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
             safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
 
-        for lang, desc in unique_descriptions.items():
-            sanitized_desc = sanitize_literal(desc)
+        for lang, sanitized_desc in unique_descriptions.items():
             safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
             safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
             safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
@@ -716,25 +669,10 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
             # Add QB:CodedProperty for enumerated values
             g.add((property_uri, RDF.type, QB.CodedProperty))
             
-            # Create RDF list for enumeration values using proper blank node references
-            list_items = []
-            for i, value in enumerate(data_element.in_values):
-                blank_node = BNode(f"autos{rdf_list_counter}")
-                list_items.append(blank_node)
-                rdf_list_counter += 1
-            
-            # Build the list from end to beginning
-            if list_items:
-                # Set the head for sh:in
-                g.add((property_uri, SH['in'], list_items[0]))
-                
-                # Create the list structure
-                for i, current in enumerate(list_items):
-                    g.add((current, RDF.first, Literal(data_element.in_values[i])))
-                    if i < len(list_items) - 1:
-                        g.add((current, RDF.rest, list_items[i + 1]))
-                    else:
-                        g.add((current, RDF.rest, RDF.nil))
+            # sh:in takes an RDF list of the enumeration values
+            list_head = BNode()
+            g.add((property_uri, SH['in'], list_head))
+            Collection(g, list_head, [Literal(value) for value in data_element.in_values])
 
         # Add class reference (sh:node)
         if data_element.node_reference:
@@ -751,14 +689,12 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
         unique_element_titles = get_unique_lang_values(element_titles, sanitize_literal)
         unique_element_descriptions = get_unique_lang_values(element_descriptions, sanitize_literal)
 
-        for lang, title in unique_element_titles.items():
-            sanitized_title = sanitize_literal(title)
+        for lang, sanitized_title in unique_element_titles.items():
             safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
             safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
             safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
 
-        for lang, desc in unique_element_descriptions.items():
-            sanitized_desc = sanitize_literal(desc)
+        for lang, sanitized_desc in unique_element_descriptions.items():
             safe_add_multilingual_property(property_uri, DCTERMS.description, sanitized_desc, lang)
             safe_add_multilingual_property(property_uri, RDFS.comment, sanitized_desc, lang)
             safe_add_multilingual_property(property_uri, SH.description, sanitized_desc, lang)
@@ -802,8 +738,7 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
             titles = {lang: class_node.title for lang in ['de', 'fr', 'it', 'en']}
         
         unique_titles = get_unique_lang_values(titles, sanitize_literal)
-        for lang, title in unique_titles.items():
-            sanitized_title = sanitize_literal(title)
+        for lang, sanitized_title in unique_titles.items():
             safe_add_multilingual_property(property_uri, DCTERMS.title, sanitized_title, lang)
             safe_add_multilingual_property(property_uri, RDFS.label, sanitized_title, lang)
             safe_add_multilingual_property(property_uri, SH.name, sanitized_title, lang)
@@ -811,40 +746,8 @@ def generate_full_ttl(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
         # Add to dataset properties
         g.add((dataset_shape, SH.property, property_uri))
 
-    # Serialize to TTL format with custom prefixes
-    ttl_content = g.serialize(format='turtle', encoding='utf-8').decode('utf-8')
-
-    # Clean up duplicate prefixes and organize the output
-    lines = ttl_content.split('\n')
-    seen_prefixes = set()
-    cleaned_lines = []
-    data_lines = []
-
-    for line in lines:
-        if line.startswith('@prefix'):
-            prefix_name = line.split(':')[0].replace('@prefix ', '')
-            if prefix_name not in seen_prefixes:
-                seen_prefixes.add(prefix_name)
-                cleaned_lines.append(line)
-        elif line.strip():
-            data_lines.append(line)
-
-    # Add our custom prefixes first
-    custom_prefixes = f"""@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>.
-@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#>.
-@prefix xsd: <http://www.w3.org/2001/XMLSchema#>.
-@prefix xml: <http://www.w3.org/XML/1998/namespace>.
-@prefix QB: <http://purl.org/linked-data/cube#>.
-@prefix dcterms: <http://purl.org/dc/terms/>.
-@prefix i14y: <https://www.i14y.admin.ch/resources/datasets/{dataset_id}/structure/>.
-@prefix owl: <http://www.w3.org/2002/07/owl#>.
-@prefix pav: <http://purl.org/pav/>.
-@prefix schema: <https://schema.org/>.
-@prefix sh: <http://www.w3.org/ns/shacl#>.
-
-"""
-
-    return custom_prefixes + '\n'.join(data_lines) + '\n'
+    # All prefixes are bound on the graph above, so rdflib writes the single prefix block itself
+    return g.serialize(format='turtle')
 
 
 def export_ttl_content(nodes: Dict, base_uri: str, edges: Dict = None) -> str:
@@ -3,7 +3,7 @@ Imports package for SHACL Creator
 Provides functionality to import data structures from various formats (TTL, CSV, XSD, Excel, GeoJSON)
 """
 
-from .ttl_importer import import_ttl_file, parse_ttl_to_nodes, process_csv_ttl_import
+from .ttl_importer import import_ttl_file, load_turtle_graph, parse_ttl_to_nodes, process_csv_ttl_import
 from .csv_importer import csv_to_ttl
 from .excel_importer import import_excel_file, get_excel_sheet_names
 from .geojson_importer import import_geojson_file, import_geojson_structure, infer_geojson_datatype
@@ -11,6 +11,7 @@ from .xsd_importer import import_xsd_file
 
 __all__ = [
     'import_ttl_file',
+    'load_turtle_graph',
     'parse_ttl_to_nodes', 
     'process_csv_ttl_import',
     'csv_to_ttl',
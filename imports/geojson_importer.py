@@ -89,11 +89,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
     editor.reset_structure()
 
     # Get or create dataset node
-    dataset_node = None
-    for node in editor.nodes.values():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    dataset_node = editor.get_dataset_node()
 
     if not dataset_node:
         dataset_node = SHACLNode('dataset', title=dataset_name, description=f"Dataset imported from {source_filename}")
@@ -127,15 +123,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
         editor.nodes[de_node.id] = de_node
 
         # Connect properties directly to dataset (no intermediate FeatureCollection class)
-        edge_id = f"{dataset_node.id}-{de_node.id}"
-        editor.edges[edge_id] = {
-            'id': edge_id,
-            'from': dataset_node.id,
-            'to': de_node.id,
-            'cardinality': f"{de_node.min_count}..1"
-        }
-        dataset_node.connections.add(de_node.id)
-        de_node.connections.add(dataset_node.id)
+        editor.edges.add_edge(dataset_node.id, de_node.id, f"{de_node.min_count}..1")
 
     # Add geometry if present
     if features and 'geometry' in features[0]:
@@ -148,15 +136,7 @@ def import_geojson_structure(editor, geojson_payload: Dict[str, Any], dataset_na
             geom_node.local_name = 'geometry'
             editor.nodes[geom_node.id] = geom_node
 
-            edge_id = f"{dataset_node.id}-{geom_node.id}"
-            editor.edges[edge_id] = {
-                'id': edge_id,
-                'from': dataset_node.id,
-                'to': geom_node.id,
-                'cardinality': '1..1'
-            }
-            dataset_node.connections.add(geom_node.id)
-            geom_node.connections.add(dataset_node.id)
+            editor.edges.add_edge(dataset_node.id, geom_node.id)
 
     return True, f"Imported {feature_count} GeoJSON features successfully"
 
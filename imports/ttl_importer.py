@@ -3,12 +3,158 @@ TTL Import functionality for SHACL Creator
 Handles parsing of Turtle RDF files and conversion to SHACL graph structures
 """
 
-import uuid
+import logging
+from collections import defaultdict
+from pathlib import Path
 from typing import Optional
-from rdflib import Graph, Namespace, URIRef
-from rdflib.namespace import RDF, RDFS, DCTERMS, DCAT
+from rdflib import Graph, Namespace, URIRef, BNode, Literal
+from rdflib.namespace import RDF, RDFS, DCTERMS, DCAT, OWL, QB, SH
 from rdflib.namespace import RDF as RDF_NS
 
+try:
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
+
+logger = logging.getLogger(__name__)
+
+_XSD_STRING = 'http://www.w3.org/2001/XMLSchema#string'
+
+# Predicates that typically only occur on the dataset NodeShape
+_PAV_VERSION = URIRef("http://purl.org/pav/version")
+_SCHEMA_VALID_FROM = URIRef("https://schema.org/validFrom")
+
+
+def _oxigraph_term(term):
+    """Convert a pyoxigraph term to the equivalent rdflib term"""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.BlankNode):
+        return BNode(term.value)
+    if term.language:
+        return Literal(term.value, lang=term.language)
+    # rdflib keeps plain Turtle strings untyped; match that so lookups behave the same
+    if term.datatype.value == _XSD_STRING:
+        return Literal(term.value)
+    return Literal(term.value, datatype=URIRef(term.datatype.value))
+
+
+def _rdflib_parse(g: Graph, data=None, path: Optional[str] = None) -> Graph:
+    """Parse Turtle content into g with RDFLib's own parser"""
+    if path is not None:
+        g.parse(path, format='turtle')
+    elif hasattr(data, 'read'):
+        g.parse(source=data, format='turtle')
+    else:
+        g.parse(data=data, format='turtle')
+    return g
+
+
+def load_turtle_graph(data=None, path: Optional[str] = None) -> Graph:
+    """Parse Turtle content into an RDFLib Graph
+    
+    When pyoxigraph is installed its streaming parser is used and triples are
+    added to the graph as they are read; otherwise RDFLib's own parser is used.
+    Binary file objects (e.g. an upload stream) are read incrementally by both.
+    
+    Relative IRIs are resolved against the same base RDFLib would use (the file
+    URI, or the working directory for in-memory content). Input that pyoxigraph
+    rejects but RDFLib accepts (e.g. IRIs containing spaces) is re-parsed with
+    RDFLib.
+    
+    Args:
+        data: Turtle content as str, bytes or a binary file object
+        path: Path of a Turtle file (used instead of data)
+        
+    Returns:
+        RDFLib Graph containing the parsed triples
+    """
+    if pyoxigraph is None:
+        return _rdflib_parse(Graph(), data, path)
+    
+    if hasattr(data, 'read') and not (hasattr(data, 'seekable') and data.seekable()):
+        # The fallback needs to read the stream a second time
+        data = data.read()
+    start = data.tell() if hasattr(data, 'read') else None
+    
+    if path is not None:
+        base_iri = Path(path).absolute().as_uri()
+    else:
+        base_iri = Path.cwd().as_uri() + '/'
+    
+    g = Graph()
+    try:
+        triples = pyoxigraph.parse(input=data, format=pyoxigraph.RdfFormat.TURTLE, path=path, base_iri=base_iri)
+        g.addN(
+            (_oxigraph_term(t.subject), _oxigraph_term(t.predicate), _oxigraph_term(t.object), g)
+            for t in triples
+        )
+    except SyntaxError as e:
+        logger.info("pyoxigraph could not parse the Turtle input, retrying with RDFLib: %s", e)
+        if start is not None:
+            data.seek(start)
+        return _rdflib_parse(Graph(), data, path)
+    return g
+
+
+def _index_shapes(g: Graph, shapes) -> dict:
+    """Collect the objects of each shape grouped by predicate
+    
+    Each shape is read with a single predicate_objects() sweep, so the parsers
+    can look up any number of predicates without further store queries.
+    
+    Args:
+        g: RDFLib Graph to read from
+        shapes: Subjects to index
+        
+    Returns:
+        Dict mapping each shape to a dict of predicate -> list of objects
+    """
+    index = {}
+    for shape in shapes:
+        objects_by_predicate = defaultdict(list)
+        for predicate, obj in g.predicate_objects(shape):
+            objects_by_predicate[predicate].append(obj)
+        index[shape] = objects_by_predicate
+    return index
+
+
+def _first(props: dict, predicate):
+    """Return the first object of a predicate from a shape index entry, like Graph.value()"""
+    values = props.get(predicate)
+    return values[0] if values else None
+
+
+def _collect_multilingual(literals, fallback_literals=None) -> dict:
+    """Collect all language-tagged literals into a dict; fall back to untagged as 'de'"""
+    source = literals or fallback_literals or ()
+    result = {lit.language: str(lit) for lit in source if getattr(lit, 'language', None)}
+    if not result and source:
+        # No language tags - use first available as 'de' fallback
+        result['de'] = str(source[0])
+    return result
+
+
+def _uri_local_name(uri) -> str:
+    """Last path segment of a URI with any '#' removed"""
+    return str(uri).rpartition('/')[2].replace('#', '')
+
+
+def _cardinality(min_count, max_count):
+    """Edge cardinality for a property shape's sh:minCount/sh:maxCount"""
+    if min_count is None and max_count is None:
+        return "1..1"
+    if max_count is None:
+        return f"{min_count or 0}..n"
+    return f"{min_count or 0}..{max_count}"
+
+
+def _display_title(title) -> str:
+    """Pick the German text of a multilingual title, else the first available one"""
+    if isinstance(title, dict):
+        return title.get('de') or next(iter(title.values()), '')
+    return title
+
 
 def parse_ttl_to_nodes(g: Graph, editor) -> bool:
     """Parse RDF graph back to SHACLNode objects
@@ -21,298 +167,251 @@ def parse_ttl_to_nodes(g: Graph, editor) -> bool:
         True if parsing was successful, False otherwise
     """
     try:
-        from rdflib.namespace import QB
-        
-        # Define namespaces
-        SH = Namespace("http://www.w3.org/ns/shacl#")
-        OWL = Namespace("http://www.w3.org/2002/07/owl#")
+        from app import SHACLNode, fast_uuid
         
         # Find NodeShapes (classes and dataset)
         node_shapes = list(g.subjects(RDF_NS.type, SH.NodeShape))
+        node_shape_props = _index_shapes(g, node_shapes)
         dataset_node = None
+        # Shape term -> node ID; rdflib terms reuse the cached str hash, so
+        # keying by the term avoids copying each URI with str() per lookup
         created_nodes = {}
+        debug = logger.isEnabledFor(logging.DEBUG)
         
-        print(f"Found {len(node_shapes)} NodeShapes")
+        logger.debug("Found %s NodeShapes", len(node_shapes))
         
         # First identify which NodeShape is the dataset
         dataset_shape = None
         for shape in node_shapes:
+            props = node_shape_props[shape]
+            types = props.get(RDF_NS.type, ())
+            
             # Check for dataset-specific indicators
             is_dataset = False
             
             # Check for data structure definition
-            if (shape, RDF_NS.type, QB.DataStructureDefinition) in g:
+            if QB.DataStructureDefinition in types:
                 is_dataset = True
             
             # Check for DCAT dataset type
-            if (shape, RDF_NS.type, DCAT.Dataset) in g:
+            if DCAT.Dataset in types:
                 is_dataset = True
                 
             # Check for version information (typically only on datasets)
-            if list(g.objects(shape, Namespace("http://purl.org/pav/").version)):
+            if props.get(_PAV_VERSION):
                 is_dataset = True
                 
             # Check if it has validFrom (typically only on datasets)
-            if list(g.objects(shape, Namespace("https://schema.org/").validFrom)):
+            if props.get(_SCHEMA_VALID_FROM):
                 is_dataset = True
                 
             if is_dataset:
                 dataset_shape = shape
                 break
         
-        def _collect_multilingual(literals, fallback_literals=None):
-            """Collect all language-tagged literals into a dict; fall back to untagged as 'de'."""
-            result = {}
-            source = literals if literals else (fallback_literals or [])
-            for lit in source:
-                lang = getattr(lit, 'language', None)
-                if lang:
-                    result[lang] = str(lit)
-            if not result:
-                # No language tags — use first available as 'de' fallback
-                if source:
-                    result['de'] = str(source[0])
-            return result
-
         # First pass: Create dataset and class nodes
         for shape in node_shapes:
+            props = node_shape_props[shape]
+            
             # Get basic properties
-            titles = list(g.objects(shape, DCTERMS.title))
-            labels = list(g.objects(shape, SH.name)) or list(g.objects(shape, RDFS.label))
-            descriptions = list(g.objects(shape, DCTERMS.description)) or list(g.objects(shape, SH.description))
+            titles = props.get(DCTERMS.title, [])
+            labels = props.get(SH.name) or props.get(RDFS.label, [])
+            descriptions = props.get(DCTERMS.description) or props.get(SH.description, [])
 
             # Collect all available language variants
             title = _collect_multilingual(titles, labels)
             description = _collect_multilingual(descriptions)
             
             # Determine if this is a dataset or class
-            node_id = str(uuid.uuid4())
+            node_id = fast_uuid()
             node_type = 'dataset' if shape == dataset_shape else 'class'
             
             if not dataset_node and node_type == 'dataset':
                 dataset_node = node_id
             
             # Create SHACLNode
-            node_data = {
-                'id': node_id,
-                'type': node_type,
-                'title': title,
-                'description': description
-            }
-            
-            from app import SHACLNode
-            node = SHACLNode.from_dict(node_data)
+            node = SHACLNode.new(node_type, node_id, title, description)
             editor.nodes[node_id] = node
-            created_nodes[str(shape)] = node_id
+            created_nodes[shape] = node_id
             
-            display_title = title.get('de') or next(iter(title.values()), '') if isinstance(title, dict) else title
-            print(f"Created {node_type}: {display_title}")
+            if debug:
+                logger.debug("Created %s: %s", node_type, _display_title(title))
         
         # Second pass: Create data element nodes from PropertyShapes
         property_shapes = list(g.subjects(RDF_NS.type, SH.PropertyShape))
+        property_shape_props = _index_shapes(g, property_shapes)
+        cardinalities = {}  # property shape -> edge cardinality, used in the third pass
         
         for prop_shape in property_shapes:
+            props = property_shape_props[prop_shape]
+            
             # Handle object properties (class-to-class relationship) separately
-            is_object_property = (prop_shape, RDF_NS.type, OWL.ObjectProperty) in g
+            is_object_property = OWL.ObjectProperty in props.get(RDF_NS.type, ())
             
             # Get property details
-            titles = list(g.objects(prop_shape, DCTERMS.title))
-            labels = list(g.objects(prop_shape, SH.name)) or list(g.objects(prop_shape, RDFS.label))
-            descriptions = list(g.objects(prop_shape, DCTERMS.description)) or list(g.objects(prop_shape, SH.description))
+            titles = props.get(DCTERMS.title, [])
+            labels = props.get(SH.name) or props.get(RDFS.label, [])
+            descriptions = props.get(DCTERMS.description) or props.get(SH.description, [])
 
             # Collect all available language variants
             title = _collect_multilingual(titles, labels)
             description = _collect_multilingual(descriptions)
             
-            # Extract constraints
-            min_count = None
-            max_count = None
-            min_length = None
-            max_length = None
-            pattern = None
-            datatype = None
-            
             # Get cardinality constraints
-            min_counts = list(g.objects(prop_shape, SH.minCount))
-            if min_counts:
-                min_count = int(min_counts[0])
-                
-            max_counts = list(g.objects(prop_shape, SH.maxCount))
-            if max_counts:
-                max_count = int(max_counts[0])
+            value = _first(props, SH.minCount)
+            min_count = int(value) if value is not None else None
+            value = _first(props, SH.maxCount)
+            max_count = int(value) if value is not None else None
+            cardinalities[prop_shape] = _cardinality(min_count, max_count)
             
             # Get length constraints
-            min_lengths = list(g.objects(prop_shape, SH.minLength))
-            if min_lengths:
-                min_length = int(min_lengths[0])
-                
-            max_lengths = list(g.objects(prop_shape, SH.maxLength))
-            if max_lengths:
-                max_length = int(max_lengths[0])
-            
-            # Get pattern
-            patterns = list(g.objects(prop_shape, SH.pattern))
-            if patterns:
-                pattern = str(patterns[0])
+            value = _first(props, SH.minLength)
+            min_length = int(value) if value is not None else None
+            value = _first(props, SH.maxLength)
+            max_length = int(value) if value is not None else None
             
-            # Get datatype
-            datatypes = list(g.objects(prop_shape, SH.datatype))
-            if datatypes:
-                datatype = str(datatypes[0])
+            # Get pattern and datatype
+            value = _first(props, SH.pattern)
+            pattern = str(value) if value is not None else None
+            value = _first(props, SH.datatype)
+            datatype = str(value) if value is not None else None
                 
             # Extract enumeration values (sh:in)
             in_values = []
-            in_lists = list(g.objects(prop_shape, SH['in']))
-            if in_lists:
+            in_list = _first(props, SH['in'])
+            if in_list is not None:
                 # Follow the RDF list structure
-                current = in_lists[0]
+                current = in_list
                 while current and current != RDF_NS.nil:
-                    value_literals = list(g.objects(current, RDF_NS.first))
-                    if value_literals:
-                        in_values.append(str(value_literals[0]))
-                    next_nodes = list(g.objects(current, RDF_NS.rest))
-                    if next_nodes:
-                        current = next_nodes[0]
-                    else:
-                        break
+                    value = g.value(current, RDF_NS.first)
+                    if value is not None:
+                        in_values.append(str(value))
+                    current = g.value(current, RDF_NS.rest)
             
             # Read sh:order
             order = None
-            order_vals = list(g.objects(prop_shape, SH.order))
-            if order_vals:
+            value = _first(props, SH.order)
+            if value is not None:
                 try:
-                    order = int(order_vals[0])
+                    order = int(value)
                 except (ValueError, TypeError):
                     pass
 
             # Check for conformsTo to identify data elements with concept links
-            conforms_to_uris = list(g.objects(prop_shape, DCTERMS.conformsTo))
-            conforms_to_uri = conforms_to_uris[0] if conforms_to_uris else None
+            conforms_to_uri = _first(props, DCTERMS.conformsTo)
                 
-            # Create data element node (not concept)
-            node_id = str(uuid.uuid4())
-            node_data = {
-                'id': node_id,
-                'type': 'data_element',  # Always create as data_element instead of concept
-                'title': title,
-                'description': description,
-                'min_count': min_count,
-                'max_count': max_count,
-                'min_length': min_length,
-                'max_length': max_length,
-                'pattern': pattern,
-                'datatype': datatype or 'xsd:string',
-                'in_values': in_values,
-                'order': order
-            }
-            
             # If this is an object property pointing to a class, handle it differently
             if is_object_property:
                 # Extract the target class that this object property points to
-                node_refs = list(g.objects(prop_shape, SH.node))
-                if node_refs:
-                    target_class_uri = str(node_refs[0])
-                    if target_class_uri in created_nodes:
+                node_ref = _first(props, SH.node)
+                if node_ref is not None:
+                    if node_ref in created_nodes:
                         # The class has already been created, so just store the reference
                         # We'll create connections in the next pass
-                        created_nodes[str(prop_shape)] = created_nodes[target_class_uri]
-                        _dt = title.get('de') or next(iter(title.values()), '') if isinstance(title, dict) else title
-                        print(f"Mapped object property {_dt} to class reference")
+                        created_nodes[prop_shape] = created_nodes[node_ref]
+                        if debug:
+                            logger.debug("Mapped object property %s to class reference", _display_title(title))
                         continue
             
             # Add the local_name for the data element (from path or extracted from shape URI)
             local_name = None
-            paths = list(g.objects(prop_shape, SH.path))
-            if paths:
-                path_str = str(paths[0])
-                local_name = path_str.split('/')[-1].replace('#', '')
+            path = _first(props, SH.path)
+            if path is not None:
+                local_name = _uri_local_name(path)
                 
             if not local_name:
-                local_name = str(prop_shape).split('/')[-1].replace('#', '')
+                local_name = _uri_local_name(prop_shape)
                 
-            node_data['local_name'] = local_name
+            # Create data element node (always a data_element, not a concept)
+            node_id = fast_uuid()
+            node = SHACLNode.new(
+                'data_element', node_id, title, description,
+                min_count=min_count,
+                max_count=max_count,
+                min_length=min_length,
+                max_length=max_length,
+                pattern=pattern,
+                datatype=datatype or 'xsd:string',
+                in_values=in_values,
+                order=order,
+                local_name=local_name
+            )
                 
             # If this data element has a conformsTo link, set it
             if conforms_to_uri:
-                node_data['conforms_to_concept_uri'] = str(conforms_to_uri)
-                node_data['is_linked_to_concept'] = True
+                node.conforms_to_concept_uri = str(conforms_to_uri)
+                node.is_linked_to_concept = True
             
-            from app import SHACLNode
-            node = SHACLNode.from_dict(node_data)
             editor.nodes[node_id] = node
-            created_nodes[str(prop_shape)] = node_id
+            created_nodes[prop_shape] = node_id
             
             # Log message based on whether it has a concept link
-            _dt = title.get('de') or next(iter(title.values()), '') if isinstance(title, dict) else title
-            if conforms_to_uri:
-                print(f"Created data element with concept link: {_dt}")
-            else:
-                print(f"Created data element: {_dt}")
+            if debug:
+                if conforms_to_uri:
+                    logger.debug("Created data element with concept link: %s", _display_title(title))
+                else:
+                    logger.debug("Created data element: %s", _display_title(title))
         
         # Third pass: Create connections based on sh:property relationships
+        # (the edge store keeps node connections in sync with the edges)
+        nodes = editor.nodes
+        create_edge = editor.create_edge
+        # Classes/concepts not connected by this pass get attached to the dataset
+        # afterwards (a dict keeps them in creation order)
+        unattached = dict.fromkeys(
+            node_id for node_id in created_nodes.values() if nodes[node_id].type in ('class', 'concept')
+        )
         for shape in node_shapes:
-            shape_node_id = created_nodes.get(str(shape))
+            shape_node_id = created_nodes.get(shape)
             if not shape_node_id:
                 continue
+            shape_node = nodes[shape_node_id]
                 
             # Find properties of this shape
-            properties = list(g.objects(shape, SH.property))
+            properties = node_shape_props[shape].get(SH.property, [])
             for prop in properties:
-                prop_node_id = created_nodes.get(str(prop))
+                prop_node_id = created_nodes.get(prop)
                 if prop_node_id:
-                    # Connect shape to property
-                    editor.nodes[shape_node_id].connections.add(prop_node_id)
-                    editor.nodes[prop_node_id].connections.add(shape_node_id)
-                    
-                    # Create edge with cardinality
-                    cardinality = "1..1"  # Default
-                    min_counts = list(g.objects(prop, SH.minCount))
-                    max_counts = list(g.objects(prop, SH.maxCount))
-                    
-                    if min_counts or max_counts:
-                        min_c = int(min_counts[0]) if min_counts else 0
-                        max_c = int(max_counts[0]) if max_counts else None
-                        
-                        if max_c is None:
-                            cardinality = f"{min_c}..n"
-                        else:
-                            cardinality = f"{min_c}..{max_c}"
+                    # Connect shape to property with the cardinality read in the second pass
+                    cardinality = cardinalities.get(prop)
+                    if cardinality is None:
+                        value = g.value(prop, SH.minCount)
+                        min_c = int(value) if value is not None else None
+                        value = g.value(prop, SH.maxCount)
+                        cardinality = _cardinality(min_c, int(value) if value is not None else None)
                     
-                    editor.create_edge(shape_node_id, prop_node_id, cardinality)
-                    def _dt(t): return t.get('de') or next(iter(t.values()), '') if isinstance(t, dict) else t
-                    print(f"Connected {_dt(editor.nodes[shape_node_id].title)} -> {_dt(editor.nodes[prop_node_id].title)} ({cardinality})")
+                    create_edge(shape_node_id, prop_node_id, cardinality)
+                    unattached.pop(shape_node_id, None)
+                    unattached.pop(prop_node_id, None)
+                    if debug:
+                        logger.debug("Connected %s -> %s (%s)", _display_title(shape_node.title),
+                                     _display_title(nodes[prop_node_id].title), cardinality)
         
         # Connect everything to dataset if we have one
         if dataset_node:
-            for node_id, node in editor.nodes.items():
-                if node_id != dataset_node and node.type in ['class', 'concept']:
-                    # Only connect if not already connected to something else
-                    if not node.connections:
-                        editor.nodes[dataset_node].connections.add(node_id)
-                        editor.nodes[node_id].connections.add(dataset_node)
-                        editor.create_edge(dataset_node, node_id, "1..1")
+            for node_id in unattached:
+                create_edge(dataset_node, node_id, "1..1")
         
         return True
         
     except Exception as e:
-        print(f"Error in parse_ttl_to_nodes: {e}")
+        logger.exception("Error in parse_ttl_to_nodes: %s", e)
         return False
 
 
-def import_ttl_file(file_content: str, editor) -> bool:
+def import_ttl_file(file_content, editor) -> bool:
     """Import a TTL file and populate the editor
     
     Args:
-        file_content: String content of TTL file
+        file_content: TTL content as str, bytes or a binary file object
         editor: FlaskSHACLGraphEditor instance to populate
         
     Returns:
         True if import was successful, False otherwise
     """
     try:
-        # Parse TTL file using RDFLib
-        g = Graph()
-        g.parse(data=file_content, format='turtle')
+        # Parse TTL file into an RDFLib graph
+        g = load_turtle_graph(data=file_content)
         
         # Clear existing data
         editor.nodes.clear()
@@ -324,7 +423,7 @@ def import_ttl_file(file_content: str, editor) -> bool:
         return success
             
     except Exception as e:
-        print(f"Failed to import TTL: {e}")
+        logger.exception("Failed to import TTL: %s", e)
         return False
 
 
@@ -337,8 +436,6 @@ def process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name:
         source_filename: Name of the source CSV file
         dataset_name: Name to assign to the dataset
     """
-    from rdflib import Graph, Namespace, Literal
-    from rdflib.namespace import RDF, SH, RDFS, DCTERMS
     from app import SHACLNode
     
     g = Graph()
@@ -347,11 +444,7 @@ def process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name:
 
     editor.reset_structure()
 
-    dataset_node = None
-    for node in editor.nodes.values():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    dataset_node = editor.get_dataset_node()
 
     if not dataset_node:
         dataset_node = SHACLNode('dataset', title=dataset_name)
@@ -361,19 +454,16 @@ def process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name:
     dataset_node.description = f"Dataset imported from {source_filename}"
 
     property_shapes = [s for s, _, _ in g.triples((None, RDF.type, SH.PropertyShape))]
+    property_shape_props = _index_shapes(g, property_shapes)
 
     for shape in property_shapes:
-        prop_name = None
-        for _, _, name in g.triples((shape, SH.name, None)):
-            prop_name = str(name)
-            break
-        if not prop_name:
-            prop_name = ""
-
-        datatype = None
-        for _, _, dt in g.triples((shape, SH.datatype, None)):
-            datatype = str(dt)
-            break
+        props = property_shape_props[shape]
+        
+        name = _first(props, SH.name)
+        prop_name = str(name) if name is not None else ""
+
+        value = _first(props, SH.datatype)
+        datatype = str(value) if value is not None else None
 
         # Create data element from property shape
         data_element = SHACLNode('data_element', title=prop_name or "Unknown")
@@ -383,41 +473,35 @@ def process_csv_ttl_import(editor, ttl: str, source_filename: str, dataset_name:
             data_element.datatype = datatype
         
         # Extract min/max constraints
-        min_counts = list(g.objects(shape, SH.minCount))
-        if min_counts:
-            data_element.min_count = int(min_counts[0])
+        value = _first(props, SH.minCount)
+        if value is not None:
+            data_element.min_count = int(value)
             
-        max_counts = list(g.objects(shape, SH.maxCount))
-        if max_counts:
-            data_element.max_count = int(max_counts[0])
+        value = _first(props, SH.maxCount)
+        if value is not None:
+            data_element.max_count = int(value)
         
         # Extract length constraints
-        min_lengths = list(g.objects(shape, SH.minLength))
-        if min_lengths:
-            data_element.min_length = int(min_lengths[0])
+        value = _first(props, SH.minLength)
+        if value is not None:
+            data_element.min_length = int(value)
             
-        max_lengths = list(g.objects(shape, SH.maxLength))
-        if max_lengths:
-            data_element.max_length = int(max_lengths[0])
+        value = _first(props, SH.maxLength)
+        if value is not None:
+            data_element.max_length = int(value)
         
         # Extract pattern
-        patterns = list(g.objects(shape, SH.pattern))
-        if patterns:
-            data_element.pattern = str(patterns[0])
+        value = _first(props, SH.pattern)
+        if value is not None:
+            data_element.pattern = str(value)
         
         # Extract enumeration values
-        in_lists = list(g.objects(shape, SH['in']))
-        if in_lists:
-            current = in_lists[0]
-            while current and current != RDF.nil:
-                value_literals = list(g.objects(current, RDF.first))
-                if value_literals:
-                    data_element.in_values.append(str(value_literals[0]))
-                next_nodes = list(g.objects(current, RDF.rest))
-                if next_nodes:
-                    current = next_nodes[0]
-                else:
-                    break
+        current = _first(props, SH['in'])
+        while current and current != RDF.nil:
+            value = g.value(current, RDF.first)
+            if value is not None:
+                data_element.in_values.append(str(value))
+            current = g.value(current, RDF.rest)
 
         editor.nodes[data_element.id] = data_element
         dataset_node.connections.add(data_element.id)
@@ -96,11 +96,7 @@ def _process_xsd_structure(editor, ttl: str, dataset_name: str, filename: str) -
     editor.reset_structure()
     
     # Get or create dataset node
-    dataset_node = None
-    for node in editor.nodes.values():
-        if node.type == 'dataset':
-            dataset_node = node
-            break
+    dataset_node = editor.get_dataset_node()
     
     if not dataset_node:
         dataset_node = SHACLNode('dataset', title=dataset_name, description=f"Dataset imported from {filename}")
@@ -1374,6 +1374,14 @@ function exportTTL() {
     });
 }
 
+// Large imports run in the background; poll until the job has finished
+function waitForImportJob(jobId) {
+    return new Promise(resolve => setTimeout(resolve, 500))
+        .then(() => fetch(`/api/import/status/${jobId}`))
+        .then(response => response.json())
+        .then(data => data.status === 'running' ? waitForImportJob(jobId) : data);
+}
+
 function importTTL(fileInput) {
     if (!fileInput.files || fileInput.files.length === 0) {
         console.log('No file selected');
@@ -1397,6 +1405,7 @@ function importTTL(fileInput) {
         body: formData
     })
     .then(response => response.json())
+    .then(data => data.job_id ? waitForImportJob(data.job_id) : data)
     .then(data => {
         document.body.classList.remove('loading');
         const status = document.getElementById('selection-status');
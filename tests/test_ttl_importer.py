@@ -0,0 +1,47 @@
+"""Tests for Turtle parsing in imports.ttl_importer"""
+
+import io
+
+import pytest
+from rdflib import RDF, URIRef
+
+from imports.ttl_importer import load_turtle_graph
+
+
+RELATIVE_IRI_TTL = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+<#Shape> a sh:NodeShape ;
+    sh:property <#prop> ;
+    sh:targetClass <#Class> .
+"""
+
+IRI_WITH_SPACE_TTL = """@prefix sh: <http://www.w3.org/ns/shacl#> .
+<http://example.org/my shape> a sh:NodeShape .
+"""
+
+
+def _load(ttl, source, tmp_path):
+    if source == 'str':
+        return load_turtle_graph(data=ttl)
+    if source == 'stream':
+        return load_turtle_graph(data=io.BytesIO(ttl.encode('utf-8')))
+    path = tmp_path / 'shapes.ttl'
+    path.write_text(ttl, encoding='utf-8')
+    return load_turtle_graph(path=str(path))
+
+
+@pytest.mark.parametrize('source', ['str', 'stream', 'path'])
+def test_relative_iris_are_resolved(source, tmp_path):
+    g = _load(RELATIVE_IRI_TTL, source, tmp_path)
+    
+    assert len(g) == 3
+    shape = next(g.subjects(RDF.type, URIRef('http://www.w3.org/ns/shacl#NodeShape')))
+    assert str(shape).endswith('#Shape')
+    assert str(shape).startswith('file://')
+
+
+@pytest.mark.parametrize('source', ['str', 'stream', 'path'])
+def test_iri_with_space_is_accepted(source, tmp_path):
+    g = _load(IRI_WITH_SPACE_TTL, source, tmp_path)
+    
+    assert len(g) == 1
+    assert (URIRef('http://example.org/my shape'), RDF.type, URIRef('http://www.w3.org/ns/shacl#NodeShape')) in g
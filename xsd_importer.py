@@ -4,6 +4,7 @@ Adapted from the XSD2SHACL project, originally developed by Xuemin Duan, David C
 Source: https://github.com/dtai-kg/XSD2SHACL
 """
 
+import logging
 from lxml import etree
 from rdflib import Graph, Namespace, Literal, URIRef, BNode
 from rdflib.namespace import RDF, RDFS, XSD, OWL
@@ -11,6 +12,8 @@ import io
 import os
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 # Define namespaces
 SH = Namespace("http://www.w3.org/ns/shacl#")
 DCT = Namespace("http://purl.org/dc/terms/")
@@ -50,7 +53,7 @@ def parse_xsd_content(xsd_content):
         # Propagate security errors so callers can surface a clear 4xx response.
         raise
     except Exception as e:
-        print(f"Error parsing XSD content: {e}")
+        logger.warning("Error parsing XSD content: %s", e)
         return None
 
 def handle_enumeration(enumerations, subject, graph):
@@ -555,7 +558,5 @@ def xsd_to_ttl(xsd_content: str, dataset_identifier: str = "dataset_identifier")
         # Propagate security errors so callers can surface a clear 4xx response.
         raise
     except Exception as e:
-        print(f"Error converting XSD to TTL: {e}")
-        import traceback
-        print(traceback.format_exc())
+        logger.exception("Error converting XSD to TTL: %s", e)
         return None